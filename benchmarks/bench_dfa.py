@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Matching engine benchmark.
+
+Compares ``search`` with `re` and with ``engine='dfa'`` on a query which
+backtracks exponentially on strings it does not match, as they grow, and
+on an ordinary query over a log-like text::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_dfa.py
+"""
+
+import timeit
+
+from srl import SRL
+
+NESTED = 'capture (letter once or more) once or more, must end'
+LOG = 'capture (digit exactly 3 times) as "status", whitespace, digit once or more, literally "ms"'
+TEXT = 'GET /index 200 12ms\n' * 20000
+
+def measure(call, number=1):
+    return min(timeit.repeat(call, number=number, repeat=3)) / number
+
+def main():
+    print('%-16s %10s %10s' % ('input', 're', 'dfa'))
+    backtracking = SRL(NESTED)
+    linear = SRL(NESTED, engine='dfa')
+    for size in (16, 20, 24, 100000):
+        string = 'a' * size + '!'
+        dfa = measure(lambda: linear.search(string))
+        if size > 24:
+            print('%-16s %10s %8.1fms' % ('%d letters' % size, '-', dfa * 1e3))
+            continue
+        before = measure(lambda: backtracking.search(string))
+        print('%-16s %8.1fms %8.1fms' % ('%d letters' % size, before * 1e3, dfa * 1e3))
+
+    backtracking = SRL(LOG)
+    linear = SRL(LOG, engine='dfa')
+    assert backtracking.findall(TEXT) == linear.findall(TEXT)
+    before = measure(lambda: backtracking.findall(TEXT))
+    after = measure(lambda: linear.findall(TEXT))
+    print('%-16s %8.1fms %8.1fms' % ('log, %dKB' % (len(TEXT) // 1000),
+                                     before * 1e3, after * 1e3))
+
+if __name__ == '__main__':
+    main()
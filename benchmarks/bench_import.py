@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Cold import benchmark.
+
+Measures, in fresh interpreters, the time to import `srl` alone and to
+import it and compile a first query::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_import.py
+"""
+
+import subprocess
+import sys
+import timeit
+
+CASES = (
+    ('import srl', 'import srl'),
+    ('import srl + Builder', 'import srl.builder; srl.builder.Builder().digit().get()'),
+    ('import srl + first SRL()', 'import srl; srl.SRL("digit exactly 3 times")'),
+)
+
+def measure(code, repeat=20):
+    command = [sys.executable, '-c', code]
+    subprocess.check_call([sys.executable, '-c', 'pass'])
+    timings = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        subprocess.check_call(command)
+        timings.append(timeit.default_timer() - start)
+    baseline = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        subprocess.check_call([sys.executable, '-c', 'pass'])
+        baseline.append(timeit.default_timer() - start)
+    return min(timings) - min(baseline)
+
+def main():
+    for name, code in CASES:
+        print('%-28s %8.2f ms' % (name, measure(code) * 1000))
+
+if __name__ == '__main__':
+    main()
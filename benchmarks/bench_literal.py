@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Literal fast path benchmark.
+
+Compares the string-method fast path of pure literal queries with the
+compiled `re` pattern on long log lines::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_literal.py
+"""
+
+import timeit
+
+from srl import SRL
+
+LINE = 'INFO 2016-09-08 12:00:00 request served in 12ms from cache ' * 40
+TEXT = '\n'.join([LINE] * 50 + [LINE + 'ERROR'])
+
+QUERIES = (
+    'literally "ERROR"',
+    'literally "error" case insensitive',
+    'begin with literally "INFO"',
+    'literally "ERROR", must end',
+)
+
+CALLS = (
+    ('search', lambda p: p.search(TEXT)),
+    ('findall', lambda p: p.findall(TEXT)),
+    ('sub', lambda p: p.sub('-', TEXT)),
+    ('split', lambda p: p.split(TEXT)),
+)
+
+def measure(call, pattern, number=20):
+    return min(timeit.repeat(lambda: call(pattern), number=number, repeat=5)) / number
+
+def main():
+    print('%-8s %10s %10s %8s  %s' % ('', 're', 'literal', 'speedup', 'query'))
+    for query in QUERIES:
+        srl = SRL(query)
+        for name, call in CALLS:
+            regex = measure(call, srl.compiled)
+            literal = measure(call, srl)
+            print('%-8s %8.1fus %8.1fus %7.1fx  %s' % (
+                name, regex * 1e6, literal * 1e6, regex / literal, query))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Optimizer benchmark.
+
+Compares the regular expression of each query with its optimized form,
+and the time `re` takes to search long lines with either::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_optimizer.py
+"""
+
+import timeit
+
+from srl import SRL
+
+LINE = 'INFO 2016-09-08 12:00:00 request served in 12ms from cache ' * 40
+TEXT = '\n'.join([LINE] * 50)
+
+QUERIES = (
+    'digit, digit, digit, digit, literally "-", digit, digit, literally "-", digit, digit',
+    'any of (digit, letter, literally "_", literally "-") once or more, literally "@"',
+    'literally "re", literally "quest", whitespace, literally "served"',
+    'capture (letter once or more) as "word", literally "=", digit exactly 3 times',
+)
+
+def measure(pattern, number=20):
+    return min(timeit.repeat(lambda: pattern.findall(TEXT), number=number, repeat=5)) / number
+
+def main():
+    print('%10s %10s %8s  %s' % ('plain', 'optimized', 'speedup', 'regex'))
+    for query in QUERIES:
+        plain = SRL(query).compiled
+        optimized = SRL(query, optimize=True).compiled
+        before = measure(plain)
+        after = measure(optimized)
+        print('%8.1fus %8.1fus %7.1fx  %s' % (before * 1e6, after * 1e6, before / after, plain.pattern))
+        print('%37s  %s' % ('', optimized.pattern))
+
+if __name__ == '__main__':
+    main()
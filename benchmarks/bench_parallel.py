@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel matching benchmark.
+
+Times `map_findall` over many records with 1, 2, 4, ... worker processes,
+up to the number of cores::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_parallel.py
+"""
+
+import multiprocessing
+import time
+
+from srl import SRL
+
+QUERY = ('capture (letter once or more) as "key", literally "=", '
+         'capture (any of (digit, letter, literally ".") once or more) as "value"')
+RECORDS = ['user=alice%d ip=10.0.%d.%d took=%dms path=/a/b/c.html status=200 ' % (
+    index, index % 256, index % 7, index % 1000) * 4 for index in range(200000)]
+
+def measure(srl, workers):
+    start = time.time()
+    for _ in srl.map_findall(RECORDS, workers=workers, chunksize=2000):
+        pass
+    return time.time() - start
+
+def main():
+    srl = SRL(QUERY)
+    cores = multiprocessing.cpu_count()
+    workers = 1
+    base = None
+    print('%-8s %10s %8s' % ('workers', 'time', 'speedup'))
+    while workers <= cores:
+        elapsed = measure(srl, workers)
+        base = base or elapsed
+        print('%-8d %9.2fs %7.1fx' % (workers, elapsed, base / elapsed))
+        workers *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Parser backend benchmark.
+
+Compares the PLY LALR parser with the recursive-descent parser on
+representative queries::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_parser.py
+"""
+
+import timeit
+
+from srl.parsers.parse import parse
+
+QUERIES = (
+    'literally "ERROR"',
+    'digit once or more, literally "ms"',
+    'begin with capture (letter once or more) as "word", whitespace, digit exactly 3 times, must end',
+    'starts with any of (digit, letter, one of "._%+-") once or more, literally "@", '
+    'any of (digit, letter, one of ".-") once or more, literally ".", '
+    'letter at least 2 times, must end, case insensitive',
+)
+
+def measure(query, backend, number=2000):
+    parse(query, backend)
+    return min(timeit.repeat(lambda: parse(query, backend), number=number, repeat=5)) / number
+
+def main():
+    print('%-8s %10s %10s %8s  %s' % ('', 'ply', 'descent', 'speedup', 'query'))
+    for query in QUERIES:
+        ply = measure(query, 'ply')
+        descent = measure(query, 'descent')
+        print('%-8s %8.1fus %8.1fus %7.1fx  %.50s' % (
+            '', ply * 1e6, descent * 1e6, ply / descent, query))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Required-literal prefilter benchmark.
+
+Compares `search` and `findall` of queries with required literals on
+log lines which do and do not contain them::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_prefilter.py
+"""
+
+import timeit
+
+from srl import SRL
+
+LINE = 'INFO 2016-09-08 12:00:00 request served from cache ' * 40
+HIT = LINE + 'served in 12ms'
+
+QUERIES = (
+    'digit once or more, literally "ms"',
+    'begin with anything once or more, literally "served in ", digit once or more',
+)
+
+def measure(call, number=200):
+    return min(timeit.repeat(call, number=number, repeat=5)) / number
+
+def main():
+    print('%-14s %10s %10s %8s  %s' % ('', 're', 'srl', 'speedup', 'query'))
+    for query in QUERIES:
+        srl = SRL(query)
+        for name, line in (('search miss', LINE), ('search hit', HIT)):
+            regex = measure(lambda: srl.compiled.search(line))
+            fast = measure(lambda: srl.search(line))
+            print('%-14s %8.1fus %8.1fus %7.1fx  %s' % (
+                name, regex * 1e6, fast * 1e6, regex / fast, query))
+        regex = measure(lambda: srl.compiled.findall(LINE))
+        fast = measure(lambda: srl.findall(LINE))
+        print('%-14s %8.1fus %8.1fus %7.1fx  %s' % (
+            'findall miss', regex * 1e6, fast * 1e6, regex / fast, query))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+SRLSet benchmark.
+
+Compares searching a log line with a loop over `SRL` objects and with an
+`SRLSet` of the same queries::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_srlset.py
+"""
+
+import random
+import timeit
+
+from srl import SRL, SRLSet
+
+WORDS = ['user', 'login', 'failed', 'error', 'timeout', 'disk', 'cpu', 'memory',
+         'GET', 'POST', 'served', 'cache', 'retry', 'auth', 'token', 'session',
+         'kernel', 'panic', 'upstream', 'refused']
+
+LINE = ('2016-09-08 12:00:00 INFO user alice login ok, served in 12ms from '
+        'cache, disk 40% cpu3 memory ok, token expired after retry5')
+
+def rules(count):
+    rand = random.Random(0)
+    for i in range(count):
+        first, second = rand.sample(WORDS, 2)
+        yield i, ('literally "%s", whitespace once or more, any character once or more, '
+                  'literally "%s%d"' % (first, second, i % 10))
+
+def measure(call, number=200):
+    return min(timeit.repeat(call, number=number, repeat=5)) / number
+
+def main():
+    print('%-8s %10s %10s %8s' % ('rules', 'loop', 'SRLSet', 'speedup'))
+    for count in (10, 100, 1000):
+        srls = [SRL(query) for _, query in rules(count)]
+        rule_set = SRLSet(rules(count))
+        assert rule_set.search(LINE) == [i for i, srl in enumerate(srls) if srl.search(LINE)]
+        loop = measure(lambda: [srl for srl in srls if srl.search(LINE)])
+        combined = measure(lambda: rule_set.search(LINE))
+        print('%-8d %8.1fus %8.1fus %7.1fx' % (count, loop * 1e6, combined * 1e6, loop / combined))
+
+if __name__ == '__main__':
+    main()
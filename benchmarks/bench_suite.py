@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite.
+
+Times each phase of turning a query into matches, separately, for the
+queries of ``specification.md``:
+
+- ``import``: importing `srl` in a fresh interpreter,
+- ``lex``: tokenizing with the PLY lexer,
+- ``parse``: LALR parsing, lexing included, and ``yacc``: the same without
+  the time of ``lex``,
+- ``build``: running the `Builder` methods and rendering the regex,
+- ``compile``: `re.compile` of the regex, bypassing the `re` cache,
+- ``match``: `findall` of the compiled `re` pattern over a text, in MB/s,
+- ``fast_path``: `SRL.findall` over the same text, for the queries whose
+  literal fast path or prefilter bypasses `re`, in MB/s.
+
+Prints a table, and writes the results as JSON to compare releases::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_suite.py --json results.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import timeit
+
+import srl
+from srl import SRL
+from srl.builder import Builder
+from srl.parsers import parse as parse_module
+
+from bench_import import measure as measure_import
+
+SPECIFICATION = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             os.pardir, 'specification.md')
+
+def queries():
+    with io.open(SPECIFICATION, encoding='utf-8') as fileobj:
+        found = re.findall(r"SRL\('(.*)'\)", fileobj.read())
+    return [query for query in sorted(set(found), key=found.index)]
+
+def text(size=1 << 20):
+    rand = random.Random(0)
+    words = ['sample', 'match', 'foo', 'bar', 'an', 'example', 'ABCD', 'abcf',
+             '12345', '67', '-', ' - ', '\t', '\n', 'first - second part']
+    pieces = []
+    length = 0
+    while length < size:
+        word = rand.choice(words) + rand.choice(' \n')
+        pieces.append(word)
+        length += len(word)
+    return ''.join(pieces)
+
+def measure(function, repeat=5, min_time=0.02):
+    """Return the best time of one call of `function`, in seconds."""
+    number = 1
+    while True:
+        elapsed = timeit.timeit(function, number=number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+    return min([elapsed] + timeit.repeat(function, number=number, repeat=repeat - 1)) / number
+
+def lex(lexer, query):
+    lexer.input(query)
+    tokens = 0
+    while lexer.token():
+        tokens += 1
+    return tokens
+
+def compile_uncached(regex, flags):
+    re.purge()
+    return re.compile(regex, flags)
+
+def run(query, sample):
+    lexer, parser = parse_module.thread_parsers()
+    parsed = parser.parse(query, lexer=lexer, tracking=False)
+    builder = Builder.build(parsed)
+    regex = builder.get()
+    compiled = SRL(query)
+    result = {
+        'query': query,
+        'tokens': lex(lexer, query),
+        'regex_length': len(regex),
+        'lex': measure(lambda: lex(lexer, query)),
+        'parse': measure(lambda: parser.parse(query, lexer=lexer, tracking=False)),
+        'build': measure(lambda: Builder.build(parsed).get()),
+        'compile': measure(lambda: compile_uncached(regex, builder.flags)),
+        'match': len(sample) / measure(lambda: compiled.compiled.findall(sample), repeat=3) / 1e6,
+        'fast_path': None,
+    }
+    if compiled.findall != compiled.compiled.findall:
+        result['fast_path'] = len(sample) / measure(lambda: compiled.findall(sample), repeat=3) / 1e6
+    result['yacc'] = max(result['parse'] - result['lex'], 0)
+    return result
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arguments.add_argument('--json', metavar='FILE', help='write the results to FILE, - for stdout')
+    arguments.add_argument('--no-import', action='store_true', help='skip the import time')
+    args = arguments.parse_args()
+
+    sample = text()
+    report = {
+        'srl': srl.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'import': None if args.no_import else measure_import('import srl'),
+        'queries': [run(query, sample) for query in queries()],
+    }
+
+    out = sys.stderr if args.json == '-' else sys.stdout
+    if report['import'] is not None:
+        out.write('import srl: %.2f ms\n' % (report['import'] * 1e3))
+    out.write('%8s %8s %8s %8s %8s %11s %11s  %s\n' % (
+        'lex', 'parse', 'yacc', 'build', 'compile', 'match', 'fast path', 'query'))
+    for result in report['queries']:
+        fast_path = '-' if result['fast_path'] is None else '%7.0fMB/s' % result['fast_path']
+        out.write('%6.1fus %6.1fus %6.1fus %6.1fus %6.1fus %7.0fMB/s %11s  %.40s\n' % (
+            result['lex'] * 1e6, result['parse'] * 1e6, result['yacc'] * 1e6,
+            result['build'] * 1e6, result['compile'] * 1e6, result['match'],
+            fast_path, result['query']))
+
+    if args.json:
+        data = json.dumps(report, indent=2, sort_keys=True)
+        if args.json == '-':
+            sys.stdout.write(data + '\n')
+        else:
+            with open(args.json, 'w') as fileobj:
+                fileobj.write(data + '\n')
+
+if __name__ == '__main__':
+    main()
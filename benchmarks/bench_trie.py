@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Alternation benchmark.
+
+Compares ``any of`` over many literals with its prefix trie factored by
+the optimizer, at 10, 100 and 10,000 keywords::
+
+    $ python setup.py develop
+    $ python benchmarks/bench_trie.py
+"""
+
+import random
+import string
+import timeit
+
+from srl import SRL
+
+rand = random.Random(0)
+WORDS = sorted(set(''.join(rand.choice(string.ascii_lowercase[:8])
+                           for _ in range(rand.randint(3, 9)))
+                   for _ in range(12000)))
+rand.shuffle(WORDS)
+TEXT = ' '.join(rand.choice(string.ascii_lowercase) * 4 + rand.choice(WORDS)
+                for _ in range(5000))
+
+def query(words):
+    return 'any of (%s)' % ', '.join('literally "%s"' % word for word in words)
+
+def measure(pattern, number=3):
+    return min(timeit.repeat(lambda: pattern.findall(TEXT), number=number, repeat=3)) / number
+
+def main():
+    print('%-9s %10s %10s %8s' % ('keywords', 'plain', 'trie', 'speedup'))
+    for count in (10, 100, 10000):
+        srl = query(WORDS[:count])
+        plain = SRL(srl)
+        trie = SRL(srl, optimize=True)
+        assert plain.findall(TEXT) == trie.findall(TEXT)
+        before = measure(plain)
+        after = measure(trie)
+        print('%-9d %8.1fms %8.1fms %7.1fx' % (count, before * 1e3, after * 1e3, before / after))
+
+if __name__ == '__main__':
+    main()
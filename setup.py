@@ -1,7 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Command
+from setuptools.command.build_py import build_py
+
+
+class build_tables(Command):
+    """Regenerate the lexer and parser tables shipped in srl/parsers."""
+
+    description = 'regenerate srl/parsers/lextab.py and parsetab.py'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        from srl.parsers.parse import write_tables
+        write_tables()
+
+
+class build_py_with_tables(build_py):
+
+    def run(self):
+        self.run_command('build_tables')
+        build_py.run(self)
+
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -45,6 +71,10 @@ setup(
         'Programming Language :: Python :: Implementation :: PyPy',
         'Topic :: Text Processing',
     ],
+    cmdclass={
+        'build_tables': build_tables,
+        'build_py': build_py_with_tables,
+    },
     test_suite='tests',
     tests_require=test_requirements,
 )
@@ -1,3 +1,9 @@
 # -*- coding: utf-8 -*-
 
+__version__ = '0.1.0'
+
 from .srl import SRL
+from .srlset import SRLSet
+from .hooks import instrument
+from .cache import (purge, set_cache_size, cache_info, set_disk_cache,
+                    save_disk_cache)
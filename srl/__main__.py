@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+srl.__main__
+~~~~~~~~~~~~
+
+This module implements the command line interface::
+
+    $ python -m srl grep 'literally "ERROR"' app.log
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import argparse
+import re
+import sys
+
+from .parallel import DEFAULT_RANGE_SIZE, grep
+from .srl import SRL
+
+
+def _grep(args):
+    srl = SRL(args.query, re.IGNORECASE if args.ignore_case else 0,
+              binary=True, encoding=args.encoding)
+    out = getattr(sys.stdout, 'buffer', sys.stdout)
+    found = False
+    for path in args.files:
+        for offset, line in grep(srl, path, args.workers, args.range_size):
+            found = True
+            if len(args.files) > 1:
+                out.write(path.encode(args.encoding) + b':')
+            if args.byte_offset:
+                out.write(str(offset).encode('ascii') + b':')
+            out.write(line + b'\n')
+    out.flush()
+    return 0 if found else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m srl')
+    commands = parser.add_subparsers(dest='command')
+    command = commands.add_parser(
+        'grep', help='print the lines of files matching a query, '
+                     'searched by several processes')
+    command.add_argument('query', help='the Simple Regex Language query')
+    command.add_argument('files', nargs='+', metavar='file')
+    command.add_argument('-j', '--workers', type=int,
+                         help='the number of processes, defaults to the number of cores')
+    command.add_argument('-i', '--ignore-case', action='store_true')
+    command.add_argument('-b', '--byte-offset', action='store_true',
+                         help='print the offset of each line in its file')
+    command.add_argument('--encoding', default='utf-8',
+                         help='the encoding of the files, for non-ASCII literals')
+    command.add_argument('--range-size', type=int, default=DEFAULT_RANGE_SIZE,
+                         help='how many bytes a process searches at a time')
+    command.set_defaults(run=_grep)
+    args = parser.parse_args(argv)
+    if not getattr(args, 'run', None):
+        parser.error('a command is required')
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
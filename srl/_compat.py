@@ -13,3 +13,8 @@ else:
     text_type = str
     string_types = (str,)
     integer_types = (int,)
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
@@ -10,117 +10,147 @@ This module implements the builder of Simple Regex Language.
 """
 
 import re
-import copy
+from functools import partial
 
 from ._compat import string_types
-from .parsers.parse import parse
+from .cache import compile_cache, disk_cache, normalize
+from . import optimizer
+from .nodes import (Literal, CharClass, Raw, Anchor, Repeat, Sequence,
+                    Group, Lookaround, Alternation, encode)
+from .hooks import Stages, hooks
+from .parsers.parse import lex, parse
 
 class LazyError(Exception): pass
 
-class Builder(object):
+# The nodes of the format strings `group` took before it took callables.
+_FORMATS = {
+    '%s': Sequence,
+    '(%s)': Group,
+    '(?:%s)': partial(Group, capture=False),
+    '(?=%s)': Lookaround,
+    '(?!%s)': partial(Lookaround, negative=True),
+    '(?<=%s)': partial(Lookaround, ahead=False),
+    '(?<!%s)': partial(Lookaround, ahead=False, negative=True),
+}
+
+def _formatted(template):
+    # Return a `group` callable rendering the nodes into `template`.
+    group = _FORMATS.get(template)
+    if group is None:
+        group = lambda children: Raw(template % Sequence(children).render())
+    return group
 
-    def __init__(self, regex=None, flags=0, group='%s'):
-        self.regex = regex or []
+class Builder(object):
+    """Builds the node tree of a regular expression, see :mod:`srl.nodes`.
+
+    :param regex: the initial nodes; strings are taken as raw expressions
+    :param flags: `re` flags
+    :param group: a callable turning the list of nodes into the node
+                  returned by `node`, defaults to :class:`~srl.nodes.Sequence`,
+                  or a format string such as ``'(?:%s)'``
+    """
+
+    def __init__(self, regex=None, flags=0, group=None):
+        self.regex = [Raw(node) if isinstance(node, string_types) else node
+                      for node in regex or []]
         self.flags = flags or 0
         self.compiled = None
-        self.group = group or '%s'
+        if isinstance(group, string_types):
+            group = _formatted(group)
+        self.group = group or Sequence
         self.greedy_mode = True
 
     def escape(self, string):
         return re.escape(string)
 
+    def add(self, node):
+        self.regex.append(node)
+        return self
+
     def literally(self, char):
         char = char.replace(r'\"', '"')
-        char = self.escape(char)
-        self.regex.append(r'(?:%s)' % char)
-        return self
+        return self.add(Literal(char))
 
     def digit(self, start='0', end='9'):
-        self.regex.append(r'[%s-%s]' % (start, end))
-        return self
+        return self.add(CharClass(r'%s-%s' % (start, end)))
 
     number = digit
 
     def letter(self, start='a', end='z'):
-        self.regex.append(r'[%s-%s]' % (start, end))
-        return self
+        return self.add(CharClass(r'%s-%s' % (start, end)))
 
     def no_character(self):
-        self.regex.append(r'\W')
-        return self
+        return self.add(CharClass(r'\W', False))
 
     def uppercase_letter(self, start='A', end='Z'):
-        self.regex.append(r'[%s-%s]' % (start, end, ))
-        return self
+        return self.add(CharClass(r'%s-%s' % (start, end, )))
 
     def any_character(self):
-        self.regex.append(r'\w')
-        return self
+        return self.add(CharClass(r'\w', False))
 
     def anything(self):
-        self.regex.append(r'.')
-        return self
+        return self.add(CharClass(r'.', False))
 
     def new_line(self):
-        self.regex.append(r'\n')
-        return self
+        return self.add(CharClass(r'\n', False))
 
     def whitespace(self):
-        self.regex.append(r'\s')
-        return self
+        return self.add(CharClass(r'\s', False))
 
     def no_whitespace(self):
-        self.regex.append(r'\S')
-        return self
+        return self.add(CharClass(r'\S', False))
 
     def tab(self):
-        self.regex.append(r'\t')
-        return self
+        return self.add(CharClass(r'\t', False))
 
     def raw(self, string):
-        self.regex.append(string)
-        return self
+        return self.add(Raw(string))
+
+    def repeat(self, min, max=None, greedy=None, counted=False):
+        """Repeat the last node `min` to `max` times, lazily if `greedy`
+        is false, see :class:`~srl.nodes.Repeat` for `counted`. `greedy`
+        defaults to false after ``all lazy``."""
+        if greedy is None:
+            greedy = self.greedy_mode
+        last = self.revert_last() if self.regex else Sequence()
+        if type(last) is Sequence and last.children:
+            # The quantifier follows the last node of an inline sequence.
+            builder = Builder(list(last.children))
+            return self.add(Sequence(builder.repeat(min, max, greedy, counted).regex))
+        if (min, max) == (0, 1) and isinstance(last, Repeat) and last.greedy:
+            # A question mark after a quantifier makes it lazy.
+            return self.add(last.lazy())
+        return self.add(Repeat(last, min, max, greedy, counted))
 
     def between(self, start, end):
-        self.regex.append(r'{%d,%d}' % (start, end))
-        return self
+        return self.repeat(start, end, True, counted=True)
 
     def once_or_more(self):
-        if self.greedy_mode:
-            self.regex.append(r'+')
-        else:
-            self.regex.append(r'+?')
-        return self
+        return self.repeat(1)
 
     def never_or_more(self):
-        if self.greedy_mode:
-            self.regex.append(r'*')
-        else:
-            self.regex.append(r'*?')
-        return self
+        return self.repeat(0)
 
     def optional(self, char=''):
-        if self.greedy_mode:
-            self.regex.append(r'%s?' % char)
-        else:
-            self.regex.append(r'%s??' % char)
-        return self
+        if char:
+            self.raw(char)
+        return self.repeat(0, 1)
 
     def first_match(self):
-        if self.get()[-1] not in '+*}?':
-            if self.regex[-1][-1] == ')' and self.get()[-2] in '+*}?':
-                self.regex.append(self.revert_last()[0:-1] + '?)')
-                return self
+        # Within a group, the closing parenthesis comes after the
+        # quantifier, which is left as it is.
+        last = None
+        if self.regex and self.group is Sequence:
+            last = self.regex[-1].lazy()
+        if last is None:
             raise LazyError('Cannot apply laziness at this point. Only applicable after quantifiers.')
-        else:
-            self.regex.append(r'?')
-            return self
+        self.regex[-1] = last
+        return self
 
     lazy = first_match
 
     def exactly(self, count):
-        self.regex.append(r'{%d}' % count)
-        return self
+        return self.repeat(count, count, True)
 
     def once(self):
         return self.exactly(1)
@@ -129,8 +159,7 @@ class Builder(object):
         return self.exactly(2)
 
     def at_least(self, number):
-        self.regex.append(r'{%d,}' % number)
-        return self
+        return self.repeat(number, None, True, counted=True)
 
     def add_closure(self, builder, conditions, exploder=''):
         builder.greedy_mode = self.greedy_mode
@@ -145,29 +174,22 @@ class Builder(object):
                 return q
             subquery = callable_conditions(builder)
         else:
-            subquery = builder.raw(conditions.get())
+            subquery = builder.add(conditions.node())
 
-        self.regex.append(subquery.get(exploder))
-        return self
+        return self.add(subquery.node(exploder))
 
     def capture(self, conditions, name=None):
-        builder = Builder()
-        if name:
-            builder.group = '(?P<%s>%%s)' % name
-        else:
-            builder.group = '(%s)'
+        builder = Builder(group=partial(Group, name=name or None))
         return self.add_closure(builder, conditions)
 
     def any_of(self, conditions):
-        builder = Builder()
-        builder.group = '(?:%s)'
-        return self.add_closure(builder, conditions, r'|')
+        builder = Builder(group=Alternation)
+        return self.add_closure(builder, conditions)
 
     either_of = any_of
 
     def non_capture(self, conditions):
-        builder = Builder()
-        builder.group = '(?:%s)'
+        builder = Builder(group=partial(Group, capture=False))
         return self.add_closure(builder, conditions)
 
     def until(self, conditions):
@@ -180,44 +202,44 @@ class Builder(object):
 
     def one_of(self, char):
         char = self.escape(char)
-        self.regex.append(r'[%s]' % char)
-        return self
+        return self.add(CharClass(char))
 
     def if_followed_by(self, conditions):
-        builder = Builder()
-        builder.group = r'(?=%s)'
+        builder = Builder(group=Lookaround)
         return self.add_closure(builder, conditions)
 
     def if_not_followed_by(self, conditions):
-        builder = Builder()
-        builder.group = r'(?!%s)'
+        builder = Builder(group=partial(Lookaround, negative=True))
         return self.add_closure(builder, conditions)
 
     def if_already_had(self, conditions):
-        builder = Builder()
-        builder.group = r'(?<=%s)'
-        previous_cond = self.revert_last()
-        self.add_closure(builder, conditions)
-        self.regex.append(previous_cond)
-        return self
+        builder = Builder(group=partial(Lookaround, ahead=False))
+        return self._behind(builder, conditions)
 
     def if_not_already_had(self, conditions):
-        builder = Builder()
-        builder.group = r'(?<!%s)'
+        builder = Builder(group=partial(Lookaround, ahead=False, negative=True))
+        return self._behind(builder, conditions)
+
+    def _behind(self, builder, conditions):
+        # The lookbehind goes before the last node, or between the item
+        # and the quantifier of a repeat, which then repeats the lookbehind.
         previous_cond = self.revert_last()
+        if isinstance(previous_cond, Repeat):
+            self.add(previous_cond.node)
+            self.add_closure(builder, conditions)
+            last = self.revert_last()
+            return self.add(Repeat(last, previous_cond.min, previous_cond.max,
+                                   previous_cond.greedy, previous_cond.counted))
         self.add_closure(builder, conditions)
-        self.regex.append(previous_cond)
-        return self
+        return self.add(previous_cond)
 
     def begin_with(self):
-        self.regex.append(r'^') # FIXME: assert
-        return self
+        return self.add(Anchor(r'^')) # FIXME: assert
 
     starts_with = begin_with
 
     def must_end(self):
-        self.regex.append(r'$')
-        return self
+        return self.add(Anchor(r'$'))
 
     def case_insensitive(self):
         self.flags = self.flags | re.IGNORECASE
@@ -237,11 +259,33 @@ class Builder(object):
         builder = Builder(group=self.group)
         return self.add_closure(builder, conditions)
 
-    def get(self, implode=r''):
-        return self.group % implode.join(self.regex)
-
-    def compile(self):
-        self.compiled = re.compile(self.get(), self.flags)
+    def node(self, implode=r''):
+        """Return the node tree built so far, with the raw expression
+        `implode` between the nodes."""
+        if not implode:
+            return self.group(self.regex)
+        children = []
+        for child in self.regex:
+            if children:
+                children.append(Raw(implode))
+            children.append(child)
+        return self.group(children)
+
+    def get(self, implode=r'', optimize=False, binary=False, encoding='utf-8'):
+        """Return the regular expression, with `implode` between the
+        nodes, shortened by :func:`srl.optimizer.optimize` if `optimize` is
+        true, and as bytes matching text encoded with `encoding` if `binary`
+        is true, see :func:`srl.nodes.encode`."""
+        node = self.node(implode)
+        if optimize:
+            node = optimizer.optimize(node)
+        if binary:
+            return encode(node, encoding).render().encode('latin-1')
+        return node.render()
+
+    def compile(self, optimize=False, binary=False, encoding='utf-8'):
+        regex = self.get(optimize=optimize, binary=binary, encoding=encoding)
+        self.compiled = re.compile(regex, self.flags)
         return self
 
     def is_valid(self):
@@ -293,17 +337,69 @@ class Builder(object):
     filter = subn
 
     @classmethod
-    def parse(cls, string):
-        builder = cls()
-        parsed = parse(string)
-        if not parsed:
-            raise Exception('Invalid Simple Regex')
+    def parse(cls, string, flags=0, backend=None, optimize=False):
+        return cls.compile_query(string, flags, backend, optimize)[0]
 
+    @classmethod
+    def build(cls, parsed, flags=0):
+        """Return a builder holding the node tree of the parsed
+        ``(method, args)`` list of a query."""
+        builder = cls(flags=flags)
         for method, arg in parsed:
             if method == 'all_lazy':
                 builder.greedy_mode = False
 
         for method, arg in parsed:
             builder = getattr(builder, method)(*arg)
+        return builder
 
-        return builder.compile().compiled
+    @classmethod
+    def compile_query(cls, string, flags=0, backend=None, optimize=False,
+                      binary=False, encoding='utf-8'):
+        """Return the compiled pattern of `string` together with the
+        parsed ``(method, args)`` list it was built from."""
+        stages = Stages(string, hooks) if hooks else None
+        key = (normalize(string), flags, optimize, encoding if binary else None)
+        cached = compile_cache.get(key)
+        if cached is not None:
+            if stages:
+                stages.done('cache', outcome='hit')
+            return cached
+
+        stored = disk_cache.get(key)
+        if stored is not None:
+            regex, stored_flags, parsed = stored
+            if stages:
+                stages.done('cache', outcome='disk')
+            cached = (re.compile(regex, stored_flags), parsed)
+            if stages:
+                stages.done('compile')
+            compile_cache.set(key, cached)
+            return cached
+
+        if stages:
+            stages.done('cache', outcome='miss')
+            tokens = lex(string, backend)
+            stages.done('lex', tokens=len(tokens))
+            parsed = parse(string, backend, tokens)
+            stages.done('parse')
+        else:
+            parsed = parse(string, backend)
+        if not parsed:
+            raise Exception('Invalid Simple Regex')
+
+        builder = cls.build(parsed, flags)
+
+        if stages:
+            regex = builder.get(optimize=optimize, binary=binary,
+                                encoding=encoding)
+            stages.done('build', regex_length=len(regex))
+            builder.compiled = re.compile(regex, builder.flags)
+            stages.done('compile')
+        else:
+            builder.compile(optimize, binary, encoding)
+        compiled = builder.compiled
+        disk_cache.set(key, compiled.pattern, builder.flags, parsed)
+        cached = (compiled, parsed)
+        compile_cache.set(key, cached)
+        return cached
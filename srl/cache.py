@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+srl.cache
+~~~~~~~~~
+
+This module implements the process-wide cache of compiled
+Simple Regex Language queries, and the optional cache on disk of the
+regular expressions generated from them.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from collections import namedtuple, OrderedDict
+
+from ._compat import text_type
+
+DEFAULT_MAXSIZE = 512
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+_STRING = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+_SPACES = re.compile(r'[ ,\t\n]+')
+
+
+def normalize(string):
+    """Normalize an SRL query so that queries only differing in
+    separators share the same cache entry. Whitespace and commas
+    inside string literals are left untouched.::
+
+        >>> normalize('digit ,  letter')
+        'digit letter'
+    """
+    parts = []
+    last = 0
+    for m in _STRING.finditer(string):
+        parts.append(_SPACES.sub(' ', string[last:m.start()]))
+        parts.append(m.group())
+        last = m.end()
+    parts.append(_SPACES.sub(' ', string[last:]))
+    return ''.join(parts).strip()
+
+
+class LRUCache(object):
+    """A bounded, thread-safe least-recently-used mapping.
+
+    :param maxsize: maximum number of entries; ``0`` disables caching.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._data.pop(key, None)
+            self._data[key] = value
+            self._shrink()
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._shrink()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+    def _shrink(self):
+        while len(self._data) > max(self.maxsize, 0):
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+compile_cache = LRUCache()
+
+
+def purge():
+    """Clear the compiled query cache and reset its counters."""
+    compile_cache.clear()
+
+
+def set_cache_size(maxsize):
+    """Set the maximum number of cached queries. ``0`` disables the cache."""
+    compile_cache.resize(maxsize)
+
+
+def cache_info():
+    """Return a :class:`CacheInfo` of hits, misses, evictions and sizes."""
+    return compile_cache.info()
+
+
+def _restore(value):
+    # JSON turns the tuples of a parsed query into lists; groups are
+    # ``('lambda', [items])`` pairs.
+    if isinstance(value, list):
+        if len(value) == 2 and value[0] == 'lambda' and isinstance(value[1], list):
+            return 'lambda', [_restore(item) for item in value[1]]
+        return tuple(_restore(item) for item in value)
+    return value
+
+
+class DiskCache(object):
+    """A cache of the regular expressions, flags and parsed queries
+    generated from queries, kept in a JSON file across processes.
+
+    The file is read once, on first use, and written by :meth:`save`,
+    which also runs when the process exits. Entries are keyed by a hash of
+    the query and its options; the file is ignored if another version of
+    this package or of Python wrote it. Writes replace the file at once,
+    so concurrent readers see the old or the new file, never part of one;
+    concurrent writers each merge their new entries into the file they
+    find.
+
+    :param path: the file, or None to disable the cache
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = None
+        self._new = {}
+        self._lock = threading.RLock()
+        self._registered = False
+
+    @staticmethod
+    def version():
+        from . import __version__
+        return '%s/%d.%d' % ((__version__, ) + tuple(sys.version_info[:2]))
+
+    @staticmethod
+    def hash(key):
+        data = json.dumps(key, sort_keys=True, ensure_ascii=True)
+        return hashlib.sha1(data.encode('ascii')).hexdigest()
+
+    def open(self, path):
+        """Save the pending entries, and use the file at `path`, or
+        disable the cache if `path` is None."""
+        with self._lock:
+            self.save()
+            self.path = path
+            self._entries = None
+            if path is not None and not self._registered:
+                atexit.register(self.save)
+                self._registered = True
+
+    def _read(self):
+        try:
+            with open(self.path, 'rb') as fileobj:
+                data = json.loads(fileobj.read().decode('utf-8'))
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self.version():
+            return {}
+        return data.get('entries') or {}
+
+    def get(self, key):
+        """Return ``(regex, flags, parsed)`` stored for `key`, or None."""
+        if self.path is None:
+            return None
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            entry = self._entries.get(self.hash(key))
+        if entry is None:
+            return None
+        regex, flags, parsed = entry
+        if key[-1] is not None:
+            # Bytes patterns are stored decoded with latin-1.
+            regex = regex.encode('latin-1')
+        return regex, flags, [_restore(item) for item in parsed]
+
+    def set(self, key, regex, flags, parsed):
+        """Store the regular expression `regex` and the `flags` generated
+        from the `parsed` query of `key`."""
+        if self.path is None:
+            return
+        if not isinstance(regex, text_type):
+            regex = regex.decode('latin-1')
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            entry = [regex, flags, parsed]
+            self._entries[self.hash(key)] = self._new[self.hash(key)] = entry
+
+    def save(self):
+        """Write the entries added since the last save to the file."""
+        with self._lock:
+            if self.path is None or not self._new:
+                return
+            entries = self._read()
+            entries.update(self._new)
+            data = json.dumps({'version': self.version(), 'entries': entries},
+                              separators=(',', ':'), sort_keys=True)
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temporary = tempfile.mkstemp(dir=directory, prefix='.srl-cache-')
+            try:
+                with os.fdopen(fd, 'wb') as fileobj:
+                    fileobj.write(data.encode('utf-8'))
+                # mkstemp creates the file readable by its owner only.
+                os.chmod(temporary, 0o666 & ~_umask())
+                _replace(temporary, self.path)
+            except BaseException:
+                os.remove(temporary)
+                raise
+            self._entries = entries
+            self._new = {}
+
+
+def _umask():
+    # The umask can only be read by setting it.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Python 2 has no `os.replace`; `os.rename` replaces files on POSIX.
+_replace = getattr(os, 'replace', os.rename)
+
+
+disk_cache = DiskCache()
+
+
+def set_disk_cache(path):
+    """Keep the regular expressions generated from queries in the file at
+    `path`, so that processes using the same queries skip parsing them.
+    ``None`` disables it. See :class:`DiskCache`."""
+    disk_cache.open(path)
+
+
+def save_disk_cache():
+    """Write the queries compiled since the last save to the disk cache
+    file, which also happens when the process exits."""
+    disk_cache.save()
@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+"""
+srl.dfa
+~~~~~~~
+
+This module implements a matching engine which runs in time linear in the
+length of the string, whatever the query, for ``SRL(query, engine='dfa')``::
+
+    >>> from srl import SRL
+    >>> srl = SRL('capture (letter once or more) once or more, must end',
+    ...           engine='dfa')
+    >>> srl.search('a' * 20 + '!') is None
+    True
+
+The node tree of the query, see :mod:`srl.nodes`, is compiled to a
+program of instructions, run as a lazily built DFA: each state is the
+list of instructions the `re` engine could be at, in the order it would
+try them, so the match found is the one `re` finds. States and their
+transitions are built on first use and cached; the cache is emptied when
+it holds more than :attr:`DFA.max_states` states.
+
+A first pass over the string finds where the match ends, and a second,
+backwards from there, where it starts. For a query with groups, a third
+runs the program over the match alone, following each of its paths at
+once with the positions of its groups (a Pike VM), and keeps the first
+one `re` would try which ends there; each pass is linear.
+
+The engine runs in Python: on strings `re` matches without much
+backtracking it is many times slower, see ``benchmarks/bench_dfa.py``.
+
+Queries with raw expressions or lookarounds, with quantified items which
+may match the empty string, and bytes patterns are left to `re`, see
+:meth:`DFA.from_query`. So is every query before Python 3.7, whose `re`
+does not allow an empty match right after another match.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+import sys
+
+from ._compat import text_type
+from .match import Match
+from .nodes import (Literal, CharClass, Anchor, Repeat, Sequence, Group,
+                    Alternation)
+
+#: The methods implemented by :class:`DFA`.
+METHODS = ('search', 'match', 'fullmatch', 'findall', 'finditer', 'sub')
+
+#: Whether the engine runs on this version of Python.
+SUPPORTED = sys.version_info >= (3, 7)
+
+# Instructions.
+CHAR, SPLIT, JMP, BOL, EOL, SAVE, MATCH = range(7)
+
+# How a closure treats a match: the first one ends the list of states
+# because `re` would not try the states after it; matches are all kept
+# when looking for the longest match, or skipped when an empty match is
+# not allowed.
+FIRST, ALL, SKIP = 0, 8, 16
+_AT_BOL, _AT_EOL, _RESTART = 1, 2, 4
+
+
+class Unsupported(Exception):
+    """Raised for a node the engine cannot run."""
+
+
+def _nullable(node):
+    # Whether `node` may match the empty string.
+    if isinstance(node, Literal):
+        return not node.text
+    if isinstance(node, CharClass):
+        return False
+    if isinstance(node, Repeat):
+        return node.min == 0 or _nullable(node.node)
+    if isinstance(node, Alternation):
+        return any(_nullable(child) for child in node.children)
+    if isinstance(node, Sequence):
+        return all(_nullable(child) for child in node.children)
+    return True
+
+
+class _Program(object):
+    # The instructions of a node tree, matched forwards or backwards.
+
+    #: The largest program, counted repetitions being expanded.
+    max_size = 10000
+
+    def __init__(self, node, flags, reverse=False, groups=False):
+        self.flags = flags
+        self.reverse = reverse
+        self.ops = []
+        self.args = []
+        self.anchors = False
+        # The number of each capturing group, if saving their positions.
+        self.groups = {} if groups else None
+        self._tests = {}
+        self.emit(node)
+        self.add(MATCH)
+
+    def add(self, op, arg=None):
+        if len(self.ops) >= self.max_size:
+            raise Unsupported('the query is too long')
+        self.ops.append(op)
+        self.args.append(arg)
+        return len(self.ops) - 1
+
+    def test(self, regex):
+        # A callable telling whether a character matches `regex`.
+        test = self._tests.get(regex)
+        if test is None:
+            test = self._tests[regex] = re.compile(regex, self.flags).match
+        return test
+
+    def emit(self, node):
+        if isinstance(node, Literal):
+            chars = node.text[::-1] if self.reverse else node.text
+            for char in chars:
+                self.add(CHAR, self.test(re.escape(char)))
+        elif isinstance(node, CharClass):
+            self.add(CHAR, self.test(node.render()))
+        elif isinstance(node, Anchor):
+            self.anchors = True
+            self.add(BOL if node.regex == '^' else EOL)
+        elif isinstance(node, Repeat):
+            self.repeat(node)
+        elif isinstance(node, Alternation):
+            self.alternation(node.children)
+        elif type(node) is Group and node.capture and self.groups is not None:
+            # A repeated group is emitted several times, with one number.
+            number = self.groups.setdefault(id(node), len(self.groups) + 1)
+            self.add(SAVE, 2 * number)
+            for child in node.children:
+                self.emit(child)
+            self.add(SAVE, 2 * number + 1)
+        elif type(node) in (Sequence, Group):
+            children = node.children[::-1] if self.reverse else node.children
+            for child in children:
+                self.emit(child)
+        else:
+            raise Unsupported(type(node).__name__)
+
+    def alternation(self, children):
+        if not children:
+            return
+        jumps = []
+        for child in children[:-1]:
+            split = self.add(SPLIT)
+            self.emit(child)
+            jumps.append(self.add(JMP))
+            self.args[split] = (split + 1, len(self.ops))
+        self.emit(children[-1])
+        for jump in jumps:
+            self.args[jump] = len(self.ops)
+
+    def branch(self, greedy):
+        # Add a split between the next instruction and one set later.
+        split = self.add(SPLIT)
+        return split, greedy
+
+    def close(self, split, target):
+        split, greedy = split
+        self.args[split] = (split + 1, target) if greedy else (target, split + 1)
+
+    def repeat(self, node):
+        if _nullable(node.node):
+            # `re` stops repeating an item after an empty iteration.
+            raise Unsupported('a quantified item may be empty')
+        for _ in range(node.min):
+            self.emit(node.node)
+        if node.max is None:
+            split = self.branch(node.greedy)
+            self.emit(node.node)
+            self.add(JMP, split[0])
+            self.close(split, len(self.ops))
+            return
+        splits = []
+        for _ in range(node.max - node.min):
+            splits.append(self.branch(node.greedy))
+            self.emit(node.node)
+        for split in splits:
+            self.close(split, len(self.ops))
+
+
+class _Kernel(object):
+    # The instructions reached by consuming a character, before following
+    # the splits, jumps and anchors after them.
+
+    __slots__ = ('pcs', 'closures')
+
+    def __init__(self, pcs):
+        self.pcs = pcs
+        self.closures = {}
+
+
+class _State(object):
+    # The character instructions of a kernel after following them, in
+    # order, and whether the program matched on the way.
+
+    __slots__ = ('pcs', 'match', 'next')
+
+    def __init__(self, pcs, match):
+        self.pcs = pcs
+        self.match = match
+        self.next = {}
+
+
+class _Machine(object):
+    # The lazily built DFA of a program.
+
+    def __init__(self, program, max_states):
+        self.program = program
+        self.max_states = max_states
+        self.reset()
+
+    def reset(self):
+        self.empty = _Kernel(())
+        self.kernels = {(): self.empty}
+
+    def kernel(self, pcs):
+        kernel = self.kernels.get(pcs)
+        if kernel is None:
+            if len(self.kernels) >= self.max_states:
+                # Start over rather than grow without bound.
+                self.reset()
+            kernel = self.kernels.setdefault(pcs, _Kernel(pcs))
+        return kernel
+
+    def close(self, kernel, key):
+        ops, args = self.program.ops, self.program.args
+        pcs = []
+        seen = set()
+        match = False
+        starts = kernel.pcs + (0, ) if key & _RESTART else kernel.pcs
+        for start in starts:
+            stack = [start]
+            while stack:
+                pc = stack.pop()
+                if pc in seen:
+                    continue
+                seen.add(pc)
+                op = ops[pc]
+                if op == CHAR:
+                    pcs.append(pc)
+                elif op == SPLIT:
+                    stack.append(args[pc][1])
+                    stack.append(args[pc][0])
+                elif op == JMP:
+                    stack.append(args[pc])
+                elif op == BOL:
+                    if key & _AT_BOL:
+                        stack.append(pc + 1)
+                elif op == EOL:
+                    if key & _AT_EOL:
+                        stack.append(pc + 1)
+                elif op == SAVE:
+                    stack.append(pc + 1)
+                elif not key & SKIP:
+                    match = True
+                    if not key & ALL:
+                        # `re` returns this match before trying the rest.
+                        break
+            else:
+                continue
+            break
+        state = kernel.closures[key] = _State(tuple(pcs), match)
+        return state
+
+    def step(self, state, char):
+        args = self.program.args
+        pcs = tuple(pc + 1 for pc in state.pcs if args[pc](char))
+        kernel = state.next[char] = self.kernel(pcs)
+        return kernel
+
+
+class DFA(object):
+    """Implements the matching methods of `compiled` without backtracking.
+
+    :param compiled: the compiled `re` pattern, used for match objects
+    :param node: the node tree `compiled` was rendered from
+    """
+
+    #: The number of states cached in each direction.
+    max_states = 10000
+
+    def __init__(self, compiled, node):
+        self.compiled = compiled
+        self._forward = _Machine(_Program(node, compiled.flags), self.max_states)
+        self._backward = _Machine(_Program(node, compiled.flags, True),
+                                  self.max_states)
+        self._anchors = self._forward.program.anchors
+        self._multiline = compiled.flags & re.MULTILINE
+        self._groups = None
+        if compiled.groups:
+            self._groups = _Program(node, compiled.flags, groups=True)
+            if len(self._groups.groups) != compiled.groups:
+                raise Unsupported('the groups are not numbered in order')
+
+    @classmethod
+    def from_query(cls, compiled, node):
+        """Return a :class:`DFA` for the pattern `compiled` from `node`, or
+        None if it contains a node the engine cannot run."""
+        if not SUPPORTED or not isinstance(compiled.pattern, text_type):
+            return None
+        try:
+            return cls(compiled, node)
+        except Unsupported:
+            return None
+
+    def _context(self, string, index, endpos):
+        # The anchors which match at `index`.
+        context = 0
+        if index == 0 or self._multiline and string[index - 1] == '\n':
+            context |= _AT_BOL
+        if index == endpos or string[index] == '\n' and (
+                self._multiline or index == endpos - 1):
+            context |= _AT_EOL
+        return context
+
+    def _at(self, string, index, endpos):
+        # The anchors which match at `index`, if the program has any.
+        return self._context(string, index, endpos) if self._anchors else 0
+
+    def _end(self, string, pos, endpos, anchored=False, advance=False):
+        # Return where the match found from `pos` ends, -1 if none; if
+        # `advance`, the match may not be empty at `pos`.
+        if pos > endpos:
+            return -1
+        machine = self._forward
+        kernel = machine.empty
+        end = -1
+        key = _RESTART | (SKIP if advance else FIRST)
+        index = pos
+        while True:
+            if self._anchors:
+                key |= self._context(string, index, endpos)
+            state = kernel.closures.get(key) or machine.close(kernel, key)
+            if state.match:
+                end = index
+                key = 0
+            elif anchored:
+                key = 0
+            else:
+                key &= _RESTART
+            if index == endpos or not (state.pcs or key):
+                return end
+            char = string[index]
+            kernel = state.next.get(char) or machine.step(state, char)
+            index += 1
+
+    def _start(self, string, pos, end, endpos):
+        # Return where the longest match ending at `end` starts.
+        machine = self._backward
+        kernel = machine.empty
+        start = -1
+        key = _RESTART | ALL
+        index = end
+        while True:
+            if self._anchors:
+                key |= self._context(string, index, endpos)
+            state = kernel.closures.get(key) or machine.close(kernel, key)
+            if state.match:
+                start = index
+            key = ALL
+            if index == pos or not state.pcs:
+                return start
+            index -= 1
+            char = string[index]
+            kernel = state.next.get(char) or machine.step(state, char)
+
+    def _follow(self, threads, seen, context, index, pc, slots):
+        # Add to `threads` those reached from `pc` at `index` before the
+        # next character, in the order `re` would try them, but not those
+        # `seen` from an earlier thread; None stands for a match.
+        ops, args = self._groups.ops, self._groups.args
+        stack = [(pc, slots)]
+        while stack:
+            pc, slots = stack.pop()
+            if pc in seen:
+                continue
+            seen.add(pc)
+            op = ops[pc]
+            if op == CHAR:
+                threads.append((pc, slots))
+            elif op == SPLIT:
+                stack.append((args[pc][1], slots))
+                stack.append((args[pc][0], slots))
+            elif op == JMP:
+                stack.append((args[pc], slots))
+            elif op == BOL:
+                if context & _AT_BOL:
+                    stack.append((pc + 1, slots))
+            elif op == EOL:
+                if context & _AT_EOL:
+                    stack.append((pc + 1, slots))
+            elif op == SAVE:
+                slots = list(slots)
+                slots[args[pc]] = index
+                stack.append((pc + 1, slots))
+            elif None not in seen:
+                seen.add(None)
+                threads.append((None, slots))
+
+    def _spans(self, string, start, end, endpos):
+        # The spans of the groups of the match `re` finds between `start`
+        # and `end`.
+        args = self._groups.args
+        slots = [start, end] + [-1] * (2 * self.compiled.groups)
+        threads = []
+        self._follow(threads, set(), self._at(string, start, endpos), start, 0, slots)
+        for index in range(start, end):
+            char = string[index]
+            context = self._at(string, index + 1, endpos)
+            following = []
+            seen = set()
+            for pc, slots in threads:
+                # A match before `end` is not the one looked for.
+                if pc is not None and args[pc](char):
+                    self._follow(following, seen, context, index + 1, pc + 1, slots)
+            threads = following
+        for pc, slots in threads:
+            if pc is None:
+                return tuple(zip(slots[::2], slots[1::2]))
+
+    def _match(self, string, start, end, pos, endpos):
+        if self._groups is None:
+            spans = ((start, end), )
+        else:
+            spans = self._spans(string, start, end, endpos)
+        return Match(self.compiled, string, pos, endpos, spans)
+
+    def _bounds(self, string, pos, endpos):
+        size = len(string)
+        return min(max(pos, 0), size), min(max(endpos, 0), size)
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        pos, endpos = self._bounds(string, pos, endpos)
+        end = self._end(string, pos, endpos)
+        if end >= 0:
+            start = self._start(string, pos, end, endpos)
+            return self._match(string, start, end, pos, endpos)
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        pos, endpos = self._bounds(string, pos, endpos)
+        end = self._end(string, pos, endpos, anchored=True)
+        if end >= 0:
+            return self._match(string, pos, end, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=sys.maxsize):
+        pos, endpos = self._bounds(string, pos, endpos)
+        if pos <= endpos and self._start(string, pos, endpos, endpos) == pos:
+            return self._match(string, pos, endpos, pos, endpos)
+
+    def finditer(self, string, pos=0, endpos=sys.maxsize):
+        pos, endpos = self._bounds(string, pos, endpos)
+        index = pos
+        advance = False
+        while index <= endpos:
+            end = self._end(string, index, endpos, advance=advance)
+            if end < 0:
+                return
+            start = self._start(string, index, end, endpos)
+            yield self._match(string, start, end, pos, endpos)
+            # Like `re`, allow no second empty match at the same place.
+            advance = start == end
+            index = end
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        groups = self.compiled.groups
+        found = []
+        for match in self.finditer(string, pos, endpos):
+            if not groups:
+                found.append(match.group())
+            elif groups == 1:
+                found.append(match.group(1) or string[:0])
+            else:
+                found.append(match.groups(string[:0]))
+        return found
+
+    def sub(self, repl, string, count=0):
+        pieces = []
+        last = 0
+        for match in self.finditer(string):
+            if count and len(pieces) == 2 * count:
+                break
+            pieces.append(string[last:match.start()])
+            if callable(repl):
+                pieces.append(repl(match))
+            elif '\\' in repl:
+                pieces.append(match.expand(repl))
+            else:
+                pieces.append(repl)
+            last = match.end()
+        pieces.append(string[last:])
+        return string[:0].join(pieces)
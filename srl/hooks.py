@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+srl.hooks
+~~~~~~~~~
+
+This module implements instrumentation of the compilation of queries::
+
+    >>> import srl
+    >>> srl.purge()
+    >>> events = []
+    >>> with srl.instrument(on_stage=events.append):
+    ...     _ = srl.SRL('digit exactly 3 times, literally "ms"')
+    >>> [(event.stage, sorted(event.info)) for event in events]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('cache', ['outcome']), ('lex', ['tokens']), ('parse', []),
+     ('build', ['regex_length']), ('compile', [])]
+
+When no hook is installed, compiling a query only checks that the list of
+hooks is empty.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import threading
+import timeit
+from collections import namedtuple
+
+#: A stage of the compilation of `query`, which took `duration` seconds.
+#: The stages, in order, and their `info`:
+#:
+#: - ``cache``: looking the query up, `outcome` being ``'hit'``,
+#:   ``'disk'`` (see :func:`srl.set_disk_cache`) or ``'miss'``; the
+#:   compilation stops after a hit,
+#: - ``lex``: tokenizing the query into `tokens` tokens,
+#: - ``parse``: parsing the tokens,
+#: - ``build``: running the :class:`~srl.builder.Builder` and rendering a
+#:   regular expression of `regex_length` characters,
+#: - ``compile``: `re.compile`.
+#:
+#: After a disk cache hit, only ``cache`` and ``compile`` are reported.
+Stage = namedtuple('Stage', 'query stage duration info')
+
+# The installed hooks; compiling checks it is empty before timing anything.
+hooks = []
+_lock = threading.Lock()
+
+
+class Hook(object):
+    """An installed hook, removed by :meth:`remove` or at the end of a
+    ``with`` block."""
+
+    def __init__(self, on_stage):
+        self.on_stage = on_stage
+
+    def remove(self):
+        with _lock:
+            if self.on_stage in hooks:
+                hooks.remove(self.on_stage)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.remove()
+
+
+def instrument(on_stage):
+    """Call `on_stage` with a :class:`Stage` for each stage of each query
+    compiled from now on, until the returned :class:`Hook` is removed.
+    Hooks are called in the compiling thread."""
+    with _lock:
+        hooks.append(on_stage)
+    return Hook(on_stage)
+
+
+class Stages(object):
+    """Times the stages of the compilation of `query` for `hooks`."""
+
+    def __init__(self, query, hooks):
+        self.query = query
+        self.hooks = list(hooks)
+        self.start = timeit.default_timer()
+
+    def done(self, stage, **info):
+        now = timeit.default_timer()
+        event = Stage(self.query, stage, now - self.start, info)
+        for hook in self.hooks:
+            hook(event)
+        # Time spent in the hooks is not counted in the next stage.
+        self.start = timeit.default_timer()
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+srl.literal
+~~~~~~~~~~~
+
+This module implements the fast paths for queries built from fixed
+strings. Queries that reduce to a fixed string, such as ``literally
+"ERROR"``, are matched with string methods instead of the `re` engine;
+other queries skip the engine on strings lacking a literal that every
+match contains.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+import sys
+
+from ._compat import text_type
+from .match import Match
+
+# Flags which do not change how a fixed string matches. `re.MULTILINE`
+# only matters for anchored literals and is checked separately.
+NEUTRAL_FLAGS = (re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE |
+                 getattr(re, 'ASCII', 0))
+
+# Characters `re` folds onto an ASCII letter under `re.IGNORECASE` while
+# `lower()` does not, or does only in Python 3.
+_FOLDS = {'i': u'ı', 's': u'ſ', 'k': u'K'}
+
+# Methods of `re.RegexObject` implemented by `LiteralPattern`.
+METHODS = ('search', 'match', 'findall', 'sub', 'split')
+
+
+def extract(parsed):
+    """Return ``(literal, begin, end)`` if the parsed query only matches
+    the fixed string `literal`, optionally anchored at the beginning or
+    the end, otherwise None.::
+
+        >>> extract([('begin_with', ()), ('literally', ('ERROR', ))])
+        ('ERROR', True, False)
+    """
+    literal = []
+    begin = end = False
+    for method, args in parsed:
+        if method in ('case_insensitive', 'multi_line', 'all_lazy'):
+            continue
+        if method == 'begin_with' and not begin and not literal:
+            begin = True
+        elif method == 'literally' and not end:
+            literal.append(args[0].replace(r'\"', '"'))
+        elif method == 'must_end' and literal and not end:
+            end = True
+        else:
+            return None
+    literal = ''.join(literal)
+    if literal:
+        return literal, begin, end
+
+
+_QUANTIFIERS = ('optional', 'never_or_more', 'once', 'twice', 'exactly',
+                'between', 'at_least', 'once_or_more')
+_GROUPS = ('capture', 'non_capture', 'until', 'if_followed_by', 'if_already_had')
+
+
+def _collect(parsed, runs):
+    # Append the literals every match of `parsed` contains to `runs`.
+    # Adjacent ``literally`` items form one run; anything else ends it.
+    current = ''
+    snapshot = (0, '')
+    quantified = False
+    for method, args in parsed:
+        if method in _QUANTIFIERS:
+            if (quantified or method in ('optional', 'never_or_more') or
+                    0 in args):
+                # The item may be skipped, drop what it contributed. A
+                # second quantifier makes the first one lazy or invalid.
+                del runs[snapshot[0]:]
+                runs.append(snapshot[1])
+                current = ''
+            elif not (method == 'once' or method in ('exactly', 'between') and
+                      max(args) == 1):
+                # Repetitions of the item are no longer adjacent to the
+                # items around it.
+                runs.append(current)
+                current = ''
+            quantified = True
+            continue
+        if method in ('case_insensitive', 'multi_line', 'all_lazy'):
+            continue
+        if method not in ('if_already_had', 'if_not_already_had'):
+            # A lookbehind is moved in front of the last item, which a
+            # following quantifier still applies to.
+            snapshot = (len(runs), current)
+            quantified = False
+        if method == 'literally':
+            current += args[0].replace(r'\"', '"')
+            continue
+        runs.append(current)
+        current = ''
+        if method == 'if_already_had' and quantified:
+            # The lookbehind goes before the quantifier, which repeats it
+            # instead of the item, maybe no time at all.
+            continue
+        if method in _GROUPS:
+            _collect(args[0][1], runs)
+    runs.append(current)
+
+
+def _has_raw(parsed):
+    for method, args in parsed:
+        if method == 'raw':
+            return True
+        for arg in args:
+            if isinstance(arg, tuple) and arg[:1] == ('lambda', ) and _has_raw(arg[1]):
+                return True
+    return False
+
+
+def required(parsed):
+    """Return the literals every match of the parsed query contains,
+    longest first. Lookaround contents are included, as they must be
+    found around the match. Queries with a raw expression have none, as
+    it may make any item optional or an alternative.::
+
+        >>> required([('digit', ()), ('once_or_more', ()), ('literally', ('ms', ))])
+        ('ms',)
+    """
+    if _has_raw(parsed):
+        return ()
+    runs = []
+    _collect(parsed, runs)
+    literals = []
+    for run in sorted(runs, key=len, reverse=True):
+        if run and not any(run in literal for literal in literals):
+            literals.append(run)
+    return tuple(literals)
+
+
+def _bounds(string, pos, endpos):
+    size = len(string)
+    return min(max(pos, 0), size), min(max(endpos, 0), size)
+
+
+class LiteralPattern(object):
+    """Implements the matching methods of `compiled` for a pattern which
+    matches `literal` only.
+
+    :param compiled: the compiled `re` pattern, used for match objects and
+                     as fallback for inputs the string methods cannot handle
+    :param literal: the fixed string
+    :param begin: whether the literal is anchored with ``begin with``
+    :param end: whether the literal is anchored with ``must end``
+    """
+
+    #: Strings shorter than this are passed to `re`, which is faster on
+    #: them than the string methods plus the bookkeeping here.
+    min_length = 1024
+
+    def __init__(self, compiled, literal, begin=False, end=False):
+        self.compiled = compiled
+        self.literal = literal
+        self.begin = begin
+        self.end = end
+        self.ignorecase = bool(compiled.flags & re.IGNORECASE)
+        self._size = len(literal)
+        if self.ignorecase:
+            self._folded = literal.lower()
+            self._unfoldable = [char for letter, char in _FOLDS.items()
+                                if letter in self._folded]
+            if not compiled.flags & re.UNICODE and 'i' in self._folded:
+                # Python 2 folds it onto ``i``, while `re` folds only ASCII
+                # letters without `re.UNICODE`.
+                self._unfoldable.append(u'\u0130')
+        else:
+            self._folded = literal
+
+    @classmethod
+    def from_query(cls, compiled, parsed):
+        """Return a :class:`LiteralPattern` for the query compiled to
+        `compiled` from `parsed`, or None if it is no fixed string."""
+        if compiled.flags & ~NEUTRAL_FLAGS:
+            return None
+        extracted = extract(parsed)
+        if extracted is None:
+            return None
+        literal, begin, end = extracted
+        if (begin or end) and compiled.flags & re.MULTILINE:
+            return None
+        if compiled.flags & re.IGNORECASE:
+            if any(ord(c) > 127 for c in literal):
+                return None
+        elif not end:
+            # `re` already searches case-sensitive literal prefixes with a
+            # string search of its own; only ``must end`` is worth it here.
+            return None
+        return cls(compiled, literal, begin, end)
+
+    def _fold(self, string):
+        # Return the string to search in, or None if `re` is faster or the
+        # string methods would not give the same result.
+        if len(string) < self.min_length:
+            return None
+        if not self.ignorecase:
+            return string
+        folded = string.lower()
+        if len(folded) != len(string):
+            return None
+        if isinstance(string, text_type):
+            for char in self._unfoldable:
+                if char in string:
+                    return None
+        return folded
+
+    def _find(self, string, pos, endpos):
+        literal = self._folded
+        if self.end:
+            # `$` also matches before a newline at the end of the string.
+            start = endpos - self._size
+            if (start > pos and string[endpos - 1:endpos] == '\n' and
+                    string.startswith(literal, start - 1, endpos - 1)):
+                start -= 1
+            elif start < pos or not string.startswith(literal, start, endpos):
+                return -1
+            if self.begin and start:
+                return -1
+            return start
+        if self.begin:
+            if pos == 0 and string.startswith(literal, 0, endpos):
+                return 0
+            return -1
+        return string.find(literal, pos, endpos)
+
+    def _match(self, start, stop, string, pos, endpos):
+        return Match(self.compiled, string, pos, endpos, ((start, stop), ))
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        folded = self._fold(string)
+        if folded is None:
+            return self.compiled.search(string, pos, endpos)
+        pos, endpos = _bounds(string, pos, endpos)
+        start = self._find(folded, pos, endpos)
+        if start >= 0:
+            return self._match(start, start + self._size, string, pos, endpos)
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        folded = self._fold(string)
+        if folded is None:
+            return self.compiled.match(string, pos, endpos)
+        pos, endpos = _bounds(string, pos, endpos)
+        if self.begin and pos:
+            return None
+        if not folded.startswith(self._folded, pos, endpos):
+            return None
+        stop = pos + self._size
+        if self.end and stop != endpos and not (
+                stop == endpos - 1 and folded[stop:endpos] == '\n'):
+            return None
+        return self._match(pos, stop, string, pos, endpos)
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        folded = self._fold(string)
+        if folded is None:
+            return self.compiled.findall(string, pos, endpos)
+        pos, endpos = _bounds(string, pos, endpos)
+        start = self._find(folded, pos, endpos)
+        if start < 0:
+            return []
+        stop = start + self._size
+        if not (self.ignorecase or self.begin or self.end):
+            return [string[start:stop]] * string.count(self.literal, start, endpos)
+        found = []
+        while start >= 0:
+            found.append(string[start:stop])
+            start = self._find(folded, stop, endpos)
+            stop = start + self._size
+        return found
+
+    def sub(self, repl, string, count=0):
+        folded = self._fold(string)
+        if folded is None or count < 0 or (
+                not callable(repl) and '\\' in repl):
+            return self.compiled.sub(repl, string, count)
+        if not (callable(repl) or self.ignorecase or self.begin or self.end):
+            return string.replace(self.literal, repl, count or -1)
+        pieces = []
+        last = 0
+        size = len(string)
+        start = self._find(folded, 0, size)
+        while start >= 0:
+            stop = start + self._size
+            pieces.append(string[last:start])
+            if callable(repl):
+                pieces.append(repl(self._match(start, stop, string, 0, size)))
+            else:
+                pieces.append(repl)
+            last = stop
+            count -= 1
+            if count == 0:
+                break
+            start = self._find(folded, stop, size)
+        pieces.append(string[last:])
+        return string[:0].join(pieces)
+
+    def split(self, string, maxsplit=0):
+        folded = self._fold(string)
+        if folded is None or maxsplit < 0:
+            return self.compiled.split(string, maxsplit)
+        if not (self.ignorecase or self.begin or self.end):
+            return string.split(self.literal, maxsplit or -1)
+        pieces = []
+        last = 0
+        size = len(string)
+        start = self._find(folded, 0, size)
+        while start >= 0:
+            pieces.append(string[last:start])
+            last = start + self._size
+            maxsplit -= 1
+            if maxsplit == 0:
+                break
+            start = self._find(folded, last, size)
+        pieces.append(string[last:])
+        return pieces
+
+
+class Prefilter(object):
+    """Implements `search` and `findall` of `compiled`, skipping the `re`
+    engine on strings which lack one of `literals`.
+
+    :param compiled: the compiled `re` pattern
+    :param literals: literals every match contains, see `required`
+    """
+
+    #: Strings shorter than this are passed to `re` right away.
+    min_length = 1024
+
+    def __init__(self, compiled, literals):
+        self.compiled = compiled
+        self.literals = literals
+
+    @classmethod
+    def from_query(cls, compiled, literals):
+        """Return a :class:`Prefilter` for the query compiled to `compiled`
+        whose matches contain `literals`, or None if there are none."""
+        if compiled.flags & re.IGNORECASE:
+            return None
+        if literals:
+            return cls(compiled, literals)
+
+    def _missing(self, string, endpos):
+        # Views (memoryview, or buffer on Python 2) cannot be searched.
+        if len(string) < self.min_length or not hasattr(string, 'find'):
+            return False
+        # Lookbehinds may look before `pos`, so scan from the start.
+        for literal in self.literals:
+            if string.find(literal, 0, endpos) < 0:
+                return True
+        return False
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        if self._missing(string, endpos):
+            return None
+        return self.compiled.search(string, pos, endpos)
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        if self._missing(string, endpos):
+            return []
+        return self.compiled.findall(string, pos, endpos)
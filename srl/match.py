@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+srl.match
+~~~~~~~~~
+
+This module implements a lightweight match object returned by the
+matchers that do not run the `re` engine.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+
+from ._compat import integer_types, string_types, sre_parse
+from .cache import LRUCache
+
+# The groups enclosing each group, by pattern.
+_enclosing = LRUCache(64)
+
+
+def _enclosing_groups(compiled):
+    # Return ``{group: groups enclosing it}`` for the groups of `compiled`.
+    key = (compiled.pattern, compiled.flags)
+    enclosing = _enclosing.get(key)
+    if enclosing is None:
+        enclosing = {}
+        stack = [(sre_parse.parse(compiled.pattern, compiled.flags), ())]
+        while stack:
+            items, outer = stack.pop()
+            for op, av in items:
+                if op is sre_parse.SUBPATTERN:
+                    # ``(group, subpattern)``, with flags in between since 3.6.
+                    if av[0]:
+                        enclosing[av[0]] = outer
+                        stack.append((av[-1], outer + (av[0], )))
+                    else:
+                        stack.append((av[-1], outer))
+                    continue
+                for value in av if isinstance(av, (tuple, list)) else (av, ):
+                    if isinstance(value, sre_parse.SubPattern):
+                        stack.append((value, outer))
+                    elif isinstance(value, list):
+                        # The alternatives of a branch.
+                        stack.extend((item, outer) for item in value
+                                     if isinstance(item, sre_parse.SubPattern))
+        _enclosing.set(key, enclosing)
+    return enclosing
+
+
+class Match(object):
+    """Behaves like the match objects returned by `re`.
+
+    :param re: the compiled pattern the match belongs to
+    :param string: the string passed to the matching method
+    :param pos: the `pos` passed to the matching method
+    :param endpos: the `endpos` passed to the matching method
+    :param spans: ``(start, end)`` of the whole match followed by one
+                  pair per group, ``(-1, -1)`` for groups that did not
+                  participate
+    """
+
+    __slots__ = ('re', 'string', 'pos', 'endpos', '_spans')
+
+    def __init__(self, re, string, pos, endpos, spans):
+        self.re = re
+        self.string = string
+        self.pos = pos
+        self.endpos = endpos
+        self._spans = spans
+
+    def _index(self, group):
+        if isinstance(group, integer_types):
+            if 0 <= group < len(self._spans):
+                return group
+        else:
+            index = self.re.groupindex.get(group)
+            if index is not None:
+                return index
+        raise IndexError('no such group')
+
+    def span(self, group=0):
+        return self._spans[self._index(group)]
+
+    def start(self, group=0):
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        return self.span(group)[1]
+
+    def _group(self, group, default=None):
+        start, end = self._spans[self._index(group)]
+        if start < 0:
+            return default
+        return self.string[start:end]
+
+    def group(self, *groups):
+        if not groups:
+            return self._group(0)
+        if len(groups) == 1:
+            return self._group(groups[0])
+        return tuple(self._group(group) for group in groups)
+
+    __getitem__ = _group
+
+    def groups(self, default=None):
+        return tuple(self._group(index, default)
+                     for index in range(1, len(self._spans)))
+
+    def groupdict(self, default=None):
+        return dict((name, self._group(index, default))
+                    for name, index in self.re.groupindex.items())
+
+    @property
+    def lastindex(self):
+        last = None
+        enclosing = None
+        for index in range(1, len(self._spans)):
+            start, end = self._spans[index]
+            if start < 0:
+                continue
+            if last is None or end > self._spans[last][1]:
+                last = index
+            elif end == self._spans[last][1]:
+                # A group ending where the previous one does closes after
+                # it, unless that group encloses it.
+                if enclosing is None:
+                    enclosing = _enclosing_groups(self.re)
+                if last not in enclosing.get(index, ()):
+                    last = index
+        return last
+
+    @property
+    def lastgroup(self):
+        last = self.lastindex
+        for name, index in self.re.groupindex.items():
+            if index == last:
+                return name
+
+    def expand(self, template):
+        # Let `re` interpret the template on a pattern which matches the
+        # text of this match, followed by the group texts in a lookahead.
+        # The pattern of a bytes string is built as text, one character
+        # per byte.
+        binary = not isinstance(self.string, string_types)
+        names = dict((index, name) for name, index in self.re.groupindex.items())
+        texts = [self.group()]
+        groups = []
+        for index in range(1, len(self._spans)):
+            text = self._group(index)
+            group = '(?P<%s>%%s)' % names[index] if index in names else '(%s)'
+            if text is None:
+                groups.append(group % '(?!)' + '?')
+            else:
+                groups.append(group % re.escape(
+                    text.decode('latin-1') if binary else text))
+                texts.append(text)
+        head = texts[0].decode('latin-1') if binary else texts[0]
+        pattern = '%s(?=%s)' % (re.escape(head), ''.join(groups))
+        if binary:
+            pattern = pattern.encode('latin-1')
+        return re.match(pattern, self.string[:0].join(texts)).expand(template)
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return '<srl.Match object; span=%r, match=%r>' % (
+            self.span(), self.group())
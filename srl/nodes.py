@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+srl.nodes
+~~~~~~~~~
+
+This module implements the node tree built by :class:`srl.builder.Builder`
+and rendered to a regular expression.
+
+Nodes are immutable. They compare and hash by structure, and render their
+regular expression once, so equal subtrees can share cache entries.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+
+from .errors import BuilderException
+
+# Characters a regular expression may end with to quantify its last atom.
+QUANTIFIER_ENDS = '+*}?'
+
+
+class Node(object):
+    """Base class of all nodes. Subclasses list their fields in `fields`
+    and implement `_render`."""
+
+    __slots__ = ('_regex', '_hash')
+    fields = ()
+
+    def render(self):
+        """Return the regular expression of this node."""
+        try:
+            return self._regex
+        except AttributeError:
+            self._regex = self._render()
+            return self._regex
+
+    def _render(self):
+        raise NotImplementedError
+
+    def lazy(self):
+        """Return this node with its trailing quantifier made lazy, or
+        None if it does not end with a quantifier."""
+        return None
+
+    def _key(self):
+        return tuple(getattr(self, field) for field in self.fields)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((type(self).__name__, self._key()))
+            return self._hash
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(
+            repr(getattr(self, field)) for field in self.fields))
+
+
+class Literal(Node):
+    """A fixed string, in a non-capturing group unless `group` is false."""
+
+    __slots__ = ('text', 'group')
+    fields = __slots__
+
+    def __init__(self, text, group=True):
+        self.text = text
+        self.group = group
+
+    def _render(self):
+        if self.group:
+            return r'(?:%s)' % re.escape(self.text)
+        return re.escape(self.text)
+
+
+class CharClass(Node):
+    """A single character out of a set, such as ``[0-9]`` or ``\\w``.
+
+    :param body: the members, e.g. ``0-9``, or the whole regular expression
+                 if `bracket` is false
+    :param bracket: whether `body` is enclosed in ``[`` and ``]``
+    """
+
+    __slots__ = ('body', 'bracket')
+    fields = __slots__
+
+    def __init__(self, body, bracket=True):
+        self.body = body
+        self.bracket = bracket
+
+    def _render(self):
+        if self.bracket:
+            return r'[%s]' % self.body
+        return self.body
+
+
+class Raw(Node):
+    """A regular expression taken as is."""
+
+    __slots__ = ('regex', )
+    fields = __slots__
+
+    def __init__(self, regex):
+        self.regex = regex
+
+    def _render(self):
+        return self.regex
+
+    def lazy(self):
+        if self.regex and self.regex[-1] in QUANTIFIER_ENDS:
+            return Raw(self.regex + '?')
+
+
+class Anchor(Node):
+    """The beginning ``^`` or the end ``$`` of the string."""
+
+    __slots__ = ('regex', )
+    fields = __slots__
+
+    def __init__(self, regex):
+        self.regex = regex
+
+    def _render(self):
+        return self.regex
+
+
+class Repeat(Node):
+    """`node` repeated `min` to `max` times, `max` being None for no
+    upper bound. A `counted` repeat renders ``{min,max}`` even where a
+    shorter quantifier means the same."""
+
+    __slots__ = ('node', 'min', 'max', 'greedy', 'counted')
+    fields = __slots__
+
+    def __init__(self, node, min, max=None, greedy=True, counted=False):
+        self.node = node
+        self.min = min
+        self.max = max
+        self.greedy = greedy
+        self.counted = counted
+
+    def quantifier(self):
+        if self.counted:
+            quantifier = r'{%d,%s}' % (self.min, '' if self.max is None else self.max)
+        elif self.max is None:
+            quantifier = {0: '*', 1: '+'}.get(self.min, r'{%d,}' % self.min)
+        elif self.min == self.max:
+            quantifier = r'{%d}' % self.min
+        elif (self.min, self.max) == (0, 1):
+            quantifier = '?'
+        else:
+            quantifier = r'{%d,%d}' % (self.min, self.max)
+        return quantifier if self.greedy else quantifier + '?'
+
+    def _render(self):
+        return self.node.render() + self.quantifier()
+
+    def lazy(self):
+        return Repeat(self.node, self.min, self.max, False, self.counted)
+
+
+class Sequence(Node):
+    """`children` one after another, without a group around them."""
+
+    __slots__ = ('children', )
+    fields = __slots__
+
+    def __init__(self, children=()):
+        self.children = tuple(children)
+
+    def _render(self):
+        return ''.join([child.render() for child in self.children])
+
+    def _with(self, children):
+        return type(self)(children)
+
+    def lazy(self):
+        if self.children:
+            last = self.children[-1].lazy()
+            if last is not None:
+                return self._with(self.children[:-1] + (last, ))
+
+
+class _Wrapped(Sequence):
+    # A sequence enclosed in parentheses.
+
+    __slots__ = ()
+
+    def lazy(self):
+        # Only a quantifier right before the closing parenthesis counts.
+        if self.children and not isinstance(self.children[-1], _Wrapped):
+            return Sequence.lazy(self)
+
+
+class Group(_Wrapped):
+    """A capturing group, named if `name` is given, or a non-capturing
+    group if `capture` is false."""
+
+    __slots__ = ('name', 'capture')
+    fields = ('children', 'name', 'capture')
+
+    def __init__(self, children=(), name=None, capture=True):
+        Sequence.__init__(self, children)
+        self.name = name
+        self.capture = capture
+
+    def _render(self):
+        if not self.capture:
+            return r'(?:%s)' % Sequence._render(self)
+        if self.name:
+            return r'(?P<%s>%s)' % (self.name, Sequence._render(self))
+        return r'(%s)' % Sequence._render(self)
+
+    def _with(self, children):
+        return Group(children, self.name, self.capture)
+
+
+class Lookaround(_Wrapped):
+    """A lookahead, or a lookbehind if `ahead` is false, which is negated
+    if `negative` is true."""
+
+    __slots__ = ('ahead', 'negative')
+    fields = ('children', 'ahead', 'negative')
+
+    def __init__(self, children=(), ahead=True, negative=False):
+        Sequence.__init__(self, children)
+        self.ahead = ahead
+        self.negative = negative
+
+    def _render(self):
+        return r'(?%s%s%s)' % ('' if self.ahead else '<',
+                               '!' if self.negative else '=',
+                               Sequence._render(self))
+
+    def _with(self, children):
+        return Lookaround(children, self.ahead, self.negative)
+
+
+class Alternation(_Wrapped):
+    """One of `children`, tried from left to right."""
+
+    __slots__ = ()
+
+    def _render(self):
+        return r'(?:%s)' % '|'.join([child.render() for child in self.children])
+
+
+def _to_bytes(text, encoding, single):
+    # Return `text` encoded, one character per byte, so that the rendered
+    # regular expression encodes to the bytes pattern with latin-1.
+    chars = []
+    for char in text:
+        if char < u'\x80':
+            chars.append(char)
+            continue
+        encoded = char.encode(encoding)
+        if single and len(encoded) > 1:
+            raise BuilderException(
+                '%r is not a single byte in %s, only literals may contain '
+                'it in a bytes pattern' % (char, encoding))
+        chars.append(encoded.decode('latin-1'))
+    return u''.join(chars)
+
+
+def encode(node, encoding='utf-8'):
+    """Return `node` with the text of its leaves encoded with `encoding`,
+    for a bytes pattern. Literals may contain any character; a character
+    of a character class or a raw expression must encode to a single byte,
+    since it may be one member of a class.
+
+    The regular expression of the result encodes to the bytes pattern with
+    latin-1::
+
+        >>> encode(Literal(u'caf\\xe9')).render().encode('latin-1')
+        b'(?:caf\\xc3\\xa9)'
+    """
+    if isinstance(node, Literal):
+        return Literal(_to_bytes(node.text, encoding, False), node.group)
+    if isinstance(node, CharClass):
+        return CharClass(_to_bytes(node.body, encoding, True), node.bracket)
+    if isinstance(node, Raw):
+        return Raw(_to_bytes(node.regex, encoding, True))
+    if isinstance(node, Repeat):
+        return Repeat(encode(node.node, encoding), node.min, node.max, node.greedy,
+                      node.counted)
+    if isinstance(node, Sequence):
+        return node._with([encode(child, encoding) for child in node.children])
+    return node
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+srl.optimizer
+~~~~~~~~~~~~~
+
+This module implements an optional pass over the node tree of
+:mod:`srl.nodes` which produces an equivalent, shorter regular expression:
+
+- non-capturing groups which are not needed are removed, including the
+  group around each ``literally``,
+- adjacent identical single characters are merged into one counted
+  quantifier, e.g. ``[0-9][0-9][0-9]`` into ``[0-9]{3}``,
+- alternatives of single characters are merged into one character class,
+  e.g. ``(?:[0-9]|[a-z]|_)`` into ``[0-9a-z_]``,
+- consecutive literal alternatives are factored into a prefix trie, e.g.
+  ``(?:GET|POST|PUT|PATCH)`` into ``(?:GET|P(?:OST|UT|ATCH))``, so `re`
+  compares each prefix once instead of once per alternative.
+
+Raw expressions are opaque: sequences containing one are left as they are,
+and so are the groups around one, however deep.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+
+from .nodes import (Literal, CharClass, Raw, Repeat, Sequence, Group,
+                    Lookaround, Alternation)
+
+
+def optimize(node):
+    """Return a node equivalent to `node` which renders a shorter regular
+    expression.::
+
+        >>> from srl.builder import Builder
+        >>> optimize(Builder().literally('a').digit().digit().node()).render()
+        'a[0-9]{2}'
+    """
+    return _optimize(node)
+
+
+def _optimize(node):
+    if type(node) is Sequence:
+        return Sequence(_sequence(node.children))
+    if isinstance(node, Group):
+        children = _sequence(node.children)
+        if node.capture:
+            return Group(children, node.name)
+        if len(children) == 1 and not _has_raw(children[0]):
+            # A raw expression may contain an alternation.
+            return children[0]
+        return Group(children, capture=False)
+    if isinstance(node, Lookaround):
+        return Lookaround(_sequence(node.children), node.ahead, node.negative)
+    if isinstance(node, Alternation):
+        return _alternation(node.children)
+    if isinstance(node, Repeat):
+        return _repeat(node)
+    return node
+
+
+def _has_raw(node):
+    # Whether `node` contains a raw expression.
+    if isinstance(node, Raw):
+        return True
+    if isinstance(node, Repeat):
+        return _has_raw(node.node)
+    return any(_has_raw(child) for child in getattr(node, 'children', ()))
+
+
+def _bare_raw(node):
+    # Whether `node` renders a raw expression without delimiters.
+    if isinstance(node, Repeat):
+        return _bare_raw(node.node)
+    return isinstance(node, Raw)
+
+
+def _char(node):
+    # Return `node` as a character class member if it matches exactly one
+    # character, otherwise None.
+    if isinstance(node, CharClass) and node.body and node.body != '.':
+        return node.body
+    if isinstance(node, Literal) and len(node.text) == 1:
+        return re.escape(node.text)
+
+
+def _is_char(node):
+    return isinstance(node, CharClass) or (
+        isinstance(node, Literal) and len(node.text) == 1)
+
+
+def _single(node):
+    # Return `(atom, min, max, greedy)` if `node` repeats one character,
+    # `greedy` being None if `node` is not quantified.
+    if isinstance(node, Repeat) and _is_char(node.node):
+        return _atom(node.node), node.min, node.max, node.greedy
+    if _is_char(node):
+        return _atom(node), 1, 1, None
+
+
+def _atom(node):
+    # Return `node` in a form a quantifier can follow.
+    if isinstance(node, Literal):
+        # An empty literal keeps its group, or the quantifier has no item.
+        return Literal(node.text, len(node.text) != 1)
+    if type(node) is Sequence:
+        if len(node.children) == 1:
+            return _atom(node.children[0])
+        return Group(node.children, capture=False)
+    if isinstance(node, (Repeat, Raw)):
+        return Group([node], capture=False)
+    return node
+
+
+def _inside(node):
+    # Optimize within `node`, keeping the delimiters around it.
+    if isinstance(node, Group):
+        return Group(_sequence(node.children), node.name, node.capture)
+    if isinstance(node, Lookaround):
+        return Lookaround(_sequence(node.children), node.ahead, node.negative)
+    if isinstance(node, Alternation):
+        return Alternation([_branch(_optimize(child)) for child in node.children])
+    if isinstance(node, Repeat):
+        return Repeat(_inside(node.node), node.min, node.max, node.greedy)
+    return node
+
+
+def _sequence(children):
+    if any(_bare_raw(child) for child in children):
+        # A raw expression may continue or quantify its neighbours.
+        return [_inside(child) for child in children]
+
+    flat = []
+    for child in children:
+        child = _optimize(child)
+        if type(child) is Sequence or isinstance(child, Group) and not child.capture:
+            if not _has_raw(child):
+                flat.extend(child.children)
+                continue
+        flat.append(child)
+
+    merged = []
+    for child in flat:
+        single = _single(child)
+        previous = merged and single and _single(merged[-1])
+        if previous and previous[0] == single[0] and (
+                None in (previous[3], single[3]) or previous[3] == single[3]):
+            greedy = single[3] if previous[3] is None else previous[3]
+            high = None if None in (previous[2], single[2]) else previous[2] + single[2]
+            merged[-1] = Repeat(single[0], previous[1] + single[1], high,
+                                greedy is not False)
+        elif isinstance(child, Literal):
+            if merged and isinstance(merged[-1], Literal):
+                merged[-1] = Literal(merged[-1].text + child.text, False)
+            else:
+                merged.append(Literal(child.text, False))
+        else:
+            merged.append(child)
+    return merged
+
+
+def _alternation(branches):
+    alternatives = []
+    texts = []
+    for branch in [_optimize(branch) for branch in branches] + [None]:
+        if isinstance(branch, Literal):
+            texts.append(branch.text)
+            continue
+        if texts:
+            alternatives.extend(_factor(texts))
+            texts = []
+        if branch is not None:
+            alternatives.append(branch)
+    return _choice(alternatives)
+
+
+def _conflict(first, second):
+    # Whether alternatives starting with `first` and `second` may match at
+    # the same position, should the pattern be case insensitive.
+    if first == second:
+        return True
+    if first > '\x7f' or second > '\x7f':
+        return True
+    return first.lower() == second.lower()
+
+
+def _factor(texts):
+    # Return alternatives matching like `texts` tried from left to right,
+    # those sharing a prefix being merged. An alternative only moves up
+    # to join an earlier one past alternatives which cannot match at the
+    # same position, so the leftmost alternative to match still wins.
+    groups = []
+    seen = set()
+    for text in texts:
+        if text in seen:
+            # Only tried if the same text already failed.
+            continue
+        seen.add(text)
+        for group in reversed(groups):
+            if group[0] == text[:1] != '':
+                group[1].append(text[1:])
+                break
+            if group[0] == '' or text == '' or _conflict(group[0], text[0]):
+                groups.append((text[:1], [text[1:]]))
+                break
+        else:
+            groups.append((text[:1], [text[1:]]))
+
+    alternatives = []
+    for head, tails in groups:
+        if len(tails) == 1:
+            alternatives.append(Literal(head + tails[0], False))
+        else:
+            alternatives.append(_prefixed(head, _choice(_factor(tails))))
+    return alternatives
+
+
+def _prefixed(head, node):
+    # Return `head` followed by `node`.
+    if isinstance(node, Literal):
+        return Literal(head + node.text, False)
+    if type(node) is Sequence and isinstance(node.children[0], Literal):
+        first = node.children[0]
+        return Sequence((Literal(head + first.text, False), ) + node.children[1:])
+    return Sequence([Literal(head, False), node])
+
+
+def _choice(alternatives):
+    # Return a node matching the first of `alternatives` which matches.
+    if len(alternatives) == 1:
+        if _has_raw(alternatives[0]):
+            return Alternation([_branch(alternatives[0])])
+        return alternatives[0]
+    members = [_char(alternative) for alternative in alternatives]
+    if alternatives and None not in members:
+        return CharClass(''.join(members))
+    empty = Literal('', False)
+    if len(alternatives) > 1 and empty in (alternatives[0], alternatives[-1]):
+        # `(?:a|b|)` is `(?:a|b)?`, and `(?:|a|b)` is `(?:a|b)??`.
+        greedy = alternatives[-1] == empty
+        rest = alternatives[:-1] if greedy else alternatives[1:]
+        if empty not in rest:
+            return Repeat(_atom(_choice(rest)), 0, 1, greedy)
+    return Alternation([_branch(alternative) for alternative in alternatives])
+
+
+def _branch(node):
+    # Alternatives are delimited by `|`, so they need no group of their own.
+    if isinstance(node, Literal):
+        return Literal(node.text, False)
+    if isinstance(node, Group) and not node.capture and not _has_raw(node):
+        return Sequence(node.children)
+    return node
+
+
+def _repeat(node):
+    if isinstance(node.node, (Repeat, Raw)):
+        # A quantifier after a quantifier or a raw expression is left for
+        # `re` to interpret, e.g. ``raw "ab", twice`` is ``ab{2}``.
+        return _inside(node)
+    inner = _optimize(node.node)
+    if (node.min, node.max) == (1, 1):
+        return _atom(inner)
+    return Repeat(_atom(inner), node.min, node.max, node.greedy)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+srl.parallel
+~~~~~~~~~~~~
+
+This module implements matching one query against many records, or the
+lines of a large file, in a pool of worker processes, each using a core
+of its own.
+
+Each worker compiles the query once, from its source, when it starts.
+Records are sent to the workers in chunks, and the results come back in
+the order of the records.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import mmap
+import multiprocessing
+import os
+import re
+from collections import deque
+
+from .match import Match
+
+DEFAULT_CHUNKSIZE = 1000
+DEFAULT_RANGE_SIZE = 1 << 24
+
+#: How many chunks per process `imap` sends ahead of the results consumed.
+PENDING = 2
+
+# The query of this worker process, the method it runs and the arguments
+# before the record.
+_worker = None
+
+
+def _initialize(options, method=None, args=()):
+    global _worker
+    from .srl import SRL
+    _worker = SRL(**options), method, args
+
+
+def _spans(match):
+    if match is not None:
+        return tuple(match.span(index) for index in range(match.re.groups + 1))
+
+
+def _run(chunk):
+    srl, method, args = _worker
+    call = getattr(srl, method)
+    if method == 'search':
+        # Match objects cannot be pickled, their spans can.
+        return [_spans(call(record)) for record in chunk]
+    return [call(*(args + (record, ))) for record in chunk]
+
+
+def _chunks(iterable, chunksize):
+    chunk = []
+    for record in iterable:
+        chunk.append(record)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _results(srl, method, chunk, results):
+    if method != 'search':
+        return results
+    return [None if spans is None else Match(srl.compiled, record, 0, len(record), spans)
+            for record, spans in zip(chunk, results)]
+
+
+def imap(srl, method, args, iterable, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield ``getattr(srl, method)(*args, record)`` for each record of
+    `iterable`, computed in `workers` processes, or in this one if
+    `workers` is 1. Matches of `search` are :class:`srl.match.Match`
+    objects. At most :data:`PENDING` chunks per process are read ahead of
+    the results consumed.
+
+    :param srl: the :class:`~srl.SRL` object
+    :param method: ``'search'``, ``'findall'`` or ``'sub'``
+    :param args: the arguments before the record, e.g. ``(repl, )``; they
+                 must be picklable
+    :param workers: the number of processes, defaults to the number of
+                    cores
+    :param chunksize: how many records to send to a process at a time
+    """
+    if workers == 1:
+        call = getattr(srl, method)
+        for record in iterable:
+            yield call(*(args + (record, )))
+        return
+
+    limit = PENDING * (workers or multiprocessing.cpu_count())
+    pending = deque()
+    pool = multiprocessing.Pool(workers, _initialize, (srl._options(), method, args))
+    try:
+        for chunk in _chunks(iterable, chunksize):
+            pending.append((chunk, pool.apply_async(_run, (chunk, ))))
+            if len(pending) < limit:
+                continue
+            chunk, result = pending.popleft()
+            for item in _results(srl, method, chunk, result.get()):
+                yield item
+        while pending:
+            chunk, result = pending.popleft()
+            for item in _results(srl, method, chunk, result.get()):
+                yield item
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _ranges(path, size):
+    # Split the file at `path` in ranges of about `size` bytes, each ending
+    # after a newline or at the end of the file.
+    total = os.path.getsize(path)
+    start = 0
+    with open(path, 'rb') as fileobj:
+        while start < total:
+            fileobj.seek(min(start + size, total) - 1)
+            # Look for the end of the line the range would end in.
+            while True:
+                chunk = fileobj.read(1 << 16)
+                index = chunk.find(b'\n')
+                if not chunk or index >= 0:
+                    break
+            end = fileobj.tell() - len(chunk) + index + 1 if chunk else total
+            yield path, start, end
+            start = end
+
+
+def _grep(task):
+    path, start, end = task
+    compiled = _worker[0].compiled
+    lines = []
+    with open(path, 'rb') as fileobj:
+        buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        # Search up to the final newline, after which `^` and `$` would
+        # match at the start of the next range, or past the last line.
+        if buffer[end - 1:end] == b'\n':
+            end -= 1
+        match = compiled.search(buffer, start, end)
+        while match:
+            begin = buffer.rfind(b'\n', start, match.start()) + 1 or start
+            stop = buffer.find(b'\n', match.start(), end)
+            stop = end if stop < 0 else stop
+            lines.append((begin, buffer[begin:stop]))
+            # Like grep, report each line once.
+            match = compiled.search(buffer, stop + 1, end) if stop < end else None
+    finally:
+        buffer.close()
+    return lines
+
+
+def grep(srl, path, workers=None, range_size=DEFAULT_RANGE_SIZE):
+    """Yield ``(offset, line)`` for the lines of the file at `path` in
+    which the bytes pattern of `srl` finds a match, in file order.
+
+    The file is split into ranges of about `range_size` bytes ending on
+    newlines, searched in place in memory maps by `workers` processes. A
+    match is searched for within a range, and reported with the line it
+    starts in, without its newline. ``begin with`` and ``must end`` match
+    at the beginning and the end of lines, as with ``multi line``.
+
+    :param srl: a :class:`~srl.SRL` object created with ``binary=True``
+    :param path: the path of the file
+    :param workers: the number of processes, defaults to the number of
+                    cores
+    :param range_size: how many bytes a process searches at a time
+    """
+    options = srl._options()
+    options['flags'] |= re.MULTILINE
+    pool = multiprocessing.Pool(workers, _initialize, (options, ))
+    try:
+        for lines in pool.imap(_grep, _ranges(path, range_size)):
+            for line in lines:
+                yield line
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+srl.parsers.descent
+~~~~~~~~~~~~~~~~~~~
+
+This module implements a hand-written recursive-descent parser for
+Simple Regex Language. It accepts exactly the queries accepted by the
+PLY parser in :mod:`srl.parsers.parse` and produces the same
+``(method, args)`` list, without per-token object allocation or
+production callbacks.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+
+from .parse import SRLSyntaxError
+
+# Kinds of items a query is made of.
+CHARACTER, ANCHOR, LOOKAROUND, QUANTIFIER, FLAG = range(5)
+
+# The grammar in `srl.parsers.parse` is ambiguous and the LALR parser
+# resolves its conflicts by shifting. At the level of items, the queries it
+# accepts form the regular language below: `_START` and `_LEADING_ANCHOR`
+# are rejecting states, a missing transition is a syntax error. For
+# instance ``digit must end if followed by "a"`` is rejected, because the
+# lookaround is shifted as the start of a new character.
+_START, _LEADING_ANCHOR, _CHARACTER, _ANCHOR, _LOOKAROUND, _QUANTIFIER = range(6)
+
+_TRANSITIONS = (
+    # _START
+    {CHARACTER: _CHARACTER, ANCHOR: _LEADING_ANCHOR, LOOKAROUND: _START},
+    # _LEADING_ANCHOR
+    {CHARACTER: _CHARACTER, ANCHOR: _ANCHOR, LOOKAROUND: _START},
+    # _CHARACTER
+    {CHARACTER: _CHARACTER, ANCHOR: _ANCHOR, LOOKAROUND: _LOOKAROUND,
+     QUANTIFIER: _QUANTIFIER, FLAG: _CHARACTER},
+    # _ANCHOR
+    {CHARACTER: _CHARACTER, ANCHOR: _ANCHOR, LOOKAROUND: _START,
+     QUANTIFIER: _QUANTIFIER, FLAG: _CHARACTER},
+    # _LOOKAROUND
+    {CHARACTER: _CHARACTER, ANCHOR: _LEADING_ANCHOR, LOOKAROUND: _START,
+     QUANTIFIER: _QUANTIFIER, FLAG: _CHARACTER},
+    # _QUANTIFIER
+    {CHARACTER: _CHARACTER, ANCHOR: _CHARACTER, LOOKAROUND: _LOOKAROUND,
+     QUANTIFIER: _QUANTIFIER, FLAG: _CHARACTER},
+)
+
+_ACCEPTING = frozenset([_CHARACTER, _ANCHOR, _LOOKAROUND, _QUANTIFIER])
+
+_scanner = None
+_ignore = None
+_keywords = {}
+
+
+def _build_lexer():
+    # Mirror the PLY lexer rules of `srl.parsers.parse`: ignored characters
+    # are skipped before each token and keywords are tried by decreasing
+    # regular expression length, as PLY orders string rules. The remaining
+    # rules start with distinct characters, so their order does not matter.
+    # `_scanner` is bound last: a thread that sees it also sees the other
+    # tables, and threads racing here only store identical values.
+    global _scanner, _ignore
+    from . import parse as grammar
+    keywords = sorted([(name[2:], value) for name, value in vars(grammar).items()
+                       if name.startswith('t_K_')],
+                      key=lambda keyword: len(keyword[1]), reverse=True)
+    # Keyword rules are plain words, apart from `times?`.
+    for name, regex in keywords:
+        _keywords[regex.rstrip('?')] = name
+        if regex.endswith('?'):
+            _keywords[regex[:-2]] = name
+    _ignore = grammar.t_ignore
+    _scanner = re.compile('[%s]*(%s)' % (re.escape(_ignore), '|'.join(
+        [regex for _, regex in keywords] + [
+            grammar.t_STRING,
+            grammar.t_NUMBER.__doc__,
+            grammar.t_newline.__doc__,
+            grammar.t_LEFT_PARENTHESIS,
+            grammar.t_RIGHT_PARENTHESIS,
+            grammar.t_CHARACTER,
+        ])))
+
+
+_SYMBOLS = {'(': 'LEFT_PARENTHESIS', ')': 'RIGHT_PARENTHESIS', '"': 'CHARACTER'}
+
+
+def tokenize(string):
+    """Split `string` into a list of token types and a list of values."""
+    if _scanner is None:
+        _build_lexer()
+    keywords = _keywords
+    types = []
+    values = []
+    # Trailing ignored characters would otherwise be matched by the
+    # single character rule once the leading `[ ,\t]*` backtracks. The
+    # string rule has inner groups, so `findall` yields tuples.
+    for match in _scanner.findall(string.rstrip(_ignore)):
+        value = match[0]
+        kind = keywords.get(value)
+        if kind is None:
+            first = value[0]
+            if first == '"' and len(value) > 1:
+                kind = 'STRING'
+            elif first == '\n':
+                continue
+            elif first.isdigit():
+                try:
+                    value = int(value)
+                    kind = 'NUMBER'
+                except ValueError:
+                    # Digits such as '²' are not matched by `\d`.
+                    kind = 'CHARACTER'
+            else:
+                kind = _SYMBOLS.get(first, 'CHARACTER')
+        types.append(kind)
+        values.append(value)
+    return types, values
+
+
+class _Parser(object):
+
+    def __init__(self, string, tokens=None):
+        if tokens is None:
+            self.types, self.values = tokenize(string)
+        else:
+            self.types = [kind for kind, _ in tokens]
+            self.values = [value for _, value in tokens]
+        self.pos = 0
+        self.end = len(self.types)
+
+    def peek(self):
+        if self.pos < self.end:
+            return self.types[self.pos]
+
+    def error(self):
+        if self.pos < self.end:
+            raise SRLSyntaxError('LexToken(%s,%r)' % (
+                self.types[self.pos], self.values[self.pos]))
+        raise SRLSyntaxError('None')
+
+    def expect(self, kind):
+        if self.pos < self.end and self.types[self.pos] == kind:
+            self.pos += 1
+            return self.values[self.pos - 1]
+        self.error()
+
+    def accept(self, kind):
+        if self.pos < self.end and self.types[self.pos] == kind:
+            self.pos += 1
+            return True
+        return False
+
+    def string(self):
+        return self.expect('STRING')[1:-1]
+
+    def sequence(self):
+        result = []
+        state = _START
+        while self.pos < self.end:
+            item = _ITEMS.get(self.types[self.pos])
+            if item is None:
+                break
+            kind, handler = item
+            state = _TRANSITIONS[state].get(kind)
+            if state is None:
+                self.error()
+            result.extend(handler(self))
+        if state not in _ACCEPTING:
+            self.error()
+        return result
+
+    def group(self):
+        if self.peek() == 'STRING':
+            return ('lambda', [('literally', (self.string(), ))])
+        self.expect('LEFT_PARENTHESIS')
+        result = self.sequence()
+        self.expect('RIGHT_PARENTHESIS')
+        return ('lambda', result)
+
+    # Characters
+
+    def literally(self):
+        self.pos += 1
+        return [('literally', (self.string(), ))]
+
+    def one_of(self):
+        self.pos += 1
+        self.expect('K_OF')
+        return [('one_of', (self.string(), ))]
+
+    def letter(self):
+        self.pos += 1
+        if self.accept('K_FROM'):
+            start = self.expect('CHARACTER')
+            self.expect('K_TO')
+            return [('letter', (start, self.expect('CHARACTER')))]
+        return [('letter', ('a', 'z'))]
+
+    def uppercase_letter(self):
+        self.pos += 1
+        self.expect('K_LETTER')
+        if self.accept('K_FROM'):
+            start = self.expect('CHARACTER')
+            self.expect('K_TO')
+            return [('letter', (start, self.expect('CHARACTER')))]
+        return [('letter', ('A', 'Z'))]
+
+    def any(self):
+        self.pos += 1
+        if self.accept('K_CHARACTER'):
+            return [('any_character', ())]
+        self.expect('K_OF')
+        return [('any_of', (self.group(), ))]
+
+    def either_of(self):
+        self.pos += 1
+        self.expect('K_OF')
+        return [('any_of', (self.group(), ))]
+
+    def no(self):
+        self.pos += 1
+        if self.accept('K_CHARACTER'):
+            return [('no_character', ())]
+        self.expect('K_WHITESPACE')
+        return [('no_whitespace', ())]
+
+    def digit(self):
+        self.pos += 1
+        if self.accept('K_FROM'):
+            start = self.expect('NUMBER')
+            self.expect('K_TO')
+            return [('digit', (start, self.expect('NUMBER')))]
+        return [('digit', (0, 9))]
+
+    def anything(self):
+        self.pos += 1
+        return [('anything', ())]
+
+    def new_line(self):
+        self.pos += 1
+        self.expect('K_LINE')
+        return [('new_line', ())]
+
+    def whitespace(self):
+        self.pos += 1
+        return [('whitespace', ())]
+
+    def tab(self):
+        self.pos += 1
+        return [('tab', ())]
+
+    def raw(self):
+        self.pos += 1
+        return [('raw', (self.string(), ))]
+
+    def capture(self):
+        self.pos += 1
+        group = self.group()
+        name = None
+        if self.accept('K_AS'):
+            name = self.string()
+        return [('capture', (group, name))]
+
+    def until(self):
+        self.pos += 1
+        return [('until', (self.group(), ))]
+
+    def non_capture(self):
+        return [('non_capture', (self.group(), ))]
+
+    # Quantifiers
+
+    def exactly(self):
+        self.pos += 1
+        count = self.expect('NUMBER')
+        self.expect('K_TIMES')
+        return [('exactly', (count, ))]
+
+    def once(self):
+        self.pos += 1
+        if self.accept('K_OR'):
+            self.expect('K_MORE')
+            return [('once_or_more', ())]
+        return [('once', ())]
+
+    def twice(self):
+        self.pos += 1
+        return [('twice', ())]
+
+    def between(self):
+        self.pos += 1
+        start = self.expect('NUMBER')
+        self.expect('K_AND')
+        end = self.expect('NUMBER')
+        self.accept('K_TIMES')
+        return [('between', (start, end))]
+
+    def optional(self):
+        self.pos += 1
+        return [('optional', ())]
+
+    def never_or_more(self):
+        self.pos += 1
+        self.expect('K_OR')
+        self.expect('K_MORE')
+        return [('never_or_more', ())]
+
+    def at_least(self):
+        self.pos += 1
+        self.expect('K_LEAST')
+        count = self.expect('NUMBER')
+        self.expect('K_TIMES')
+        return [('at_least', (count, ))]
+
+    # Flags
+
+    def case_insensitive(self):
+        self.pos += 1
+        self.expect('K_INSENSITIVE')
+        return [('case_insensitive', ())]
+
+    def multi_line(self):
+        self.pos += 1
+        self.expect('K_LINE')
+        return [('multi_line', ())]
+
+    def all_lazy(self):
+        self.pos += 1
+        self.expect('K_LAZY')
+        return [('all_lazy', ())]
+
+    # Anchors
+
+    def begin_with(self):
+        self.pos += 1
+        self.expect('K_WITH')
+        return [('begin_with', ())]
+
+    def must_end(self):
+        self.pos += 1
+        self.expect('K_END')
+        return [('must_end', ())]
+
+    # Lookarounds
+
+    def lookaround(self):
+        self.pos += 1
+        if self.accept('K_NOT'):
+            if self.accept('K_FOLLOWED'):
+                self.expect('K_BY')
+                return [('if_not_followed_by', (self.group(), ))]
+            self.expect('K_ALREADY')
+            self.expect('K_HAD')
+            return [('if_not_already_had', (self.group(), ))]
+        if self.accept('K_FOLLOWED'):
+            self.expect('K_BY')
+            return [('if_followed_by', (self.group(), ))]
+        self.expect('K_ALREADY')
+        self.expect('K_HAD')
+        return [('if_already_had', (self.group(), ))]
+
+
+# Maps the first token of an item to its kind and handler.
+_ITEMS = {
+    'K_LITERALLY': (CHARACTER, _Parser.literally),
+    'K_ONE': (CHARACTER, _Parser.one_of),
+    'K_LETTER': (CHARACTER, _Parser.letter),
+    'K_UPPERCASE': (CHARACTER, _Parser.uppercase_letter),
+    'K_ANY': (CHARACTER, _Parser.any),
+    'K_EITHER': (CHARACTER, _Parser.either_of),
+    'K_NO': (CHARACTER, _Parser.no),
+    'K_DIGIT': (CHARACTER, _Parser.digit),
+    'K_ANYTHING': (CHARACTER, _Parser.anything),
+    'K_NEW': (CHARACTER, _Parser.new_line),
+    'K_WHITESPACE': (CHARACTER, _Parser.whitespace),
+    'K_TAB': (CHARACTER, _Parser.tab),
+    'K_RAW': (CHARACTER, _Parser.raw),
+    'K_CAPTURE': (CHARACTER, _Parser.capture),
+    'K_UNTIL': (CHARACTER, _Parser.until),
+    'STRING': (CHARACTER, _Parser.non_capture),
+    'LEFT_PARENTHESIS': (CHARACTER, _Parser.non_capture),
+    'K_EXACTLY': (QUANTIFIER, _Parser.exactly),
+    'K_ONCE': (QUANTIFIER, _Parser.once),
+    'K_TWICE': (QUANTIFIER, _Parser.twice),
+    'K_BETWEEN': (QUANTIFIER, _Parser.between),
+    'K_OPTIONAL': (QUANTIFIER, _Parser.optional),
+    'K_NEVER': (QUANTIFIER, _Parser.never_or_more),
+    'K_AT': (QUANTIFIER, _Parser.at_least),
+    'K_CASE': (FLAG, _Parser.case_insensitive),
+    'K_MULTI': (FLAG, _Parser.multi_line),
+    'K_ALL': (FLAG, _Parser.all_lazy),
+    'K_BEGIN': (ANCHOR, _Parser.begin_with),
+    'K_STARTS': (ANCHOR, _Parser.begin_with),
+    'K_MUST': (ANCHOR, _Parser.must_end),
+    'K_IF': (LOOKAROUND, _Parser.lookaround),
+}
+
+
+def parse(string, tokens=None):
+    parser = _Parser(string, tokens)
+    result = parser.sequence()
+    if parser.pos < parser.end:
+        parser.error()
+    return result
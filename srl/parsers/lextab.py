@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.9). Don't edit!
+_tabversion   = '3.8'
+_lextokens    = set(('K_CASE', 'K_EXACTLY', 'K_INSENSITIVE', 'K_WITH', 'K_BEGIN', 'K_HAD', 'K_LITERALLY', 'K_ALREADY', 'K_ALL', 'K_TIMES', 'K_NEVER', 'K_AS', 'K_IF', 'K_LINE', 'K_MORE', 'NUMBER', 'K_WHITESPACE', 'K_OF', 'K_STARTS', 'K_TO', 'K_ANY', 'K_NOT', 'K_OR', 'K_NO', 'K_OPTIONAL', 'K_AT', 'K_BETWEEN', 'K_MUST', 'K_DIGIT', 'K_FOLLOWED', 'K_LAZY', 'K_LETTER', 'K_ANYTHING', 'LEFT_PARENTHESIS', 'K_MULTI', 'K_CHARACTER', 'STRING', 'CHARACTER', 'RIGHT_PARENTHESIS', 'K_TAB', 'K_END', 'K_ONE', 'K_LEAST', 'K_EITHER', 'K_UNTIL', 'K_UPPERCASE', 'K_AND', 'K_ONCE', 'K_TWICE', 'K_NEW', 'K_CAPTURE', 'K_RAW', 'K_BY', 'K_FROM'))
+_lexreflags   = 0
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>\\d+)|(?P<t_newline>\\n+)|(?P<t_STRING>\\"([^\\\\\\n]|(\\\\.))*?\\")|(?P<t_K_INSENSITIVE>insensitive)|(?P<t_K_WHITESPACE>whitespace)|(?P<t_K_CHARACTER>character)|(?P<t_K_LITERALLY>literally)|(?P<t_K_UPPERCASE>uppercase)|(?P<t_K_ANYTHING>anything)|(?P<t_K_FOLLOWED>followed)|(?P<t_K_OPTIONAL>optional)|(?P<t_K_ALREADY>already)|(?P<t_K_BETWEEN>between)|(?P<t_K_CAPTURE>capture)|(?P<t_K_EXACTLY>exactly)|(?P<t_K_EITHER>either)|(?P<t_K_LETTER>letter)|(?P<t_K_STARTS>starts)|(?P<t_K_TIMES>times?)|(?P<t_K_BEGIN>begin)|(?P<t_K_DIGIT>digit)|(?P<t_K_LEAST>least)|(?P<t_K_MULTI>multi)|(?P<t_K_NEVER>never)|(?P<t_K_TWICE>twice)|(?P<t_K_UNTIL>until)|(?P<t_K_CASE>case)|(?P<t_K_FROM>from)|(?P<t_K_LAZY>lazy)|(?P<t_K_LINE>line)|(?P<t_K_MORE>more)|(?P<t_K_MUST>must)|(?P<t_K_ONCE>once)|(?P<t_K_WITH>with)|(?P<t_K_ALL>all)|(?P<t_K_AND>and)|(?P<t_K_ANY>any)|(?P<t_K_END>end)|(?P<t_K_HAD>had)|(?P<t_K_NEW>new)|(?P<t_K_NOT>not)|(?P<t_K_ONE>one)|(?P<t_K_RAW>raw)|(?P<t_K_TAB>tab)|(?P<t_K_AS>as)|(?P<t_K_AT>at)|(?P<t_K_BY>by)|(?P<t_K_IF>if)|(?P<t_K_NO>no)|(?P<t_K_OF>of)|(?P<t_K_OR>or)|(?P<t_K_TO>to)|(?P<t_LEFT_PARENTHESIS>\\()|(?P<t_RIGHT_PARENTHESIS>\\))|(?P<t_CHARACTER>.)', [None, ('t_NUMBER', 'NUMBER'), ('t_newline', 'newline'), (None, 'STRING'), None, None, (None, 'K_INSENSITIVE'), (None, 'K_WHITESPACE'), (None, 'K_CHARACTER'), (None, 'K_LITERALLY'), (None, 'K_UPPERCASE'), (None, 'K_ANYTHING'), (None, 'K_FOLLOWED'), (None, 'K_OPTIONAL'), (None, 'K_ALREADY'), (None, 'K_BETWEEN'), (None, 'K_CAPTURE'), (None, 'K_EXACTLY'), (None, 'K_EITHER'), (None, 'K_LETTER'), (None, 'K_STARTS'), (None, 'K_TIMES'), (None, 'K_BEGIN'), (None, 'K_DIGIT'), (None, 'K_LEAST'), (None, 'K_MULTI'), (None, 'K_NEVER'), (None, 'K_TWICE'), (None, 'K_UNTIL'), (None, 'K_CASE'), (None, 'K_FROM'), (None, 'K_LAZY'), (None, 'K_LINE'), (None, 'K_MORE'), (None, 'K_MUST'), (None, 'K_ONCE'), (None, 'K_WITH'), (None, 'K_ALL'), (None, 'K_AND'), (None, 'K_ANY'), (None, 'K_END'), (None, 'K_HAD'), (None, 'K_NEW'), (None, 'K_NOT'), (None, 'K_ONE'), (None, 'K_RAW'), (None, 'K_TAB'), (None, 'K_AS'), (None, 'K_AT'), (None, 'K_BY'), (None, 'K_IF'), (None, 'K_NO'), (None, 'K_OF'), (None, 'K_OR'), (None, 'K_TO'), (None, 'LEFT_PARENTHESIS'), (None, 'RIGHT_PARENTHESIS'), (None, 'CHARACTER')])]}
+_lexstateignore = {'INITIAL': ' ,\t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
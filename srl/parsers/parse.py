@@ -9,8 +9,10 @@ This module implements Simple Regex Language parser.
 :license: MIT, see LICENSE for more details.
 """
 
-from ..utils import lex
-from ..utils import yacc
+import os
+import sys
+import copy
+import threading
 
 # List of token names.
 tokens = (
@@ -149,9 +151,6 @@ def t_error(t):
     print("Illegal character '%s'" % t.value[0])
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex()
-
 def p_character_with_quantifier(p):
     '''character : character quantifier
     '''
@@ -380,7 +379,129 @@ class SRLSyntaxError(Exception):
 def p_error(p):
     raise SRLSyntaxError(str(p))
 
-parser = yacc.yacc(debug=False)
-
-def parse(string):
-    return parser.parse(string, lexer=lexer, tracking=False)
+# The lexer and parser are built on first use so that importing `srl`
+# for the fluent `Builder` API alone does not load PLY.
+lexer = None
+parser = None
+_build_lock = threading.Lock()
+
+def build():
+    """Build the module-level lexer and parser if not built yet.
+
+    These two objects are prototypes only: PLY keeps the input position on
+    the lexer and the parse stacks on the parser, so every thread parses
+    with its own copies, see `thread_parsers`.
+
+    The lexer is loaded from the shipped `lextab` module and the parser
+    from `parsetab`, see `write_tables`. Parser tables are only
+    regenerated in memory when their signature does not match the grammar
+    above; they are never written into the installation directory.
+    """
+    global lexer, parser
+    if parser is not None:
+        return
+    with _build_lock:
+        if parser is not None:
+            return
+        from ..utils import lex
+        from ..utils import yacc
+        module = sys.modules[__name__]
+        lexer = lex.lex(module=module, optimize=True, lextab='lextab')
+        parser = yacc.yacc(module=module, debug=False, write_tables=False)
+
+_local = threading.local()
+
+def thread_parsers():
+    """Return the ``(lexer, parser)`` pair owned by the calling thread.
+
+    The copies share the compiled token regexes and LALR tables with the
+    module-level prototypes, so creating them costs a few dict copies.
+    """
+    try:
+        return _local.lexer, _local.parser
+    except AttributeError:
+        if parser is None:
+            build()
+        _local.lexer = lexer.clone()
+        _local.parser = copy.copy(parser)
+        return _local.lexer, _local.parser
+
+# Available parser backends: the PLY LALR parser defined in this module and
+# the hand-written recursive-descent parser in `srl.parsers.descent`.
+BACKENDS = ('ply', 'descent')
+default_backend = 'ply'
+
+def set_default_backend(backend):
+    """Select the parser backend used when `parse` is not given one."""
+    global default_backend
+    if backend not in BACKENDS:
+        raise ValueError('Unknown parser backend %r' % backend)
+    default_backend = backend
+
+class _Tokens(object):
+    # A lexer replaying the tokens returned by `lex`.
+
+    def __init__(self, tokens):
+        self._tokens = iter(tokens)
+
+    def input(self, string):
+        pass
+
+    def token(self):
+        return next(self._tokens, None)
+
+def lex(string, backend=None):
+    """Return the tokens of `string`, which `parse` may be given so that
+    lexing and parsing can be timed apart."""
+    backend = backend or default_backend
+    if backend == 'ply':
+        local_lexer = thread_parsers()[0]
+        local_lexer.input(string)
+        return list(iter(local_lexer.token, None))
+    if backend == 'descent':
+        from . import descent
+        return list(zip(*descent.tokenize(string)))
+    raise ValueError('Unknown parser backend %r' % backend)
+
+def parse(string, backend=None, tokens=None):
+    backend = backend or default_backend
+    if backend == 'ply':
+        local_lexer, local_parser = thread_parsers()
+        if tokens is not None:
+            local_lexer = _Tokens(tokens)
+        return local_parser.parse(string, lexer=local_lexer, tracking=False)
+    if backend == 'descent':
+        from . import descent
+        return descent.parse(string, tokens)
+    raise ValueError('Unknown parser backend %r' % backend)
+
+def tables_outdated():
+    """Return True if the shipped `lextab` and `parsetab` modules no longer
+    match the token and grammar definitions of this module."""
+    from ..utils import lex
+    from ..utils import yacc
+    from . import lextab, parsetab
+
+    module = sys.modules[__name__]
+    pinfo = yacc.ParserReflect(vars(module))
+    pinfo.get_all()
+    if parsetab._lr_signature != pinfo.signature():
+        return True
+
+    fresh = lex.lex(module=module)
+    shipped = [retext for retext, _ in lextab._lexstatere['INITIAL']]
+    return (fresh.lexstateretext['INITIAL'] != shipped or
+            fresh.lextokens != lextab._lextokens or
+            fresh.lexstateignore != lextab._lexstateignore)
+
+def write_tables(outputdir=None):
+    """Regenerate the `lextab` and `parsetab` modules shipped with the
+    package. Run through ``python setup.py build_tables``."""
+    from ..utils import lex
+    from ..utils import yacc
+
+    outputdir = outputdir or os.path.dirname(os.path.abspath(__file__))
+    module = sys.modules[__name__]
+    lex.lex(module=module).writetab('lextab', outputdir)
+    yacc.yacc(module=module, debug=False, write_tables=True,
+              outputdir=outputdir)
@@ -0,0 +1,79 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.8'
+_lr_method = 'LALR'
+_lr_signature = '46C881A355F60BA36AB4B9DE0EB3DD07'
+    
+_lr_action_items = {'K_LITERALLY':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[4,4,4,4,-35,-12,-18,-20,-22,-24,-41,4,4,-1,4,-5,4,-27,-28,-31,4,4,4,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,4,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_ONE':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[6,6,6,6,-35,-12,-18,-20,-22,-24,-41,6,6,-1,6,-5,6,-27,-28,-31,6,6,6,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,6,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_LETTER':([0,1,2,3,5,7,8,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[7,7,7,7,-35,-12,47,-18,-20,-22,-24,-41,7,7,-1,7,-5,7,-27,-28,-31,7,7,7,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,7,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_UPPERCASE':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[8,8,8,8,-35,-12,-18,-20,-22,-24,-41,8,8,-1,8,-5,8,-27,-28,-31,8,8,8,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,8,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_ANY':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[9,9,9,9,-35,-12,-18,-20,-22,-24,-41,9,9,-1,9,-5,9,-27,-28,-31,9,9,9,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,9,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_NO':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[10,10,10,10,-35,-12,-18,-20,-22,-24,-41,10,10,-1,10,-5,10,-27,-28,-31,10,10,10,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,10,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_DIGIT':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[11,11,11,11,-35,-12,-18,-20,-22,-24,-41,11,11,-1,11,-5,11,-27,-28,-31,11,11,11,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,11,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_ANYTHING':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[12,12,12,12,-35,-12,-18,-20,-22,-24,-41,12,12,-1,12,-5,12,-27,-28,-31,12,12,12,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,12,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_NEW':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[13,13,13,13,-35,-12,-18,-20,-22,-24,-41,13,13,-1,13,-5,13,-27,-28,-31,13,13,13,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,13,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_WHITESPACE':([0,1,2,3,5,7,10,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[14,14,14,14,-35,-12,51,-18,-20,-22,-24,-41,14,14,-1,14,-5,14,-27,-28,-31,14,14,14,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,14,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_TAB':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[15,15,15,15,-35,-12,-18,-20,-22,-24,-41,15,15,-1,15,-5,15,-27,-28,-31,15,15,15,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,15,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_RAW':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[16,16,16,16,-35,-12,-18,-20,-22,-24,-41,16,16,-1,16,-5,16,-27,-28,-31,16,16,16,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,16,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_CAPTURE':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[17,17,17,17,-35,-12,-18,-20,-22,-24,-41,17,17,-1,17,-5,17,-27,-28,-31,17,17,17,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,17,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_EITHER':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[19,19,19,19,-35,-12,-18,-20,-22,-24,-41,19,19,-1,19,-5,19,-27,-28,-31,19,19,19,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,19,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_UNTIL':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[20,20,20,20,-35,-12,-18,-20,-22,-24,-41,20,20,-1,20,-5,20,-27,-28,-31,20,20,20,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,20,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_BEGIN':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[21,21,21,21,-35,-12,-18,-20,-22,-24,-41,21,21,21,21,-5,21,-27,-28,-31,21,21,21,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,21,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_STARTS':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[22,22,22,22,-35,-12,-18,-20,-22,-24,-41,22,22,22,22,-5,22,-27,-28,-31,22,22,22,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,22,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_MUST':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[23,23,23,23,-35,-12,-18,-20,-22,-24,-41,23,23,23,23,-5,23,-27,-28,-31,23,23,23,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,23,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_IF':([0,1,2,3,5,7,11,12,14,15,18,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[24,24,24,24,-35,-12,-18,-20,-22,-24,-41,24,24,-1,24,-5,24,-27,-28,-31,24,24,24,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,24,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'STRING':([0,1,2,3,4,5,7,11,12,14,15,16,17,18,20,25,26,27,28,29,30,32,33,35,41,42,43,44,45,47,48,49,50,51,53,54,55,56,57,58,59,60,64,65,71,72,73,74,77,79,80,81,84,85,86,87,89,94,95,96,97,98,99,100,101,103,104,105,106,107,],[5,5,5,5,44,-35,-12,-18,-20,-22,-24,54,5,-41,5,5,5,-1,5,-5,5,-27,-28,-31,5,5,5,-10,74,-14,-16,5,-17,-23,-21,-25,-37,5,-42,-46,-47,-48,5,-9,-43,-44,-45,-11,-39,94,-40,5,5,-36,-26,-32,-33,-38,-49,5,5,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'LEFT_PARENTHESIS':([0,1,2,3,5,7,11,12,14,15,17,18,20,25,26,27,28,29,30,32,33,35,41,42,43,44,47,48,49,50,51,53,54,55,56,57,58,59,60,64,65,71,72,73,74,77,80,81,84,85,86,87,89,94,95,96,97,98,99,100,101,103,104,105,106,107,],[25,25,25,25,-35,-12,-18,-20,-22,-24,25,-41,25,25,25,-1,25,-5,25,-27,-28,-31,25,25,25,-10,-14,-16,25,-17,-23,-21,-25,-37,25,-42,-46,-47,-48,25,-9,-43,-44,-45,-11,-39,-40,25,25,-36,-26,-32,-33,-38,-49,25,25,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'$end':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[0,-35,-12,-18,-20,-22,-24,-41,-8,-1,-2,-5,-6,-27,-28,-31,-4,-3,-7,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_EXACTLY':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[31,-35,-12,-18,-20,-22,-24,-41,31,-1,-2,-5,-6,-27,-28,-31,-4,31,31,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,31,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_ONCE':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[32,-35,-12,-18,-20,-22,-24,-41,32,-1,-2,-5,-6,-27,-28,-31,-4,32,32,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,32,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_TWICE':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[33,-35,-12,-18,-20,-22,-24,-41,33,-1,-2,-5,-6,-27,-28,-31,-4,33,33,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,33,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_BETWEEN':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[34,-35,-12,-18,-20,-22,-24,-41,34,-1,-2,-5,-6,-27,-28,-31,-4,34,34,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,34,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_OPTIONAL':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[35,-35,-12,-18,-20,-22,-24,-41,35,-1,-2,-5,-6,-27,-28,-31,-4,35,35,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,35,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_NEVER':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[36,-35,-12,-18,-20,-22,-24,-41,36,-1,-2,-5,-6,-27,-28,-31,-4,36,36,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,36,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_AT':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[37,-35,-12,-18,-20,-22,-24,-41,37,-1,-2,-5,-6,-27,-28,-31,-4,37,37,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,37,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_CASE':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[38,-35,-12,-18,-20,-22,-24,-41,38,-1,-2,-5,-6,-27,-28,-31,-4,38,38,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,38,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_MULTI':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[39,-35,-12,-18,-20,-22,-24,-41,39,-1,-2,-5,-6,-27,-28,-31,-4,39,39,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,39,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_ALL':([1,5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[40,-35,-12,-18,-20,-22,-24,-41,40,-1,-2,-5,-6,-27,-28,-31,-4,40,40,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,40,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'RIGHT_PARENTHESIS':([5,7,11,12,14,15,18,26,27,28,29,30,32,33,35,41,42,43,44,47,48,50,51,53,54,55,57,58,59,60,64,65,71,72,73,74,77,80,85,86,87,89,94,95,98,99,100,101,103,104,105,106,107,],[-35,-12,-18,-20,-22,-24,-41,-8,-1,-2,-5,-6,-27,-28,-31,-4,-3,-7,-10,-14,-16,-17,-23,-21,-25,-37,-42,-46,-47,-48,85,-9,-43,-44,-45,-11,-39,-40,-36,-26,-32,-33,-38,-49,-51,-30,-34,-13,-19,-50,-52,-29,-15,]),'K_AS':([5,55,85,],[-35,79,-36,]),'K_OF':([6,9,19,],[45,49,56,]),'K_FROM':([7,11,47,],[46,52,76,]),'K_CHARACTER':([9,10,],[48,50,]),'K_LINE':([13,39,],[53,72,]),'K_WITH':([21,22,],[58,59,]),'K_END':([23,],[60,]),'K_FOLLOWED':([24,62,],[61,82,]),'K_NOT':([24,],[62,]),'K_ALREADY':([24,62,],[63,83,]),'NUMBER':([31,34,52,70,88,93,],[66,68,78,90,99,103,]),'K_OR':([32,36,],[67,69,]),'K_LEAST':([37,],[70,]),'K_INSENSITIVE':([38,],[71,]),'K_LAZY':([40,],[73,]),'CHARACTER':([46,76,91,102,],[75,92,101,107,]),'K_BY':([61,82,],[81,96,]),'K_HAD':([63,83,],[84,97,]),'K_TIMES':([66,90,99,],[86,100,106,]),'K_MORE':([67,69,],[87,89,]),'K_AND':([68,],[88,]),'K_TO':([75,78,92,],[91,93,102,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'character':([0,1,2,3,25,26,28,30,41,42,43,64,],[1,26,42,43,64,26,42,43,42,26,26,26,]),'anchor':([0,1,2,3,25,26,27,28,30,41,42,43,64,],[2,28,41,2,2,28,65,41,2,41,28,28,28,]),'lookaround':([0,1,2,3,25,26,28,30,41,42,43,64,],[3,30,3,3,3,30,3,3,3,30,30,30,]),'group':([0,1,2,3,17,20,25,26,28,30,41,42,43,49,56,64,81,84,96,97,],[18,18,18,18,55,57,18,18,18,18,18,18,18,77,80,18,95,98,104,105,]),'quantifier':([1,26,42,43,64,],[27,27,27,27,27,]),'flag':([1,26,42,43,64,],[29,29,29,29,29,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> character","S'",1,None,None,None),
+  ('character -> character quantifier','character',2,'p_character_with_quantifier','parse.py',155),
+  ('character -> character anchor','character',2,'p_character_with_anchor','parse.py',162),
+  ('character -> anchor character','character',2,'p_character_with_anchor','parse.py',163),
+  ('character -> anchor anchor','character',2,'p_character_with_anchor','parse.py',164),
+  ('character -> character flag','character',2,'p_character_with_anchor','parse.py',165),
+  ('character -> character lookaround','character',2,'p_character_with_anchor','parse.py',166),
+  ('character -> lookaround character','character',2,'p_character_with_anchor','parse.py',167),
+  ('character -> character character','character',2,'p_character_with_anchor','parse.py',168),
+  ('character -> character quantifier anchor','character',3,'p_character_with_quantfier_and_anchor','parse.py',175),
+  ('character -> K_LITERALLY STRING','character',2,'p_character_literally','parse.py',183),
+  ('character -> K_ONE K_OF STRING','character',3,'p_character_one_of','parse.py',187),
+  ('character -> K_LETTER','character',1,'p_character_letter','parse.py',191),
+  ('character -> K_LETTER K_FROM CHARACTER K_TO CHARACTER','character',5,'p_character_letter','parse.py',192),
+  ('character -> K_UPPERCASE K_LETTER','character',2,'p_character_uppercase_letter','parse.py',204),
+  ('character -> K_UPPERCASE K_LETTER K_FROM CHARACTER K_TO CHARACTER','character',6,'p_character_uppercase_letter','parse.py',205),
+  ('character -> K_ANY K_CHARACTER','character',2,'p_character_any_character','parse.py',217),
+  ('character -> K_NO K_CHARACTER','character',2,'p_character_no_character','parse.py',221),
+  ('character -> K_DIGIT','character',1,'p_character_digit','parse.py',225),
+  ('character -> K_DIGIT K_FROM NUMBER K_TO NUMBER','character',5,'p_character_digit','parse.py',226),
+  ('character -> K_ANYTHING','character',1,'p_character_anything','parse.py',238),
+  ('character -> K_NEW K_LINE','character',2,'p_character_new_line','parse.py',242),
+  ('character -> K_WHITESPACE','character',1,'p_character_whitespace','parse.py',246),
+  ('character -> K_NO K_WHITESPACE','character',2,'p_character_no_whitespace','parse.py',251),
+  ('character -> K_TAB','character',1,'p_character_tab','parse.py',255),
+  ('character -> K_RAW STRING','character',2,'p_character_raw','parse.py',259),
+  ('quantifier -> K_EXACTLY NUMBER K_TIMES','quantifier',3,'p_quantifier_exactly_x_times','parse.py',263),
+  ('quantifier -> K_ONCE','quantifier',1,'p_quantifier_once','parse.py',267),
+  ('quantifier -> K_TWICE','quantifier',1,'p_quantifier_twice','parse.py',271),
+  ('quantifier -> K_BETWEEN NUMBER K_AND NUMBER K_TIMES','quantifier',5,'p_quantifier_between_x_and_y_times','parse.py',275),
+  ('quantifier -> K_BETWEEN NUMBER K_AND NUMBER','quantifier',4,'p_quantifier_between_x_and_y_times','parse.py',276),
+  ('quantifier -> K_OPTIONAL','quantifier',1,'p_quantifier_optional','parse.py',281),
+  ('quantifier -> K_ONCE K_OR K_MORE','quantifier',3,'p_quantifier_once_or_more','parse.py',285),
+  ('quantifier -> K_NEVER K_OR K_MORE','quantifier',3,'p_quantifier_never_or_more','parse.py',289),
+  ('quantifier -> K_AT K_LEAST NUMBER K_TIMES','quantifier',4,'p_quantifier_at_least_x_times','parse.py',293),
+  ('group -> STRING','group',1,'p_group_string','parse.py',298),
+  ('group -> LEFT_PARENTHESIS character RIGHT_PARENTHESIS','group',3,'p_group_subquery','parse.py',302),
+  ('character -> K_CAPTURE group','character',2,'p_character_capture','parse.py',306),
+  ('character -> K_CAPTURE group K_AS STRING','character',4,'p_character_capture_as','parse.py',310),
+  ('character -> K_ANY K_OF group','character',3,'p_group_any_of','parse.py',314),
+  ('character -> K_EITHER K_OF group','character',3,'p_group_any_of','parse.py',315),
+  ('character -> group','character',1,'p_group_non_capture','parse.py',320),
+  ('character -> K_UNTIL group','character',2,'p_group_until','parse.py',324),
+  ('flag -> K_CASE K_INSENSITIVE','flag',2,'p_flag_case_insensitive','parse.py',329),
+  ('flag -> K_MULTI K_LINE','flag',2,'p_flag_multi_line','parse.py',334),
+  ('flag -> K_ALL K_LAZY','flag',2,'p_flag_all_lazy','parse.py',339),
+  ('anchor -> K_BEGIN K_WITH','anchor',2,'p_anchor_begin_with','parse.py',344),
+  ('anchor -> K_STARTS K_WITH','anchor',2,'p_anchor_begin_with','parse.py',345),
+  ('anchor -> K_MUST K_END','anchor',2,'p_anchor_must_end','parse.py',353),
+  ('lookaround -> K_IF K_FOLLOWED K_BY group','lookaround',4,'p_lookaround_if_followed_by','parse.py',361),
+  ('lookaround -> K_IF K_NOT K_FOLLOWED K_BY group','lookaround',5,'p_lookaround_if_not_followed_by','parse.py',365),
+  ('lookaround -> K_IF K_ALREADY K_HAD group','lookaround',4,'p_lookaround_if_already_had','parse.py',369),
+  ('lookaround -> K_IF K_NOT K_ALREADY K_HAD group','lookaround',5,'p_lookaround_if_not_already_had','parse.py',373),
+]
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+srl.profiling
+~~~~~~~~~~~~~
+
+This module implements the statistics of queries created with
+``SRL(query, profile=True)``, whose matching methods record how often and
+how long they run::
+
+    >>> from srl import SRL, profiling
+    >>> profiling.reset()
+    >>> srl = SRL('digit once or more', profile=True)
+    >>> srl.findall('1 22 333')
+    ['1', '22', '333']
+    >>> stats = profiling.report()[0]
+    >>> stats.query, stats.calls, stats.size, stats.methods
+    ('digit once or more', 1, 8, {'findall': 1})
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import threading
+import timeit
+
+#: The methods recorded.
+METHODS = ('search', 'match', 'findall', 'finditer', 'sub')
+
+
+class PatternStats(object):
+    """The statistics of one query.
+
+    :ivar query: the query
+    :ivar calls: the number of calls
+    :ivar total: the time spent in them, in seconds
+    :ivar worst: the time of the slowest call
+    :ivar size: the total length of the strings searched
+    :ivar methods: the number of calls of each method
+    """
+
+    def __init__(self, query):
+        self.query = query
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.size = 0
+        self.methods = {}
+
+    @property
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+    def __repr__(self):
+        return '<PatternStats %r calls=%d total=%.6fs worst=%.6fs>' % (
+            self.query, self.calls, self.total, self.worst)
+
+
+class Profiler(object):
+    """Collects the :class:`PatternStats` of profiled queries."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, query, method, size, duration):
+        with self._lock:
+            stats = self._stats.get(query)
+            if stats is None:
+                stats = self._stats[query] = PatternStats(query)
+            stats.calls += 1
+            stats.total += duration
+            stats.worst = max(stats.worst, duration)
+            stats.size += size
+            stats.methods[method] = stats.methods.get(method, 0) + 1
+
+    def extend(self, query, duration, elapsed):
+        """Add `duration` to the last call of `query`, which has taken
+        `elapsed` seconds so far."""
+        with self._lock:
+            stats = self._stats.get(query)
+            if stats is not None:
+                stats.total += duration
+                stats.worst = max(stats.worst, elapsed)
+
+    def report(self):
+        """Return the statistics of each query, by decreasing total time."""
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda stats: -stats.total)
+
+    def reset(self):
+        """Forget all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def wrap(self, query, name, method):
+        """Return `method` recording its calls under `query`."""
+        record = self.record
+        timer = timeit.default_timer
+        index = 1 if name == 'sub' else 0
+
+        def size(args, kwargs):
+            string = args[index] if len(args) > index else kwargs.get('string', '')
+            return len(string)
+
+        def profiled(*args, **kwargs):
+            start = timer()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                elapsed = timer() - start
+                record(query, name, size(args, kwargs), elapsed)
+            if name == 'finditer':
+                return _Iterator(self.extend, query, result, elapsed)
+            return result
+        return profiled
+
+
+class _Iterator(object):
+    # The call is recorded when the iterator is created, so an iterator
+    # never exhausted still counts; each step adds its own time to it,
+    # leaving out the time the caller spends between steps.
+
+    def __init__(self, extend, query, iterator, elapsed):
+        self._extend = extend
+        self._query = query
+        self._iterator = iterator
+        self._elapsed = elapsed
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = timeit.default_timer()
+        try:
+            return next(self._iterator)
+        finally:
+            duration = timeit.default_timer() - start
+            self._elapsed += duration
+            self._extend(self._query, duration, self._elapsed)
+
+    next = __next__
+
+
+profiler = Profiler()
+
+
+def report():
+    """Return the :class:`PatternStats` of the profiled queries, by
+    decreasing total time."""
+    return profiler.report()
+
+
+def reset():
+    """Forget the statistics of the profiled queries."""
+    profiler.reset()
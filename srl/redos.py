@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+srl.redos
+~~~~~~~~~
+
+This module implements a static check of queries for catastrophic
+backtracking, to run before untrusted queries are used::
+
+    >>> analyze('capture (letter once or more) once or more').score
+    10
+    >>> analyze('capture (letter once or more, literally ";") once or more').score
+    0
+
+The node tree of the query, see :mod:`srl.nodes`, is searched for:
+
+- ``nested``: a quantifier inside an unbounded one, whose item may be
+  followed by more of the same characters, e.g. ``(?:[a-z]+)+`` or
+  ``(?:a?a)+``. The
+  `re` engine may try exponentially many ways to split a string between
+  them before failing.
+- ``alternation``: an alternation inside an unbounded quantifier whose
+  alternatives may start with the same character, e.g. ``(?:\\w|[0-9])+``,
+  or, for literals, one is a prefix of the other, e.g. ``(?:a|aa)+``; also
+  exponential.
+- ``adjacent``: an unbounded quantifier followed, possibly past optional
+  items, by another one which may match the same characters, e.g.
+  ``[0-9]+[0-9]*``, polynomial in the length of the string.
+
+The check is a heuristic: characters are compared on a sample of ASCII and
+a few non-ASCII characters, alternatives by their first character or their
+common prefix, and raw expressions are taken as one character of any kind.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+from collections import namedtuple
+
+from ._compat import string_types
+from .builder import Builder
+from .nodes import (Literal, CharClass, Raw, Anchor, Repeat, Lookaround,
+                    Alternation, Sequence)
+from .parsers.parse import parse
+
+#: The score of each rule; ``adjacent`` repeats are polynomial, the others
+#: exponential.
+WEIGHTS = {'nested': 10, 'alternation': 10, 'adjacent': 1}
+
+#: A match of `rule` in the part of the query rendered to `regex`.
+Finding = namedtuple('Finding', 'rule regex')
+
+_SAMPLE = [chr(code) for code in range(128)] + [u'\xe9', u'Ā', u'一']
+_ANY = frozenset(_SAMPLE)
+_NONE = frozenset()
+
+
+class Analysis(object):
+    """The findings of :func:`analyze`.
+
+    :ivar findings: the list of :class:`Finding`
+    """
+
+    def __init__(self, findings):
+        self.findings = findings
+
+    @property
+    def score(self):
+        """The sum of the :data:`WEIGHTS` of the findings, 0 if none."""
+        return sum(WEIGHTS[finding.rule] for finding in self.findings)
+
+    @property
+    def rules(self):
+        return sorted(set(finding.rule for finding in self.findings))
+
+    def __repr__(self):
+        return '<Analysis score=%d %r>' % (self.score, self.findings)
+
+
+def analyze(query, flags=0, backend=None):
+    """Return the :class:`Analysis` of `query`, a string of Simple Regex
+    Language or its parsed ``(method, args)`` list."""
+    parsed = parse(query, backend) if isinstance(query, string_types) else query
+    builder = Builder.build(parsed, flags)
+    return analyze_node(builder.node(), builder.flags)
+
+
+def analyze_node(node, flags=0):
+    """Return the :class:`Analysis` of a node tree matched with the `re`
+    `flags`."""
+    analyzer = _Analyzer(flags)
+    analyzer.visit(node, (_NONE, _NONE), False)
+    return Analysis(analyzer.findings)
+
+
+class _Analyzer(object):
+
+    def __init__(self, flags):
+        self.flags = flags
+        self.findings = []
+        self._chars = {}
+
+    def chars(self, regex):
+        # The sample characters `regex`, one character long, matches.
+        chars = self._chars.get(regex)
+        if chars is None:
+            compiled = re.compile(regex, self.flags)
+            chars = self._chars[regex] = frozenset(
+                char for char in _SAMPLE if compiled.match(char))
+        return chars
+
+    def first(self, node):
+        # Return ``(chars, repeated, nullable)``: the characters a match
+        # of `node` may start with, those of them an unbounded quantifier
+        # consumes, and whether it may match the empty string.
+        if isinstance(node, Literal):
+            if not node.text:
+                return _NONE, _NONE, True
+            return self.chars(re.escape(node.text[0])), _NONE, False
+        if isinstance(node, CharClass):
+            return self.chars(node.render()), _NONE, False
+        if isinstance(node, Raw):
+            return _ANY, _NONE, False
+        if isinstance(node, (Anchor, Lookaround)):
+            return _NONE, _NONE, True
+        if isinstance(node, Repeat):
+            chars, repeated, nullable = self.first(node.node)
+            if node.max is None:
+                repeated = chars
+            return chars, repeated, nullable or node.min == 0
+        if isinstance(node, Alternation):
+            chars = repeated = _NONE
+            nullable = False
+            for child in node.children:
+                first = self.first(child)
+                chars, repeated = chars | first[0], repeated | first[1]
+                nullable = nullable or first[2]
+            return chars, repeated, nullable
+        if isinstance(node, Sequence):
+            chars = repeated = _NONE
+            for child in node.children:
+                first = self.first(child)
+                chars, repeated = chars | first[0], repeated | first[1]
+                if not first[2]:
+                    return chars, repeated, False
+            return chars, repeated, True
+        return _NONE, _NONE, True
+
+    def visit(self, node, after, looped):
+        # Check `node`, which may be followed by `after`, the result of
+        # `first` without its last item, inside an unbounded quantifier
+        # if `looped`.
+        if isinstance(node, Lookaround):
+            self.sequence(node.children, (_NONE, _NONE), looped)
+        elif isinstance(node, Alternation):
+            if looped:
+                self.alternation(node)
+            for child in node.children:
+                self.visit(child, after, looped)
+        elif isinstance(node, Sequence):
+            self.sequence(node.children, after, looped)
+        elif isinstance(node, Repeat):
+            self.repeat(node, after, looped)
+
+    def sequence(self, children, after, looped):
+        for child in reversed(children):
+            self.visit(child, after, looped)
+            chars, repeated, nullable = self.first(child)
+            if nullable:
+                after = (after[0] | chars, after[1] | repeated)
+            else:
+                after = (chars, repeated)
+
+    def repeat(self, node, after, looped):
+        chars, repeated = self.first(node.node)[:2]
+        if looped and node.min != node.max and chars & after[0]:
+            # Within a loop, even ``a?a`` may split a string two ways.
+            self.findings.append(Finding('nested', node.render()))
+        elif node.max is None and chars & after[1]:
+            self.findings.append(Finding('adjacent', node.render()))
+        if node.max is None or node.max > 1:
+            # The item may be followed by its next repetition.
+            after = (after[0] | chars, after[1] | repeated)
+        self.visit(node.node, after, looped or node.max is None)
+
+    def alternation(self, node):
+        children = node.children
+        for index, child in enumerate(children):
+            for other in children[index + 1:]:
+                if self.overlap(child, other):
+                    self.findings.append(Finding('alternation', node.render()))
+                    return
+
+    def overlap(self, first, second):
+        # Whether two alternatives may match the same string.
+        if isinstance(first, Literal) and isinstance(second, Literal):
+            # ``a|aa`` splits ``aa`` two ways, ``ab|ac`` splits nothing.
+            first, second = sorted([first.text, second.text], key=len)
+            if self.flags & re.IGNORECASE:
+                first, second = first.lower(), second.lower()
+            return second.startswith(first)
+        return bool(self.first(first)[0] & self.first(second)[0])
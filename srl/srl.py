@@ -9,7 +9,15 @@ This module implements Simple Regex Language object.
 :license: MIT, see LICENSE for more details.
 """
 
+import threading
+
 from .builder import Builder
+from .dfa import DFA, METHODS as DFA_METHODS
+from . import optimizer
+from .literal import LiteralPattern, Prefilter, METHODS, required
+from .stream import DEFAULT_CHUNK_SIZE, finditer_stream, scan_file
+from .parallel import DEFAULT_CHUNKSIZE, imap
+from . import profiling, timeout as _timeout
 
 class SRL(object):
     """The SRL object implements Simple Regex Language and acts as
@@ -22,12 +30,185 @@ class SRL(object):
         from srl import SRL
         srl = SRL('letter from a to f')
 
+    Case insensitive or ``must end`` queries which reduce to a fixed
+    string, such as ``literally "error", case insensitive``, are matched on
+    long strings with string methods instead of the `re` engine. Their
+    `search`, `match`, `findall`, `sub` and `split` return the same results,
+    with :class:`srl.match.Match` objects in place of `re` match objects.
+
+    Case sensitive queries skip the `re` engine in `search` and `findall`
+    on long strings which lack one of their :attr:`required_literals`.
+
+    Compiled queries are shared through a process-wide cache, see
+    :func:`srl.purge` and :func:`srl.set_cache_size`. With `lazy`, the
+    query is parsed and compiled on first use instead, once even if several
+    threads use it at the same time; an invalid query raises then.
+
+    With `profile`, the calls of `search`, `match`, `findall`, `finditer`
+    and `sub` are timed and reported by :func:`srl.profiling.report`.
+
+    With `timeout`, the matching methods run in a worker process and raise
+    :class:`srl.errors.PregBacktrackLimitError` when they take longer, see
+    :mod:`srl.timeout`. They also take a `timeout` keyword argument of
+    their own. :meth:`call_with_timeout` runs a single call with a time
+    limit, with or without `timeout`.
+
+    With ``engine='dfa'``, `search`, `match`, `fullmatch`, `findall`,
+    `finditer` and `sub` run in time linear in the length of the string,
+    see :mod:`srl.dfa`; queries the engine cannot run use `re`.
+
     :param srl: the string of Simple Regex Language
+    :param flags: extra `re` flags combined with the query's own flags
+    :param optimize: compile the shorter, equivalent regular expression of
+                     :func:`srl.optimizer.optimize`
+    :param binary: compile a bytes pattern, which matches `bytes`,
+                   `bytearray` and `memoryview` objects
+    :param encoding: the encoding of non-ASCII literals in a bytes pattern,
+                     see :func:`srl.nodes.encode`
+    :param lazy: compile the query on first use
+    :param profile: record the statistics of the matching methods
+    :param timeout: the time limit of the matching methods, in seconds
+    :param engine: ``'re'``, or ``'dfa'`` for the linear time engine
     """
 
-    def __init__(self, srl=None):
+    def __init__(self, srl=None, flags=0, optimize=False, binary=False,
+                 encoding='utf-8', lazy=False, profile=False, timeout=None,
+                 engine='re'):
         self.srl = srl
-        self.compiled = Builder.parse(srl)
+        self._flags = flags
+        self._optimize = optimize
+        self._binary = binary
+        self._encoding = encoding
+        self._profile = profile
+        self._timeout = timeout
+        self._engine = engine
+        if lazy:
+            # Held until the query is compiled, by the first attribute
+            # lookup `__getattr__` gets.
+            self._lock = threading.Lock()
+        else:
+            self._compile()
+
+    def _compile(self):
+        compiled, parsed = Builder.compile_query(
+            self.srl, self._flags, optimize=self._optimize,
+            binary=self._binary, encoding=self._encoding)
+        # Published together, so that another thread sees either none of
+        # the attributes or all of them.
+        attributes = {'compiled': compiled}
+        literals = required(parsed)
+        if self._binary:
+            literals = tuple(literal.encode(self._encoding) for literal in literals)
+            literal = None
+        else:
+            literal = LiteralPattern.from_query(compiled, parsed)
+        #: Literals every match contains, see :func:`srl.literal.required`,
+        #: encoded with `encoding` for a bytes pattern.
+        attributes['required_literals'] = literals
+        if literal is not None:
+            for method in METHODS:
+                attributes[method] = getattr(literal, method)
+        else:
+            prefilter = Prefilter.from_query(compiled, literals)
+            if prefilter is not None:
+                attributes['search'] = prefilter.search
+                attributes['findall'] = prefilter.findall
+        if self._engine == 'dfa':
+            node = Builder.build(parsed, self._flags).node()
+            if self._optimize:
+                node = optimizer.optimize(node)
+            dfa = DFA.from_query(compiled, node)
+            if dfa is not None:
+                for method in DFA_METHODS:
+                    if hasattr(compiled, method):
+                        attributes[method] = getattr(dfa, method)
+        for method in _timeout.METHODS:
+            if method not in attributes and hasattr(compiled, method):
+                # Found without going through `__getattr__`.
+                attributes[method] = getattr(compiled, method)
+        if self._timeout is not None:
+            for method in _timeout.METHODS:
+                if hasattr(compiled, method):
+                    attributes[method] = _timeout.wrap(self, method, self._timeout)
+        if self._profile:
+            for method in profiling.METHODS:
+                bound = attributes.get(method) or getattr(compiled, method)
+                attributes[method] = profiling.profiler.wrap(self.srl, method, bound)
+        self.__dict__.update(attributes)
+
+    def __reduce__(self):
+        """SRL objects pickle as their source and options, and compile
+        again, through the cache, when first used after being unpickled.::
+
+            >>> import pickle
+            >>> pickle.loads(pickle.dumps(SRL('digit'))).match('1').group()
+            '1'
+        """
+        return type(self), (self.srl, self._flags, self._optimize, self._binary,
+                     self._encoding, True, self._profile, self._timeout,
+                     self._engine)
+
+    def _options(self):
+        # The arguments this object was created with.
+        return dict(srl=self.srl, flags=self._flags, optimize=self._optimize,
+                    binary=self._binary, encoding=self._encoding,
+                    engine=self._engine)
+
+    def call_with_timeout(self, method, timeout, *args, **kwargs):
+        """Return the result of the matching `method` called with `args`
+        and `kwargs`, run in a worker process, or raise
+        :class:`srl.errors.PregBacktrackLimitError` if it takes more than
+        `timeout` seconds, see :func:`srl.timeout.call`.::
+
+            >>> SRL('digit').call_with_timeout('search', 5, 'a1').group()
+            '1'
+        """
+        return _timeout.call(self, method, args, kwargs, timeout)
+
+    def map_search(self, iterable, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Iterate over the result of `search` on each record of `iterable`,
+        in order, searched by `workers` processes, see
+        :func:`srl.parallel.imap`. Matches are :class:`srl.match.Match`
+        objects.::
+
+            >>> srl = SRL('digit once or more')
+            >>> [m and m.group() for m in srl.map_search(['a1', 'b', '22'], 2)]
+            ['1', None, '22']
+        """
+        return imap(self, 'search', (), iterable, workers, chunksize)
+
+    def map_findall(self, iterable, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Iterate over the result of `findall` on each record of
+        `iterable`, in order, like :meth:`map_search`."""
+        return imap(self, 'findall', (), iterable, workers, chunksize)
+
+    def map_sub(self, repl, iterable, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+        """Iterate over the result of `sub` with `repl` on each record of
+        `iterable`, in order, like :meth:`map_search`. A callable `repl`
+        must be picklable, e.g. a module-level function."""
+        return imap(self, 'sub', (repl, ), iterable, workers, chunksize)
+
+    def finditer_stream(self, fileobj, chunk_size=DEFAULT_CHUNK_SIZE,
+                        max_match=None):
+        """Iterate over the matches in the file-like object `fileobj`
+        without reading it whole, see :func:`srl.stream.finditer_stream`.
+        Match offsets are counted from the start of the stream.::
+
+            >>> from io import StringIO
+            >>> srl = SRL('digit exactly 2 times')
+            >>> [m.span() for m in srl.finditer_stream(StringIO(u'1 23 456'), 2)]
+            [(2, 4), (5, 7)]
+        """
+        return finditer_stream(self.compiled, fileobj, chunk_size, max_match)
+
+    def scan_file(self, path, encoding='utf-8'):
+        """Iterate over ``(offset, match)`` for the matches in the file at
+        `path`, memory-mapped and searched as bytes without copying it, see
+        :func:`srl.stream.scan_file`. Non-ASCII literals are searched for
+        encoded with `encoding`."""
+        compiled = Builder.compile_query(self.srl, self._flags, optimize=self._optimize,
+                                         binary=True, encoding=encoding)[0]
+        return scan_file(compiled, path)
 
     def __str__(self):
         """str(srl): regex pattern of compiled Simple Regex Language.::
@@ -43,4 +224,17 @@ class SRL(object):
             >>> srl = SRL('digit exactly 3 times')
             >>> assert srl.match('012').group(0) == '012'
         """
+        if method.startswith('__'):
+            # Special methods such as `__deepcopy__` are not forwarded.
+            raise AttributeError(method)
+        lock = self.__dict__.get('_lock')
+        if lock is not None:
+            with lock:
+                if '_lock' in self.__dict__:
+                    self._compile()
+                    del self._lock
+            return getattr(self, method)
+        if method == 'compiled':
+            # Not compiled yet, while being copied or unpickled.
+            raise AttributeError(method)
         return getattr(self.compiled, method)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+srl.srlset
+~~~~~~~~~~
+
+This module implements matching many Simple Regex Language queries
+against the same strings.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+import sys
+from collections import OrderedDict
+
+from .srl import SRL
+
+
+class SRLSet(object):
+    """A set of Simple Regex Language queries, each identified by an id,
+    which are searched for in a string at once::
+
+        >>> rules = SRLSet([('ms', 'digit once or more, literally "ms"'),
+        ...                 ('error', 'literally "ERROR"')])
+        >>> rules.search('served in 12ms')
+        ['ms']
+        >>> rules.captures('served in 12ms')['ms'].group()
+        '12ms'
+
+    Queries are grouped by the longest of their
+    :attr:`~srl.SRL.required_literals`: a single substring search per
+    distinct literal rules out every query of the group, so only queries
+    whose literals occur in the string run the `re` engine.
+
+    :param rules: a mapping or a sequence of ``(id, query)`` pairs
+    :param flags: extra `re` flags for every query
+    """
+
+    def __init__(self, rules=(), flags=0):
+        self.flags = flags
+        self._rules = OrderedDict()
+        self._groups = None
+        if hasattr(rules, 'items'):
+            rules = rules.items()
+        for id, query in rules:
+            self.add(id, query)
+
+    def add(self, id, query):
+        """Add `query`, a string or an :class:`~srl.SRL`, under `id`,
+        replacing the query with the same id."""
+        if not isinstance(query, SRL):
+            query = SRL(query, self.flags)
+        self._rules[id] = query
+        self._groups = None
+
+    def remove(self, id):
+        """Remove the query with `id`."""
+        del self._rules[id]
+        self._groups = None
+
+    def _build(self):
+        groups = OrderedDict()
+        unfiltered = []
+        for index, (id, rule) in enumerate(self._rules.items()):
+            entry = (index, id, rule.search)
+            if rule.required_literals and not rule.flags & re.IGNORECASE:
+                groups.setdefault(rule.required_literals[0], []).append(entry)
+            else:
+                unfiltered.append(entry)
+        self._groups = list(groups.items()), unfiltered
+        return self._groups
+
+    def _search(self, string, pos, endpos):
+        groups, unfiltered = self._groups or self._build()
+        matched = []
+        for literal, rules in groups:
+            if literal in string:
+                for index, id, search in rules:
+                    match = search(string, pos, endpos)
+                    if match:
+                        matched.append((index, id, match))
+        for index, id, search in unfiltered:
+            match = search(string, pos, endpos)
+            if match:
+                matched.append((index, id, match))
+        matched.sort(key=lambda found: found[0])
+        return matched
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        """Return the ids of the queries found in `string`, in the order
+        the queries were added."""
+        return [id for _, id, _ in self._search(string, pos, endpos)]
+
+    def captures(self, string, pos=0, endpos=sys.maxsize):
+        """Return an ordered mapping of the ids of the queries found in
+        `string` to their match objects."""
+        return OrderedDict((id, match) for _, id, match
+                           in self._search(string, pos, endpos))
+
+    def __getstate__(self):
+        # The groups hold bound methods, built again on the next search.
+        state = self.__dict__.copy()
+        state['_groups'] = None
+        return state
+
+    def __getitem__(self, id):
+        return self._rules[id]
+
+    def __contains__(self, id):
+        return id in self._rules
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def __len__(self):
+        return len(self._rules)
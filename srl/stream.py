@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+srl.stream
+~~~~~~~~~~
+
+This module implements searching file-like objects chunk by chunk, and
+files mapped in memory.
+
+Consecutive chunks overlap by the number of characters the `re` engine may
+examine around a match, so a match spanning a chunk boundary is found
+once, in the chunk holding all of it.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import mmap
+
+from ._compat import sre_parse
+from .match import Match
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT,
+            getattr(sre_parse, 'POSSESSIVE_REPEAT', None))
+_GROUPS = (sre_parse.SUBPATTERN, getattr(sre_parse, 'ATOMIC_GROUP', None))
+# The parser state a subpattern belongs to, named `Pattern` before 3.8.
+_State = getattr(sre_parse, 'State', None) or sre_parse.Pattern
+
+
+def _width(items):
+    # The maximum width of `items`, None if unbounded.
+    width = sre_parse.SubPattern(_State(), list(items)).getwidth()[1]
+    if width >= sre_parse.MAXREPEAT:
+        return None
+    return width
+
+
+def _items(op, av):
+    # The subpatterns an item contains.
+    if op in _GROUPS:
+        return [av[-1]]
+    if op in _REPEATS:
+        return [av[2]]
+    if op is sre_parse.BRANCH:
+        return av[1]
+    if op is sre_parse.GROUPREF_EXISTS:
+        return [items for items in av[1:] if items is not None]
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return [av[1]]
+    return []
+
+
+def _ahead(items):
+    # The number of characters from the start of `items` the engine may
+    # examine, None if unbounded.
+    reach = offset = 0
+    for op, av in items:
+        if op is sre_parse.AT:
+            # `$` looks for the end past a final newline.
+            item = 2 if av is sre_parse.AT_END else 1
+        elif op is sre_parse.GROUPREF:
+            item = None
+        elif op in _REPEATS:
+            width, inner = _width(av[2]), _ahead(av[2])
+            if av[1] >= sre_parse.MAXREPEAT or None in (width, inner):
+                return None
+            item = max(av[1] - 1, 0) * width + inner
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            inner = _ahead(av[1])
+            if inner is None:
+                return None
+            item = inner if av[0] == 1 else max(inner - _width(av[1]), 0)
+        elif _items(op, av):
+            item = 0
+            for inner in _items(op, av):
+                inner = _ahead(inner)
+                if inner is None:
+                    return None
+                item = max(item, inner)
+        else:
+            item = _width([(op, av)])
+        if item is None or offset is None:
+            return None
+        reach = max(reach, offset + item)
+        width = _width([(op, av)])
+        offset = None if width is None else offset + width
+    return reach
+
+
+def _behind(items):
+    # The number of characters before the start of `items` the engine may
+    # examine.
+    reach = 0
+    for op, av in items:
+        if op is sre_parse.AT:
+            reach = max(reach, 1)
+        for inner in _items(op, av):
+            behind = _behind(inner)
+            if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT) and av[0] == -1:
+                behind += _width(inner)
+            reach = max(reach, behind)
+    return reach
+
+
+def window(compiled):
+    """Return ``(behind, ahead)``: how many characters before the start of
+    a match of `compiled`, and from its start on, the `re` engine may
+    examine to find it. `ahead` is None if the pattern has no maximum
+    match length."""
+    items = sre_parse.parse(compiled.pattern, compiled.flags)
+    return max(_behind(items), 1), _ahead(items)
+
+
+class StreamMatch(Match):
+    """A match found by :func:`finditer_stream`. Its spans are offsets in
+    the whole stream, and `string` is the part of the stream starting at
+    offset `offset` it was found in."""
+
+    __slots__ = ('offset', )
+
+    def __init__(self, re, string, pos, endpos, spans, offset):
+        Match.__init__(self, re, string, pos, endpos, spans)
+        self.offset = offset
+
+    def _group(self, group, default=None):
+        start, end = self._spans[self._index(group)]
+        if start < 0:
+            return default
+        return self.string[start - self.offset:end - self.offset]
+
+    __getitem__ = _group
+
+
+def _stream_match(match, offset):
+    spans = [match.span(index) for index in range(match.re.groups + 1)]
+    spans = tuple((start + offset, end + offset) if start >= 0 else (start, end)
+                  for start, end in spans)
+    return StreamMatch(match.re, match.string, match.pos + offset,
+                       match.endpos + offset, spans, offset)
+
+
+def finditer_stream(compiled, fileobj, chunk_size=DEFAULT_CHUNK_SIZE,
+                    max_match=None):
+    """Yield the matches of `compiled` in `fileobj`, as
+    :meth:`re.finditer` would on its whole content, reading `chunk_size`
+    characters at a time.
+
+    :param compiled: the compiled pattern
+    :param fileobj: an object whose `read` returns text or bytes matching
+                    the type of the pattern
+    :param chunk_size: how many characters to read at a time
+    :param max_match: the number of characters a match, with the text its
+                      lookarounds examine, may span; required if the
+                      pattern has no maximum match length, longer matches
+                      may then be cut at a chunk boundary
+    """
+    behind, ahead = window(compiled)
+    if max_match is not None:
+        ahead = max_match if ahead is None else min(ahead, max_match)
+    if ahead is None:
+        raise ValueError('the pattern has no maximum match length, '
+                         'pass max_match')
+
+    buffer = fileobj.read(chunk_size)
+    eof = not buffer
+    offset = pos = 0
+    empty = None
+    while True:
+        # Matches starting after `last` may depend on text not read yet.
+        last = len(buffer) if eof else len(buffer) - ahead - 1
+        for match in compiled.finditer(buffer, pos):
+            start, end = match.span()
+            if start > last:
+                break
+            if start == end == empty:
+                # Found again after resuming at the same position.
+                continue
+            yield _stream_match(match, offset)
+            pos = end
+            empty = end if start == end else None
+        if eof:
+            return
+
+        pos = max(pos, last + 1)
+        keep = max(pos - behind, 0)
+        buffer = buffer[keep:]
+        offset += keep
+        pos -= keep
+        if empty is not None:
+            empty -= keep
+        chunk = fileobj.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+def scan_file(compiled, path):
+    """Yield ``(offset, match)`` for the matches of the bytes pattern
+    `compiled` in the file at `path`, searched in place in a read-only
+    memory map. The map is released once the matches referring to it
+    are."""
+    with open(path, 'rb') as fileobj:
+        try:
+            buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped.
+            buffer = b''
+    for match in compiled.finditer(buffer):
+        yield match.start(), match
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+srl.timeout
+~~~~~~~~~~~
+
+This module implements matching with a time limit. The `re` engine cannot
+be interrupted, so the matching methods of ``SRL(query, timeout=...)``, and
+those called through :meth:`SRL.call_with_timeout <srl.SRL.call_with_timeout>`,
+run in a worker process, which is killed if it does not answer in time::
+
+    >>> from srl import SRL
+    >>> srl = SRL('capture (letter once or more) once or more, must end',
+    ...           timeout=0.5)
+    >>> srl.match('abc').group()
+    'abc'
+    >>> srl.match('a' * 40 + '!')
+    Traceback (most recent call last):
+    ...
+    srl.errors.PregBacktrackLimitError: match took more than 0.5 seconds
+
+Idle workers are kept in a pool, and a killed worker is replaced right
+away; :func:`warm` starts workers ahead of the first call. A worker
+compiles each query when it first runs it, within the time limit, and
+keeps the :data:`MAX_QUERIES` it last ran compiled.
+
+The arguments, including a callable `repl` of `sub`, and the results are
+pickled to and from the worker. Matches are :class:`srl.match.Match`
+objects.
+
+:copyright: (c) 2016 by Simple Regex Language.
+:license: MIT, see LICENSE for more details.
+"""
+
+import multiprocessing
+import pickle
+import threading
+
+from .cache import LRUCache
+from .errors import SRLException, PregBacktrackLimitError
+from .match import Match
+from .parallel import _spans
+
+#: The methods run in a worker.
+METHODS = ('search', 'match', 'fullmatch', 'findall', 'finditer', 'sub',
+           'subn', 'split')
+
+#: The number of queries a worker keeps compiled.
+MAX_QUERIES = 128
+
+# Methods returning matches, rebuilt from their spans.
+_MATCHERS = ('search', 'match', 'fullmatch', 'finditer')
+
+_idle = []
+_lock = threading.Lock()
+
+
+def _state(match):
+    if match is not None:
+        return match.pos, match.endpos, _spans(match)
+
+
+def _serve(connection):
+    # The loop of a worker process: run the calls it is sent, one at a
+    # time, and send back ``(True, result)`` or ``(False, exception)``.
+    from .srl import SRL
+    queries = LRUCache(MAX_QUERIES)
+    while True:
+        try:
+            options, method, args, kwargs = connection.recv()
+        except EOFError:
+            return
+        try:
+            key = tuple(sorted(options.items()))
+            srl = queries.get(key)
+            if srl is None:
+                srl = SRL(**options)
+                queries.set(key, srl)
+            result = getattr(srl, method)(*args, **kwargs)
+            if method == 'finditer':
+                result = [_state(match) for match in result]
+            elif method in _MATCHERS:
+                result = _state(result)
+            connection.send((True, result))
+        except Exception as error:
+            try:
+                pickle.loads(pickle.dumps(error))
+            except Exception:
+                error = SRLException('%s in the worker process: %s' % (
+                    type(error).__name__, error))
+            connection.send((False, error))
+
+
+class _Worker(object):
+
+    def __init__(self):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_serve, args=(child, ))
+        self.process.daemon = True
+        self.process.start()
+        child.close()
+
+    def call(self, request, timeout):
+        self.connection.send(request)
+        if not self.connection.poll(timeout):
+            return None
+        return self.connection.recv()
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def _release(worker):
+    with _lock:
+        _idle.append(worker)
+
+
+def warm(workers=1):
+    """Start worker processes until `workers` of them are idle."""
+    with _lock:
+        missing = workers - len(_idle)
+    for _ in range(missing):
+        _release(_Worker())
+
+
+def shutdown():
+    """Stop the idle worker processes."""
+    with _lock:
+        workers = _idle[:]
+        del _idle[:]
+    for worker in workers:
+        worker.kill()
+
+
+def call(srl, method, args=(), kwargs=None, timeout=None):
+    """Return ``getattr(srl, method)(*args, **kwargs)``, run in a worker
+    process, or raise :class:`~srl.errors.PregBacktrackLimitError` if it
+    takes more than `timeout` seconds. None means no limit.
+
+    :param srl: the :class:`~srl.SRL` object
+    :param method: one of :data:`METHODS`
+    """
+    kwargs = kwargs or {}
+    with _lock:
+        worker = _idle.pop() if _idle else None
+    if worker is None:
+        worker = _Worker()
+    try:
+        answer = worker.call((srl._options(), method, args, kwargs), timeout)
+    except EOFError:
+        worker.kill()
+        raise SRLException('the worker process running %s exited' % method)
+    except BaseException:
+        # The worker may be halfway through a call.
+        worker.kill()
+        raise
+    if answer is None:
+        worker.kill()
+        _release(_Worker())
+        raise PregBacktrackLimitError('%s took more than %s seconds' % (method, timeout))
+    _release(worker)
+
+    success, result = answer
+    if not success:
+        raise result
+    if method not in _MATCHERS:
+        return result
+    string = args[0] if args else kwargs['string']
+    if method == 'finditer':
+        return iter([Match(srl.compiled, string, pos, endpos, spans)
+                     for pos, endpos, spans in result])
+    if result is not None:
+        pos, endpos, spans = result
+        return Match(srl.compiled, string, pos, endpos, spans)
+
+
+def wrap(srl, method, timeout):
+    """Return `method` of `srl` run by :func:`call`, taking a `timeout`
+    keyword argument which defaults to `timeout`."""
+    def bounded(*args, **kwargs):
+        seconds = kwargs.pop('timeout', timeout)
+        return call(srl, method, args, kwargs, seconds)
+    return bounded
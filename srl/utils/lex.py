@@ -721,9 +721,10 @@ class LexerReflect(object):
         for f in self.funcsym.values():
             f.sort(key=lambda x: x[1].__code__.co_firstlineno)
 
-        # Sort the strings by regular expression length
+        # Sort the strings by regular expression length, then by name, so
+        # that the order does not depend on the order of the module's dict
         for s in self.strsym.values():
-            s.sort(key=lambda x: len(x[1]), reverse=True)
+            s.sort(key=lambda x: (-len(x[1]), x[0]))
 
     # Validate all of the t_rules collected
     def validate_rules(self):
@@ -2968,7 +2968,8 @@ class ParserReflect(object):
                 sig.update(' '.join(self.tokens).encode('latin-1'))
             for f in self.pfuncs:
                 if f[3]:
-                    sig.update(f[3].encode('latin-1'))
+                    # Python 3.13 strips the indentation of docstrings
+                    sig.update(inspect.cleandoc(f[3]).encode('latin-1'))
         except (TypeError, ValueError):
             pass
 
@@ -4,6 +4,7 @@ import re
 from glob import glob
 from srl.builder import Builder
 from srl.srl import SRL
+from srl.errors import BuilderException
 
 def test_simple_phone_number_format():
     regex = Builder().literally('+').digit().between(1, 3) \
@@ -70,3 +71,44 @@ def test_laziness():
 def test_raw():
     assert Builder().literally('foo').raw('b[a-z]r').is_valid()
 
+
+def test_binary():
+    builder = Builder().literally(u'café').one_of('.$').letter().once_or_more()
+    assert builder.get(binary=True) == \
+        b'(?:' + re.escape(u'café'.encode('utf-8')) + b')[\\.\\$][a-z]+'
+    builder.raw(u'[\xe0-\xff]')
+    compiled = builder.compile(binary=True, encoding='latin-1').compiled
+    assert compiled.pattern == \
+        b'(?:' + re.escape(u'café'.encode('latin-1')) + b')[\\.\\$][a-z]+[\xe0-\xff]'
+    assert compiled.search(u'un café$abc\xe8'.encode('latin-1'))
+    try:
+        builder.get(binary=True)
+    except BuilderException:
+        pass
+    else:
+        assert False
+
+def test_format_group():
+    assert Builder(group='(?:%s)').digit().letter().get() == '(?:[0-9][a-z])'
+    assert Builder(group='(?<!%s)').digit().get() == '(?<![0-9])'
+    assert Builder(group='(?P<n>%s)').digit().get() == '(?P<n>[0-9])'
+    assert Builder(group='(%s)').digit().letter().get('|') == '([0-9]|[a-z])'
+    assert Builder().digit().letter().get('|') == '[0-9]|[a-z]'
+
+def test_rendering():
+    # Quantifiers render as the string builder rendered them.
+    assert str(SRL('letter at least 1 time')) == '[a-z]{1,}'
+    assert str(SRL('letter at least 0 times')) == '[a-z]{0,}'
+    assert str(SRL('letter between 0 and 1 times')) == '[a-z]{0,1}'
+    assert str(SRL('letter between 1 and 1 times')) == '[a-z]{1,1}'
+    assert str(SRL('letter once or more, letter optional')) == '[a-z]+[a-z]?'
+    # `until` leaves a quantifier before a closing parenthesis greedy.
+    assert str(SRL('capture (letter once or more, until "x")')) == '([a-z]+(?:x))'
+    assert str(SRL('capture (letter once or more) until "x"')) == '([a-z]+?)(?:x)'
+    # A lookbehind after a quantifier goes between it and its item.
+    assert str(SRL('letter twice, if already had "b"')) == '[a-z](?<=(?:b)){2}'
+    assert Builder().add_closure(Builder(group='(%s)'), lambda q: q.digit().letter(),
+                                 '|').get() == '([0-9]|[a-z])'
+    # These raised an IndexError or rendered an invalid expression.
+    assert str(SRL('until "m", letter')) == '(?:m)[a-z]'
+    assert str(SRL('any of (letter once or more, literally "x")')) == '(?:[a-z]+|(?:x))'
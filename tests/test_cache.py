@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+import srl
+from srl import SRL
+from srl.builder import Builder
+from srl.cache import LRUCache, normalize
+
+def test_normalize():
+    assert normalize(' digit ,  letter ') == 'digit letter'
+    assert normalize('literally "a ,  b",  digit') == 'literally "a ,  b" digit'
+    assert normalize('literally "a\\" ,b"') == 'literally "a\\" ,b"'
+
+def test_lru_cache_eviction():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 1, 1, 2)
+    cache.resize(1)
+    assert len(cache) == 1 and 'c' in cache
+    cache.resize(0)
+    cache.set('d', 4)
+    assert len(cache) == 0
+
+def test_srl_cache():
+    srl.purge()
+    first = SRL('digit exactly 3 times')
+    second = SRL('digit,  exactly 3 times')
+    assert first.compiled is second.compiled
+    info = srl.cache_info()
+    assert info.hits == 1 and info.misses == 1 and info.currsize == 1
+    assert SRL('digit', re.IGNORECASE).compiled is not SRL('digit').compiled
+    assert Builder.parse('digit', re.IGNORECASE).flags & re.IGNORECASE
+    srl.purge()
+    assert srl.cache_info().currsize == 0
+
+def test_set_cache_size():
+    srl.purge()
+    srl.set_cache_size(1)
+    try:
+        SRL('digit')
+        SRL('letter')
+        assert srl.cache_info().evictions == 1
+    finally:
+        srl.set_cache_size(512)
+        srl.purge()
+
+def test_cache_thread_safety():
+    cache = LRUCache(8)
+    def worker(n):
+        for i in range(1000):
+            cache.set((n, i % 16), i)
+            cache.get((n, (i + 1) % 16))
+    threads = [threading.Thread(target=worker, args=(n, )) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert info.currsize == 8
+    assert info.hits + info.misses == 8000
+
+def test_disk_cache():
+    import json
+    from srl import builder
+    from srl.cache import DiskCache
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'srl.json')
+    queries = ['capture (digit once or more) as "n", literally "ms"',
+               'any of (literally "a", letter) case insensitive',
+               'begin with literally "x" if followed by (literally "y")']
+    srl.purge()
+    srl.set_disk_cache(path)
+    try:
+        compiled = [SRL(query) for query in queries] + [SRL(u'literally "é"', binary=True)]
+        srl.save_disk_cache()
+        assert json.load(open(path))['version'] == DiskCache.version()
+
+        srl.purge()
+        srl.set_disk_cache(path)
+        def parse(*args):
+            raise AssertionError('parsed')
+        builder.parse, parse = parse, builder.parse
+        try:
+            warm = [SRL(query) for query in queries] + [SRL(u'literally "é"', binary=True)]
+            for before, after in zip(compiled, warm):
+                assert after.pattern == before.pattern and after.flags == before.flags
+                assert after.required_literals == before.required_literals
+            assert warm[0].search('took 12ms').group('n') == '12'
+            try:
+                SRL('digit')
+            except AssertionError:
+                pass
+            else:
+                assert False
+        finally:
+            builder.parse = parse
+    finally:
+        srl.set_disk_cache(None)
+        srl.purge()
+
+    other = DiskCache(path)
+    version = DiskCache.__dict__['version']
+    DiskCache.version = staticmethod(lambda: 'other')
+    try:
+        assert other.get((normalize(queries[0]), 0, False, None)) is None
+    finally:
+        DiskCache.version = version
+        shutil.rmtree(directory)
+
+def test_disk_cache_mode():
+    from srl.cache import DiskCache
+    if os.name != 'posix':
+        return
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'srl.json')
+    umask = os.umask(0o027)
+    try:
+        cache = DiskCache(path)
+        cache.set((normalize('digit'), 0, False, None), '[0-9]', 0, [])
+        cache.save()
+        assert os.stat(path).st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
+        shutil.rmtree(directory)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import random
+
+from srl import SRL
+from srl.dfa import DFA, SUPPORTED
+
+QUERIES = [
+    'digit once or more',
+    'capture (letter once or more) once or more, must end',
+    'begin with, letter once or more, must end',
+    'literally "ab" optional, letter twice',
+    'any of (literally "a", literally "ab", literally "abc") once or more',
+    'capture (any of (literally "a", literally "ab")) once or more, literally "c" optional',
+    'letter between 2 and 4 times, letter optional, all lazy',
+    'capture (digit) as "d", letter never or more, literally "b", all lazy',
+    'anything once or more, literally "b"',
+    'begin with, literally "a", multi line',
+    'literally "b", must end, multi line',
+    'literally "A" once or more, case insensitive',
+    'capture (letter optional), digit optional',
+    'capture (literally "a" optional, literally "b") once or more',
+    'new line optional, must end',
+    'capture (capture (literally "a") optional, capture (literally "b") as "x") once or more',
+    'capture (letter) between 1 and 3 times, capture (letter optional), all lazy',
+    'capture (letter twice) once or more, capture (letter)',
+]
+
+def _key(match):
+    return match and (match.span(), match.groups())
+
+def test_same_as_re():
+    generator = random.Random(0)
+    strings = [''.join(generator.choice('ab1c \nA') for _ in range(generator.randint(0, 10)))
+               for _ in range(100)]
+    for query in QUERIES:
+        srl = SRL(query, engine='dfa')
+        compiled = srl.compiled
+        # Python 2 has no `fullmatch`.
+        methods = [method for method in ('search', 'match', 'fullmatch')
+                   if hasattr(compiled, method)]
+        assert isinstance(srl.search.__self__, DFA) == SUPPORTED, query
+        for string in strings:
+            for method in methods:
+                for pos in (0, 1):
+                    assert _key(getattr(srl, method)(string, pos)) == \
+                        _key(getattr(compiled, method)(string, pos)), (query, string)
+            assert [_key(m) for m in srl.finditer(string, 0, len(string) - 1)] == \
+                [_key(m) for m in compiled.finditer(string, 0, len(string) - 1)]
+            assert srl.findall(string) == compiled.findall(string)
+            assert srl.sub(r'<\g<0>>', string, 2) == compiled.sub(r'<\g<0>>', string, 2)
+
+def test_linear():
+    if not SUPPORTED:
+        # `re` would run these in exponential time.
+        return
+    srl = SRL('capture (letter once or more) once or more, must end', engine='dfa')
+    assert srl.search('a' * 100000 + '!') is None
+    assert srl.search('a' * 100000).span() == (0, 100000)
+    # Groups are read without backtracking too.
+    srl = SRL('any of ((capture (letter once or more) once or more, literally "!"), '
+              '(letter once or more, literally "?"))', engine='dfa')
+    assert isinstance(srl.search.__self__, DFA)
+    match = srl.search('a' * 20000 + '?')
+    assert match.span() == (0, 20001) and match.groups() == (None, )
+    match = srl.search('a' * 20000 + '!')
+    assert match.span(1) == (0, 20000)
+
+def test_fallback():
+    for query in ('capture (letter optional) once or more',
+                  'letter, if followed by (digit)',
+                  'raw "(a)\\\\1"'):
+        srl = SRL(query, engine='dfa')
+        assert srl.search == srl.compiled.search
+    assert SRL('digit', engine='dfa', binary=True).search(b'a1').span() == (1, 2)
+
+def test_bounded_states():
+    srl = SRL('literally "a", any of (literally "a", literally "b") exactly 8 times',
+              engine='dfa')
+    if not SUPPORTED:
+        return
+    dfa = srl.search.__self__
+    dfa._forward.max_states = 20
+    string = ''.join(random.Random(1).choice('ab') for _ in range(2000))
+    assert [m.span() for m in srl.finditer(string)] == \
+        [m.span() for m in srl.compiled.finditer(string)]
+    assert len(dfa._forward.kernels) <= 20
+
+def test_pickle():
+    srl = pickle.loads(pickle.dumps(SRL('digit twice', engine='dfa')))
+    assert srl.search('a12').span() == (1, 3)
+    assert isinstance(srl.search.__self__, DFA) == SUPPORTED
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+import srl
+from srl import SRL
+from srl.builder import Builder
+from srl.parsers.parse import lex, parse
+
+QUERY = 'capture (digit once or more) as "n", literally "ms", must end'
+
+def test_lex_then_parse():
+    for backend in ('ply', 'descent'):
+        tokens = lex(QUERY, backend)
+        assert len(tokens) == 13
+        assert parse(QUERY, backend, tokens) == parse(QUERY, backend)
+
+def test_instrument():
+    srl.purge()
+    events = []
+    with srl.instrument(on_stage=events.append) as hook:
+        compiled = SRL(QUERY)
+        SRL(QUERY)
+        Builder.compile_query(QUERY, backend='descent', optimize=True)
+    assert [event.stage for event in events] == [
+        'cache', 'lex', 'parse', 'build', 'compile', 'cache',
+        'cache', 'lex', 'parse', 'build', 'compile']
+    assert all(event.query == QUERY and event.duration >= 0 for event in events)
+    assert [event.info['outcome'] for event in events if event.stage == 'cache'] == \
+        ['miss', 'hit', 'miss']
+    assert events[1].info == {'tokens': 13} and events[7].info == {'tokens': 13}
+    assert events[3].info == {'regex_length': len(compiled.pattern)}
+    assert events[9].info['regex_length'] < len(compiled.pattern)
+    hook.remove()
+    srl.purge()
+    SRL(QUERY)
+    assert len(events) == 11
+
+def test_instrument_disk_cache():
+    directory = tempfile.mkdtemp()
+    srl.purge()
+    srl.set_disk_cache(os.path.join(directory, 'cache.json'))
+    try:
+        SRL(QUERY)
+        srl.purge()
+        stages = []
+        hook = srl.instrument(lambda event: stages.append((event.stage, event.info)))
+        try:
+            SRL(QUERY)
+        finally:
+            hook.remove()
+        assert stages == [('cache', {'outcome': 'disk'}), ('compile', {})]
+    finally:
+        srl.set_disk_cache(None)
+        srl.purge()
+        shutil.rmtree(directory)
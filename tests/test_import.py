@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+def _loaded_modules(code):
+    out = subprocess.check_output([
+        sys.executable, '-c', code + '; import sys; print(" ".join(sys.modules))'])
+    return set(out.decode('ascii').split())
+
+def test_import_does_not_load_parser():
+    # Guards cold import time, see benchmarks/bench_import.py.
+    modules = _loaded_modules('import srl')
+    assert 'srl.builder' in modules
+    assert 'srl.utils.yacc' not in modules
+    assert 'srl.utils.lex' not in modules
+
+def test_parser_loaded_on_first_parse():
+    modules = _loaded_modules('import srl; srl.SRL("digit")')
+    assert 'srl.utils.yacc' in modules
+    assert 'srl.parsers.parsetab' in modules
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+import re
+import random
+
+from srl import SRL
+from srl.match import Match
+from srl.literal import LiteralPattern, Prefilter, extract, required
+
+def test_extract():
+    assert extract([('literally', ('ERROR', ))]) == ('ERROR', False, False)
+    assert extract([('begin_with', ()), ('literally', ('a', )), ('literally', ('b', )),
+                    ('must_end', ()), ('case_insensitive', ())]) == ('ab', True, True)
+    assert extract([('literally', ('say \\"hi\\"', ))]) == ('say "hi"', False, False)
+    assert extract([('literally', ('', ))]) is None
+    assert extract([('must_end', ()), ('literally', ('a', ))]) is None
+    assert extract([('literally', ('a', )), ('digit', ())]) is None
+    assert extract([('literally', ('a', )), ('once_or_more', ())]) is None
+
+def test_fast_path():
+    text = 'x' * LiteralPattern.min_length
+    assert isinstance(SRL('literally "error" case insensitive').search(text + 'ERROR'), Match)
+    assert isinstance(SRL('literally "ERROR", must end').search(text + 'ERROR'), Match)
+    assert isinstance(SRL('literally "y", must end, case insensitive').search(text + 'Y'), Match)
+    assert not isinstance(SRL('literally "error" case insensitive').search('ERROR'), Match)
+    assert not isinstance(SRL('literally "ERROR"').search(text + 'ERROR'), Match)
+    assert not isinstance(SRL('literally "a" once or more').search(text + 'a'), Match)
+    assert not isinstance(SRL('literally "a", must end, multi line').search(text + 'a'), Match)
+    assert not isinstance(SRL(u'literally "é" case insensitive').search(text + u'É'), Match)
+
+def test_match_object():
+    compiled = re.compile('(?:ERROR)', re.IGNORECASE)
+    match = Match(compiled, 'an ERROR here', 0, 13, ((3, 8), ))
+    assert match.group() == match.group(0) == match[0] == 'ERROR'
+    assert match.span() == (3, 8) and match.start() == 3 and match.end() == 8
+    assert match.groups() == () and match.groupdict() == {}
+    assert match.lastindex is None and match.lastgroup is None
+    assert match.string == 'an ERROR here' and match.pos == 0 and match.endpos == 13
+    assert match.re is compiled
+    assert match.expand(r'[\g<0>]') == '[ERROR]'
+    try:
+        match.group(1)
+    except IndexError:
+        pass
+    else:
+        assert False
+
+def test_match_groups():
+    compiled = re.compile('(?P<a>x)(y)?(z)')
+    match = Match(compiled, 'xz', 0, 2, ((0, 2), (0, 1), (-1, -1), (1, 2)))
+    expected = compiled.match('xz')
+    for group in (0, 1, 2, 3, 'a'):
+        assert match.group(group) == expected.group(group)
+        assert match.span(group) == expected.span(group)
+    assert match.group(1, 3) == expected.group(1, 3)
+    assert match.groups('-') == expected.groups('-')
+    assert match.groupdict() == expected.groupdict()
+    assert match.lastindex == expected.lastindex
+    # Python 2 raises for a group which did not participate.
+    assert _expand(match, r'\3\g<a>\2') == _expand(expected, r'\3\g<a>\2')
+    assert match.expand(r'\3\g<a>') == expected.expand(r'\3\g<a>')
+
+    compiled = re.compile(b'(?P<a>x)(\xff)(z)')
+    match = Match(compiled, b'x\xffz', 0, 3, ((0, 3), (0, 1), (1, 2), (2, 3)))
+    assert match.expand(b'\\3\\g<a>\\2') == b'zx\xff'
+
+    for pattern, string in (('((b*))', 'b'), ('((b*))', ''), ('(a)(b*)', 'a'),
+                            ('(a(b*))', 'a'), ('(?:(a)|(b))+', 'ab')):
+        compiled = re.compile(pattern)
+        expected = compiled.match(string)
+        spans = tuple(expected.span(index) for index in range(compiled.groups + 1))
+        match = Match(compiled, string, 0, len(string), spans)
+        assert match.lastindex == expected.lastindex, pattern
+
+def _expand(match, template):
+    try:
+        return match.expand(template)
+    except re.error:
+        return None
+
+def _same(expected, result):
+    if hasattr(result, 'span'):
+        return (expected is not None and result.span() == expected.span() and
+                result.group() == expected.group() and
+                (result.pos, result.endpos) == (expected.pos, expected.endpos))
+    return result == expected
+
+def test_same_as_re():
+    rand = random.Random(1)
+    alphabet = u'abAB\n\u0131\u0130\u017fKsSk\u212a'
+    patterns = []
+    for literal in ('a', 'ab', 'aa', 'Ab', '\n', 'sk', 'a\nb', 'Ki'):
+        for begin in (False, True):
+            for end in (False, True):
+                for flags in (0, re.IGNORECASE):
+                    compiled = re.compile('%s(?:%s)%s' % (
+                        '^' if begin else '', re.escape(literal), '$' if end else ''), flags)
+                    pattern = LiteralPattern(compiled, literal, begin, end)
+                    pattern.min_length = 0
+                    patterns.append(pattern)
+    for _ in range(300):
+        string = u''.join(rand.choice(alphabet) for _ in range(rand.randint(0, 8)))
+        pos = rand.randint(-2, 9)
+        endpos = rand.randint(-2, 10)
+        count = rand.randint(0, 2)
+        for pattern in patterns:
+            compiled = pattern.compiled
+            for method, args in (
+                    ('search', (string, )), ('search', (string, pos, endpos)),
+                    ('match', (string, )), ('match', (string, pos, endpos)),
+                    ('findall', (string, )), ('findall', (string, pos, endpos)),
+                    ('sub', ('<>', string)), ('sub', ('<>', string, count)),
+                    ('sub', (r'<\g<0>>', string)),
+                    ('sub', (lambda m: m.group().upper(), string, count)),
+                    ('split', (string, )), ('split', (string, count))):
+                expected = getattr(compiled, method)(*args)
+                result = getattr(pattern, method)(*args)
+                assert _same(expected, result), (compiled, method, args, expected, result)
+
+def test_required():
+    from srl.parsers.parse import parse
+    assert required(parse('digit once or more, literally "ms"')) == ('ms', )
+    assert required(parse('literally "a", literally "b" optional, literally "c"')) == ('a', 'c')
+    assert required(parse('literally "x", literally "ab" once or more, literally "d"')) == ('xab', 'd')
+    assert required(parse('literally "a", literally "b" exactly 1 time')) == ('ab', )
+    assert required(parse('literally "a" once or more optional')) == ()
+    assert required(parse('any of (literally "a", literally "b")')) == ()
+    assert required(parse('capture (literally "foo", digit, literally "bar")')) == ('foo', 'bar')
+    assert required(parse('literally "q" if followed by "zz"')) == ('zz', 'q')
+    assert SRL('letter, literally "ms"').required_literals == ('ms', )
+
+def test_required_raw():
+    from srl.parsers.parse import parse
+    string = 'x' * 2000 + 'bar'
+    for query in ('literally "foo" raw "|" literally "bar"',
+                  'literally "foo" raw "?" literally "bar"',
+                  'literally "foo" raw "{0}" literally "bar"',
+                  'raw "(?:" literally "foo" raw ")?" literally "bar"',
+                  'capture (literally "foo" raw "|" literally "bar")'):
+        assert required(parse(query)) == (), query
+        srl = SRL(query)
+        assert srl.required_literals == ()
+        assert srl.search(string).span() == srl.compiled.search(string).span()
+
+def _random_query(rand, depth=0):
+    items = []
+    for _ in range(rand.randint(1, 4)):
+        kind = rand.randint(0, 6 if depth < 2 else 2)
+        if kind == 0:
+            items.append('literally "%s"' % rand.choice(['a', 'b', 'ab', 'ba']))
+        elif kind == 1:
+            items.append('letter from a to b')
+        elif kind == 2:
+            items.append('any of (literally "a", literally "bb")')
+        elif kind == 3:
+            items.append('capture (%s)' % _random_query(rand, depth + 1))
+        elif kind == 4:
+            items.append('if followed by (%s)' % _random_query(rand, depth + 1))
+        elif kind == 5 and items:
+            items.append('if already had (literally "%s")' % rand.choice('ab'))
+        if rand.random() < 0.4 and not items[-1].startswith('if'):
+            items.append(rand.choice(['optional', 'once or more', 'never or more',
+                                      'exactly 2 times', 'once', 'between 0 and 2 times',
+                                      'between 1 and 1 times', 'at least 1 time']))
+    return ', '.join(items)
+
+def test_required_random():
+    rand = random.Random(2)
+    strings = [''.join(rand.choice('ab') for _ in range(rand.randint(0, 10)))
+               for _ in range(200)]
+    for _ in range(300):
+        try:
+            srl = SRL(_random_query(rand))
+        except Exception:
+            continue
+        prefilter = Prefilter(srl.compiled, srl.required_literals)
+        prefilter.min_length = 0
+        for string in strings:
+            match = srl.compiled.search(string)
+            assert (match and match.span()) == (prefilter.search(string) and
+                                                prefilter.search(string).span())
+            assert srl.compiled.findall(string) == prefilter.findall(string, 0)
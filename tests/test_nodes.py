@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from srl.builder import Builder
+from srl.nodes import (Literal, CharClass, Raw, Anchor, Repeat, Sequence,
+                       Group, Lookaround, Alternation)
+
+def test_render():
+    digit = CharClass('0-9')
+    assert Literal('a.b').render() == r'(?:a\.b)'
+    assert CharClass(r'\w', False).render() == r'\w'
+    assert Repeat(digit, 1).render() == '[0-9]+'
+    assert Repeat(digit, 0).render() == '[0-9]*'
+    assert Repeat(digit, 0, 1).render() == '[0-9]?'
+    assert Repeat(digit, 2, 2).render() == '[0-9]{2}'
+    assert Repeat(digit, 2).render() == '[0-9]{2,}'
+    assert Repeat(digit, 2, 3, False).render() == '[0-9]{2,3}?'
+    assert Group([digit], 'n').render() == '(?P<n>[0-9])'
+    assert Group([digit], capture=False).render() == '(?:[0-9])'
+    assert Lookaround([digit], ahead=False, negative=True).render() == '(?<![0-9])'
+    assert Alternation([digit, Raw('a|b')]).render() == '(?:[0-9]|a|b)'
+    assert Sequence([Anchor('^'), digit, Anchor('$')]).render() == '^[0-9]$'
+
+def test_structural_equality():
+    first = Group([Literal('a'), Repeat(CharClass('0-9'), 1)], 'n')
+    second = Group((Literal('a'), Repeat(CharClass('0-9'), 1)), 'n')
+    assert first == second and hash(first) == hash(second)
+    assert first != Group([Literal('a'), Repeat(CharClass('0-9'), 1)])
+    assert Sequence([Literal('a')]) != Group([Literal('a')])
+    assert len(set([first, second, Literal('a')])) == 2
+
+def test_lazy():
+    digit = CharClass('0-9')
+    assert Repeat(digit, 1).lazy() == Repeat(digit, 1, None, False)
+    assert Raw('a+').lazy() == Raw('a+?')
+    assert Raw('a').lazy() is None
+    assert Group([Repeat(digit, 1)]).lazy() == Group([Repeat(digit, 1, None, False)])
+    assert Group([Group([Repeat(digit, 1)])]).lazy() is None
+    assert Literal('a').lazy() is None
+
+def test_builder_tree():
+    builder = Builder().begin_with().capture(lambda q: q.digit().once_or_more(), 'n') \
+        .any_of(lambda q: q.literally('a').letter()).must_end()
+    assert builder.node() == Sequence([
+        Anchor('^'),
+        Group([Repeat(CharClass('0-9'), 1)], 'n'),
+        Alternation([Literal('a'), CharClass('a-z')]),
+        Anchor('$'),
+    ])
+    assert builder.get() == r'^(?P<n>[0-9]+)(?:(?:a)|[a-z])$'
+
+def test_builder_quantifiers():
+    assert Builder().digit().once_or_more().optional().get() == '[0-9]+?'
+    assert Builder().letter().until('x').get() == '[a-z](?:x)'
+    assert Builder().letter().once_or_more().until('x').get() == '[a-z]+?(?:x)'
+    assert Builder().until('x').once_or_more().get() == '(?:x)+'
+    assert Builder().letter().twice().if_already_had('b').get() == '[a-z](?<=(?:b)){2}'
+    assert Builder().letter().if_already_had('b').twice().get() == '(?<=(?:b))[a-z]{2}'
+    assert Builder(['a+']).lazy().get() == 'a+?'
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import re
+import random
+
+from srl import SRL
+from srl.builder import Builder
+from srl.optimizer import optimize
+from test_parse import corpus
+
+def test_optimize():
+    assert Builder().literally('a').literally('b').get(optimize=True) == 'ab'
+    assert Builder().digit().digit().digit().get(optimize=True) == '[0-9]{3}'
+    assert Builder().digit().digit().once_or_more().digit().optional().get(optimize=True) == '[0-9]{2,}'
+    assert Builder().literally('ab').twice().get(optimize=True) == '(?:ab){2}'
+    assert Builder().literally('a').twice().get(optimize=True) == 'a{2}'
+    assert Builder().any_of(lambda q: q.digit().literally('_').one_of('.-')).get(optimize=True) == \
+        r'[0-9%s\.\-]' % re.escape('_')
+    assert Builder().any_of(lambda q: q.literally('ab').digit()).get(optimize=True) == '(?:ab|[0-9])'
+    assert Builder().non_capture(lambda q: q.non_capture(lambda q: q.literally('x'))).get(optimize=True) == 'x'
+    assert Builder().capture(lambda q: q.literally('x')).once().get(optimize=True) == '(x)'
+    assert Builder().literally('a').raw('+').get(optimize=True) == '(?:a)+'
+    assert SRL('literally "a", literally "b"', optimize=True).pattern == 'ab'
+    assert SRL('literally "a", literally "b"').pattern == '(?:a)(?:b)'
+
+def test_raw_groups():
+    # A raw expression may contain an alternation, so it keeps its group.
+    for query, pattern in (('(raw "a|b") digit', '(?:a|b)[0-9]'),
+                           ('capture (digit) (raw "a|b")', '([0-9])(?:a|b)'),
+                           ('(raw "ab") twice', '(?:ab){2}'),
+                           ('literally "x", (raw "a|b") once', 'x(?:a|b)')):
+        optimized = SRL(query, optimize=True)
+        assert optimized.pattern == pattern, query
+        for string in ('a1', 'xb', '1b', 'abab', 'xa'):
+            assert _matches(optimized.compiled, string) == _matches(SRL(query).compiled, string)
+    assert Builder().raw('ab').twice().get(optimize=True) == Builder().raw('ab').twice().get()
+
+def _matches(compiled, string):
+    return [(match.span(), match.groups()) for match in compiled.finditer(string)]
+
+def test_equivalent_on_corpus():
+    # Every query of the corpus which compiles must match exactly like its
+    # optimized version.
+    rand = random.Random(4)
+    alphabet = 'abcfmx3459AB_ "\n\t.-%+@'
+    strings = [''.join(rand.choice(alphabet) for _ in range(rand.randint(0, 12)))
+               for _ in range(100)]
+    checked = 0
+    # Raw expressions below a quantifier or an alternation, and empty
+    # literals, keep their groups.
+    queries = ['literally "x", any of (raw "a|b")',
+               'literally "x", (raw "ab|cd", optional)',
+               'digit, (raw "a|b" once)',
+               'literally "ab", literally "" once or more',
+               'literally "" optional']
+    for query in queries + list(corpus()):
+        try:
+            plain = SRL(query)
+        except Exception:
+            continue
+        optimized = SRL(query, optimize=True)
+        assert optimized.groupindex == plain.groupindex
+        assert optimized.groups == plain.groups
+        for string in strings:
+            assert _matches(plain.compiled, string) == _matches(optimized.compiled, string), \
+                (query, plain.pattern, optimized.pattern, string)
+        checked += 1
+    assert checked > 500
+
+def _any_of(*texts):
+    def conditions(query):
+        for text in texts:
+            query.literally(text)
+        return query
+    return Builder().any_of(conditions)
+
+def test_factor_literals():
+    assert _any_of('GET', 'POST', 'PUT', 'PATCH').get(optimize=True) == '(?:GET|P(?:OST|UT|ATCH))'
+    assert _any_of('abc', 'ab', 'a').get(optimize=True) == 'a(?:bc?)?'
+    assert _any_of('a', 'ab', 'abc').get(optimize=True) == 'a(?:bc??)??'
+    assert _any_of('foo', 'foo', 'fob').get(optimize=True) == 'fo[ob]'
+    assert _any_of('ab', 'A', 'ac').get(optimize=True) == '(?:ab|A|ac)'
+    assert _any_of('ab', '', 'ac').get(optimize=True) == '(?:ab||ac)'
+    assert _any_of('ab', 'ac').once_or_more().get(optimize=True) == '(?:a[bc])+'
+
+def test_factor_equivalent():
+    rand = random.Random(5)
+    strings = [''.join(rand.choice('abAB') for _ in range(rand.randint(0, 8)))
+               for _ in range(100)]
+    for _ in range(300):
+        texts = [''.join(rand.choice('abAB') for _ in range(rand.randint(0, 3)))
+                 for _ in range(rand.randint(1, 6))]
+        builder = _any_of(*texts).literally(rand.choice(['', 'a', 'b']))
+        for flags in (0, re.IGNORECASE):
+            plain = re.compile(builder.get(), flags)
+            optimized = re.compile(builder.get(optimize=True), flags)
+            for string in strings:
+                assert _matches(plain, string) == _matches(optimized, string), \
+                    (plain.pattern, optimized.pattern, string)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+
+from srl import SRL
+
+RECORDS = ['id=%d, took %dms' % (index, index % 7) if index % 3 else 'none'
+           for index in range(2500)]
+
+def _upper(match):
+    return match.group().upper()
+
+def test_map_search():
+    srl = SRL('capture (digit once or more) as "ms", literally "ms"')
+    found = list(srl.map_search(RECORDS, workers=2, chunksize=100))
+    assert len(found) == len(RECORDS)
+    for record, match in zip(RECORDS, found):
+        expected = srl.search(record)
+        assert (match and (match.span(), match.groupdict(), match.string)) == \
+            (expected and (expected.span(), expected.groupdict(), record))
+    assert list(srl.map_search(RECORDS[:5], workers=1))[1].group('ms') == '1'
+
+def test_map_findall_sub():
+    srl = SRL('digit once or more')
+    assert list(srl.map_findall(RECORDS, workers=3, chunksize=7)) == \
+        [srl.findall(record) for record in RECORDS]
+    assert list(srl.map_sub('#', RECORDS, workers=2)) == \
+        [srl.sub('#', record) for record in RECORDS]
+    srl = SRL('literally "none"')
+    assert list(srl.map_sub(_upper, RECORDS[:4], workers=2)) == \
+        ['NONE', RECORDS[1], RECORDS[2], 'NONE']
+    assert list(srl.map_search([], workers=2)) == []
+
+def test_map_streams():
+    read = []
+    def records():
+        for index in range(100000):
+            read.append(index)
+            yield str(index)
+    results = SRL('digit').map_search(records(), workers=2, chunksize=10)
+    assert next(results).group() == '0'
+    # At most two chunks per process, and the one being filled, were read.
+    assert len(read) <= 10 * (2 * 2 + 1)
+    results.close()
+
+def test_map_binary():
+    srl = SRL('literally "ms"', binary=True)
+    records = [record.encode('ascii') for record in RECORDS]
+    assert [m and m.span() for m in srl.map_search(records, workers=2)] == \
+        [m and m.span() for m in map(srl.search, records)]
+
+def _write(path, data):
+    with open(path, 'wb') as fileobj:
+        fileobj.write(data)
+
+def test_grep():
+    import re
+    from srl.parallel import grep
+    lines = [(u'%d café ERROR %s' % (index, 'x' * (index % 50)) if index % 4 == 0
+              else u'%d ok' % index) for index in range(3000)]
+    data = u'\n'.join(lines).encode('utf-8')
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'app.log')
+        _write(path, data)
+        srl = SRL(u'literally "é ERROR", anything never or more, must end', binary=True)
+        found = list(grep(srl, path, workers=2, range_size=1000))
+        expected = [line.encode('utf-8') for line in lines if re.search(u'é ERROR.*$', line)]
+        assert [line for _, line in found] == expected
+        assert all(data[offset:offset + len(line)] == line for offset, line in found)
+        assert list(grep(SRL('begin with literally "2"', binary=True), path, 2))[0] == (
+            data.index(b'\n2 ok') + 1, b'2 ok')
+    finally:
+        shutil.rmtree(directory)
+
+def test_grep_lines():
+    import re
+    from srl.parallel import grep
+    data = b'a\nb\n\nc\n\nab b\nba\n'
+    fd, path = tempfile.mkstemp()
+    try:
+        for content in (data, data.rstrip(b'\n'), b'\n'):
+            with os.fdopen(os.open(path, os.O_WRONLY | os.O_TRUNC), 'wb') as fileobj:
+                fileobj.write(content)
+            for query in ('begin with must end', 'begin with, literally "b"',
+                          'literally "b", must end', 'letter'):
+                srl = SRL(query, binary=True)
+                lines = content.split(b'\n')
+                if content.endswith(b'\n'):
+                    lines.pop()
+                expected = []
+                offset = 0
+                for line in lines:
+                    if re.search(srl.pattern, line):
+                        expected.append((offset, line))
+                    offset += len(line) + 1
+                for range_size in (1, 2, 3, 5, 1000):
+                    assert list(grep(srl, path, 2, range_size)) == expected, (
+                        content, query, range_size)
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+def test_grep_command():
+    import io
+    import sys
+    from srl.__main__ import main
+    directory = tempfile.mkdtemp()
+    stdout = sys.stdout
+    try:
+        path = os.path.join(directory, 'app.log')
+        _write(path, b'INFO ok\nERROR disk\n\nERROR net ERROR')
+        sys.stdout = out = io.BytesIO()
+        assert main(['grep', '-j', '2', '-b', 'literally "ERROR"', path]) == 0
+        assert main(['grep', 'literally "WARN"', path]) == 1
+    finally:
+        sys.stdout = stdout
+        shutil.rmtree(directory)
+    assert out.getvalue() == b'8:ERROR disk\n20:ERROR net ERROR\n'
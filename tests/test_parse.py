@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import io
+import random
+import re
+from glob import glob
+
+from srl.parsers import lextab, parsetab
+from srl.parsers.parse import parse, tables_outdated, SRLSyntaxError
+
+FRAGMENTS = [
+    'literally "a"', 'literally "b\\"c"', 'one of "abc"', 'letter', 'letter from a to f',
+    'uppercase letter', 'uppercase letter from A to C', 'any character', 'no character',
+    'digit', 'digit from 3 to 5', 'anything', 'new line', 'whitespace', 'no whitespace',
+    'tab', 'raw "[a-z]"', 'capture "x"', 'capture (digit once) as "n"', 'any of (digit, letter)',
+    'either of ("a", "b")', 'until "m"', '"str"', '(letter twice)',
+    'exactly 3 times', 'once', 'twice', 'between 1 and 2 times', 'between 1 and 2', 'optional',
+    'once or more', 'never or more', 'at least 2 times',
+    'case insensitive', 'multi line', 'all lazy', 'begin with', 'starts with', 'must end',
+    'if followed by "a"', 'if not followed by (digit)', 'if already had "b"',
+    'if not already had (letter)',
+    'digit from \u0663 to 5', 'letter from \u00b2 to b', 'digit \n exactly 2 times ,',
+    # Malformed pieces.
+    '(', ')', 'x', '3', 'of', 'letter from 1 to 2', 'once or', 'capture', 'if not', 'as "n"',
+]
+
+def corpus():
+    queries = []
+    with io.open('specification.md', encoding='utf-8') as f:
+        queries.extend(re.findall(r"SRL\('(.*)'\)", f.read()))
+    with io.open('tests/test_srl.py', encoding='utf-8') as f:
+        queries.extend(re.findall(r"SRL\('(.*?)'\)", f.read()))
+    for filename in glob('tests/rules/*.rule'):
+        with io.open(filename, encoding='utf-8') as f:
+            queries.extend(line[5:] for line in f.read().splitlines() if line.startswith('srl: '))
+    rnd = random.Random(1)
+    for _ in range(3000):
+        queries.append(', '.join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(1, 6))))
+    return queries
+
+def _result(string, backend):
+    try:
+        return parse(string, backend)
+    except SRLSyntaxError:
+        return SRLSyntaxError
+
+def test_shipped_tables_are_current():
+    # Run `python setup.py build_tables` when this fails.
+    assert not tables_outdated()
+    assert parsetab._lr_method == 'LALR'
+    assert lextab._lexstatere
+
+def test_parse():
+    assert parse('digit exactly 3 times') == [('digit', (0, 9)), ('exactly', (3, ))]
+    assert parse('capture (letter) as "a"') == [
+        ('capture', (('lambda', [('letter', ('a', 'z'))]), 'a'))]
+
+def test_descent_matches_ply():
+    accepted = 0
+    for query in corpus():
+        expected = _result(query, 'ply')
+        assert _result(query, 'descent') == expected, query
+        accepted += expected is not SRLSyntaxError
+    assert accepted > 500
+
+def test_descent_rejects_like_ply():
+    for query in ('', 'once', 'digit must end if followed by "a"', 'digit if followed by "a" if followed by "b"',
+                  '()', 'capture (digit', 'digit )'):
+        assert _result(query, 'ply') is SRLSyntaxError
+        assert _result(query, 'descent') is SRLSyntaxError, query
+
+def test_unknown_backend():
+    try:
+        parse('digit', 'lalr')
+    except ValueError:
+        pass
+    else:
+        assert False
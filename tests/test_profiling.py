@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from srl import SRL, profiling
+
+def _stats(query):
+    return [stats for stats in profiling.report() if stats.query == query][0]
+
+def test_profile():
+    profiling.reset()
+    digits = SRL('digit once or more', profile=True)
+    letters = SRL('letter once or more', lazy=True, profile=True)
+    assert digits.search('ab12').group() == '12'
+    assert digits.match('ab') is None
+    assert digits.sub('#', 'a1b22') == 'a#b#'
+    assert [m.group() for m in digits.finditer('1 22')] == ['1', '22']
+    assert letters.findall('ab1' * 1000) == ['ab'] * 1000
+    SRL('digit once or more').search('1')
+    report = profiling.report()
+    assert sorted(stats.query for stats in report) == ['digit once or more', 'letter once or more']
+    stats = _stats('digit once or more')
+    assert stats.calls == 4 and stats.size == 4 + 2 + 5 + 4
+    assert stats.methods == {'search': 1, 'match': 1, 'sub': 1, 'finditer': 1}
+    assert 0 < stats.worst <= stats.total and stats.mean == stats.total / 4
+    assert report[0].total >= report[1].total
+    copy = pickle.loads(pickle.dumps(digits))
+    copy.search('3')
+    assert _stats('digit once or more').calls == 5
+    profiling.reset()
+    assert profiling.report() == []
+
+def test_report_order():
+    profiler = profiling.Profiler()
+    profiler.record('a', 'search', 1, 0.5)
+    profiler.record('b', 'match', 1, 0.75)
+    profiler.record('a', 'search', 1, 0.5)
+    assert [stats.query for stats in profiler.report()] == ['a', 'b']
+    assert profiler.report()[0].worst == 0.5 and profiler.report()[0].mean == 0.5
+
+def test_finditer():
+    import time
+    profiling.reset()
+    srl = SRL('digit', profile=True)
+    try:
+        srl.finditer('1', unknown=True)
+    except TypeError:
+        pass
+    else:
+        assert False
+    iterator = srl.finditer('1 2 3')
+    # The iterator counts before it is exhausted, without the time
+    # spent between its steps.
+    assert _stats('digit').calls == 2 and _stats('digit').methods == {'finditer': 2}
+    assert next(iterator).group() == '1'
+    time.sleep(0.1)
+    assert next(iterator).group() == '2'
+    assert _stats('digit').total < 0.1
+    assert [m.group() for m in iterator] == ['3']
+    assert _stats('digit').size == 1 + 5
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+from srl.parsers.parse import parse
+from srl.redos import analyze, analyze_node
+from srl.nodes import CharClass, Repeat, Group
+
+# Known-bad queries and the rules they break.
+BAD = [
+    ('capture (letter once or more) once or more', ['nested']),
+    ('capture (digit never or more) never or more', ['nested']),
+    ('capture (anything once or more, literally ",") once or more', ['nested']),
+    ('capture (letter once or more, whitespace optional) once or more', ['nested']),
+    ('capture (capture (any character at least 2 times) optional) once or more',
+     ['nested']),
+    ('capture (any of (digit, letter, literally "1")) once or more', ['alternation']),
+    ('capture (any of (literally "ab", literally "ab")) never or more', ['alternation']),
+    ('capture (either of (any character, digit)) at least 1 time', ['alternation']),
+    ('capture (any of (literally "a", literally "aa")) once or more, must end',
+     ['alternation']),
+    ('capture (any of (literally "ab", literally "a", literally "b")) once or more',
+     ['alternation']),
+    ('capture (literally "a" optional, literally "a") once or more', ['nested']),
+    ('digit once or more, digit never or more', ['adjacent']),
+    ('anything never or more, anything never or more', ['adjacent']),
+    ('letter once or more, literally "-" optional, any character once or more',
+     ['adjacent']),
+    ('capture (letter once or more) exactly 2 times', ['adjacent']),
+]
+
+SAFE = [
+    'digit once or more',
+    'digit once or more, digit',
+    'begin with, letter once or more, must end',
+    'capture (digit once or more, literally ",") once or more',
+    'capture (letter once or more, literally ";") once or more',
+    'capture (any of (literally "ab", literally "ac")) once or more',
+    'anything never or more, literally "x", anything never or more',
+    'literally "x" never or more',
+    'capture (letter once or more) if followed by (digit once or more)',
+]
+
+def test_known_bad():
+    for query, rules in BAD:
+        analysis = analyze(query)
+        assert analysis.rules == rules, query
+        assert analysis.score > 0
+
+def test_safe():
+    for query in SAFE:
+        assert analyze(query).findings == [], query
+
+def test_analyze():
+    query = 'capture (letter once or more) once or more'
+    assert analyze(parse(query)).score == analyze(query).score == 10
+    assert analyze('digit once or more, digit once or more').score == 1
+    # Case insensitive alternatives overlap.
+    query = 'capture (any of (literally "a", literally "A")) once or more'
+    assert analyze(query).findings == []
+    assert analyze(query + ', case insensitive').rules == ['alternation']
+    assert analyze(query, re.IGNORECASE).rules == ['alternation']
+    node = Repeat(Group([Repeat(CharClass(r'\w', False), 1)], capture=False), 0)
+    assert analyze_node(node).findings[0].regex == r'\w+'
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import re
+import sys
+
 from srl.srl import SRL
 
 def test_parse():
@@ -43,3 +46,105 @@ def test_parse():
     assert SRL('begin with must end').match('')
     assert SRL('letter case insensitive').match('A')
     assert SRL('capture (letter once or more) all lazy').match('a')
+
+def test_flags():
+    import re
+    assert SRL('letter case insensitive').flags & re.IGNORECASE
+    assert SRL('letter', re.MULTILINE).flags & re.MULTILINE
+
+def test_binary():
+    srl = SRL(u'capture (literally "café"), one of "$.", raw "[0-9]+", case insensitive', binary=True)
+    assert srl.pattern == b'((?:' + re.escape(u'café'.encode('utf-8')) + b'))[\\$\\.][0-9]+'
+    assert SRL(u'literally "café", digit', binary=True).required_literals == \
+        (u'café'.encode('utf-8'), )
+    # Python 2 re takes buffers instead of memoryviews.
+    view = memoryview if sys.version_info[0] > 2 else buffer
+    payload = u'paid in CAFé$42'.encode('utf-8')
+    assert srl.search(payload).group(1) == u'CAFé'.encode('utf-8')
+    assert srl.search(view(payload)).span() == (8, 16)
+    assert srl.findall(bytearray(payload)) == [u'CAFé'.encode('utf-8')]
+    padding = b'x' * 2048
+    assert SRL('literally "ms"', binary=True).search(view(padding + b'12ms')).start() == 2050
+    assert SRL('literally "ms"', binary=True).findall(padding) == []
+    assert SRL(u'literally "é"', binary=True, encoding='latin-1').search(b'\xe9')
+
+def _findall(srl, string):
+    return srl.findall(string)
+
+def test_pickle():
+    import copy
+    import pickle
+    import multiprocessing
+    from functools import partial
+    srl = SRL(u'capture (digit once or more), literally "ms"', optimize=True)
+    for copied in (pickle.loads(pickle.dumps(srl, 2)), copy.copy(srl), copy.deepcopy(srl)):
+        assert copied.pattern == srl.pattern == '([0-9]+)ms'
+        assert copied.required_literals == ('ms', )
+        assert copied.search('took 12ms').group(1) == '12'
+    assert len(pickle.dumps(srl, 2)) < 200
+    binary = pickle.loads(pickle.dumps(SRL(u'literally "é"', binary=True, encoding='latin-1')))
+    assert binary.pattern == b'(?:' + re.escape(b'\xe9') + b')'
+    pool = multiprocessing.Pool(2)
+    try:
+        assert pool.map(partial(_findall, srl), ['1ms', '2ms 3ms', '']) == [['1'], ['2', '3'], []]
+    finally:
+        pool.close()
+        pool.join()
+
+def test_lazy():
+    import threading
+    import time
+    from srl.builder import Builder
+    srl = SRL('not a query', lazy=True)
+    assert 'compiled' not in srl.__dict__
+    try:
+        srl.search('x')
+    except Exception:
+        pass
+    else:
+        assert False
+
+    calls = []
+    compile_query = Builder.compile_query
+    def slow_compile_query(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)
+        return compile_query(*args, **kwargs)
+    original = Builder.__dict__['compile_query']
+    Builder.compile_query = staticmethod(slow_compile_query)
+    try:
+        srl = SRL('digit once or more, literally "ms"', lazy=True)
+        assert calls == []
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(srl.search('in 12ms').group()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ['12ms'] * 8 and len(calls) == 1
+    finally:
+        Builder.compile_query = original
+    assert str(SRL('digit', lazy=True)) == '[0-9]'
+    assert SRL('literally "ms"', lazy=True).required_literals == ('ms', )
+
+class _Query(SRL):
+    pass
+
+def test_lazy_publish():
+    import pickle
+    from srl import dfa
+    seen = []
+    from_query = dfa.DFA.__dict__['from_query']
+    def spy(compiled, node):
+        seen.append(sorted(set(srl.__dict__) & set(['compiled', 'search', 'findall'])))
+        return dfa.DFA(compiled, node)
+    srl = SRL('digit once or more, literally "ms"', lazy=True, profile=True, engine='dfa')
+    dfa.DFA.from_query = staticmethod(spy)
+    try:
+        assert srl.search('x' * 2000 + '12ms').group() == '12ms'
+    finally:
+        dfa.DFA.from_query = from_query
+    # The prefilter's methods were not visible before the others.
+    assert seen == [[]]
+    assert type(pickle.loads(pickle.dumps(_Query('digit')))) is _Query
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+from srl import SRL, SRLSet
+
+RULES = [
+    ('ms', 'digit once or more, literally "ms"'),
+    ('error', 'literally "ERROR"'),
+    ('word', 'begin with capture (letter once or more) as "word"'),
+    ('login', 'literally "login", whitespace, capture (letter once or more)'),
+    ('failed', 'literally "failed" case insensitive'),
+    ('code', 'literally "code=", capture (digit exactly 3 times)'),
+]
+
+def test_search():
+    rules = SRLSet(RULES)
+    assert len(rules) == 6 and 'ms' in rules and list(rules)[0] == 'ms'
+    assert rules.search('login alice took 12ms') == ['ms', 'word', 'login']
+    assert rules.search('12 FAILED with code=500') == ['failed', 'code']
+    assert rules.search('') == []
+    captures = rules.captures('login alice code=404')
+    assert list(captures) == ['word', 'login', 'code']
+    assert captures['word'].group('word') == 'login'
+    assert captures['login'].group(1) == 'alice'
+    assert captures['code'].group(1) == '404'
+
+def test_add_remove():
+    rules = SRLSet({'a': 'literally "a"'})
+    assert rules.search('ab') == ['a']
+    rules.add('b', SRL('literally "b"'))
+    assert rules.search('ab') == ['a', 'b']
+    rules.add('a', 'literally "c"')
+    assert rules.search('ab') == ['b']
+    rules.remove('b')
+    assert rules.search('ab') == [] and rules.search('c') == ['a']
+    assert isinstance(rules['a'], SRL)
+
+def test_same_as_loop():
+    rand = random.Random(3)
+    words = ['user', 'login', 'use', 'disk', 'cpu', 'ms', 'ERROR', 'err']
+    rules = []
+    for i in range(100):
+        query = ['literally "%s"' % rand.choice(words)]
+        if rand.random() < 0.5:
+            query.append('whitespace, digit once or more')
+        if rand.random() < 0.3:
+            query.append('literally "%s" optional' % rand.choice(words))
+        if rand.random() < 0.2:
+            query.append('case insensitive')
+        rules.append((i, ', '.join(query)))
+    srls = [(id, SRL(query)) for id, query in rules]
+    rule_set = SRLSet(rules)
+    for _ in range(200):
+        line = ' '.join(rand.choice(words + ['1', '23', 'x']) for _ in range(8))
+        assert rule_set.search(line) == [id for id, srl in srls if srl.search(line)]
+
+def test_pickle():
+    import pickle
+    rules = SRLSet([('ms', 'digit once or more, literally "ms"'), ('error', 'literally "ERROR"')])
+    assert rules.search('ERROR after 12ms') == ['ms', 'error']
+    copied = pickle.loads(pickle.dumps(rules))
+    assert copied.search('ERROR after 12ms') == ['ms', 'error']
+    assert list(copied) == ['ms', 'error']
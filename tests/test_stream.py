@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import re
+import random
+import shutil
+import tempfile
+
+from srl import SRL
+from srl.stream import finditer_stream, window
+
+def _matches(matches):
+    return [(match.span(), match.group(), match.groups()) for match in matches]
+
+def test_window():
+    assert window(re.compile('a{2,5}')) == (1, 5)
+    assert window(re.compile('a(?=bc)')) == (1, 3)
+    assert window(re.compile('(?<=xyz)a$')) == (3, 3)
+    assert window(re.compile('a+'))[1] is None
+    assert window(re.compile(r'(a)\1'))[1] is None
+
+def test_same_as_finditer():
+    rand = random.Random(6)
+    patterns = ['ab', 'a{1,3}', 'a?', '(a)(b)?', r'\bab\b', 'b$', '(?m)^a', r'\Aa', 'ab(?=ba)',
+                '(?<=ba)b', '(?<!a)b', 'a|ab|aba', '(?:ab|b(?=aab))', 'x*', 'a+', '[ab]+?b']
+    for _ in range(100):
+        string = u''.join(rand.choice(u'ab\n') for _ in range(rand.randint(0, 40)))
+        for pattern in patterns:
+            compiled = re.compile(pattern)
+            expected = _matches(compiled.finditer(string))
+            for chunk_size in (1, 2, 3, 7, 50):
+                found = _matches(finditer_stream(compiled, io.StringIO(string),
+                                                 chunk_size, max_match=50))
+                assert found == expected, (pattern, string, chunk_size)
+
+def test_bytes_stream():
+    stream = io.BytesIO(b'x1 22 333 4444' * 100)
+    matches = list(finditer_stream(re.compile(b'[0-9]{3}'), stream, 16))
+    assert len(matches) == 200
+    assert matches[3].span() == (24, 27) and matches[1].group() == b'444'
+
+def test_srl_finditer_stream():
+    srl = SRL('capture (digit once or more) as "n", literally "ms"')
+    stream = io.StringIO(u'took 12ms then 3ms' * 1000)
+    matches = list(srl.finditer_stream(stream, chunk_size=5, max_match=10))
+    assert len(matches) == 2000
+    assert matches[-1].group('n') == '3' and matches[-1].end() == 18000
+    try:
+        list(srl.finditer_stream(io.StringIO(u'1ms')))
+    except ValueError:
+        pass
+    else:
+        assert False
+
+def _write(path, data):
+    with open(path, 'wb') as fileobj:
+        fileobj.write(data)
+
+def test_scan_file():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'log')
+        _write(path, u'GET /café 200\nPOST /x 404\n'.encode('utf-8') * 100)
+        srl = SRL(u'literally "/café", whitespace, digit exactly 3 times')
+        found = list(srl.scan_file(path))
+        assert len(found) == 100
+        offset, match = found[1]
+        assert offset == match.start() == 31 and match.group() == u'/café 200'.encode('utf-8')
+        assert list(srl.scan_file(path, encoding='latin-1')) == []
+        empty = os.path.join(directory, 'empty')
+        _write(empty, b'')
+        assert list(srl.scan_file(empty)) == []
+    finally:
+        shutil.rmtree(directory)
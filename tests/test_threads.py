@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import srl
+from srl import SRL
+from srl.parsers.parse import parse
+
+def _queries(count):
+    queries = []
+    for i in range(count):
+        queries.append(
+            'begin with capture (digit from %d to 9 exactly %d times) as "n%d", '
+            'any of (literally "q%d", letter from a to %s) once or more, '
+            'if followed by (whitespace never or more, literally "%d"), '
+            'anything never or more, must end'
+            % (i % 10, i % 7 + 1, i, i, 'abcdefghij'[i % 10], i))
+    return queries
+
+def _run_threads(target, chunks):
+    errors = []
+    def run(chunk):
+        try:
+            target(chunk)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=run, args=(chunk, )) for chunk in chunks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors[:3]
+
+def _check_parse(backend):
+    queries = _queries(2000)
+    expected = [parse(query, backend) for query in queries]
+    results = {}
+    def target(indices):
+        for i in indices:
+            results[i] = parse(queries[i], backend)
+    _run_threads(target, [range(n, len(queries), 16) for n in range(16)])
+    assert [results[i] for i in range(len(queries))] == expected
+
+def test_concurrent_parse_ply():
+    _check_parse('ply')
+
+def test_concurrent_parse_descent():
+    _check_parse('descent')
+
+def test_concurrent_srl():
+    queries = _queries(2000)
+    srl.purge()
+    expected = [SRL(query).pattern for query in queries]
+    srl.purge()
+    results = {}
+    def target(indices):
+        for i in indices:
+            results[i] = SRL(queries[i]).pattern
+    _run_threads(target, [range(n, len(queries), 16) for n in range(16)])
+    assert [results[i] for i in range(len(queries))] == expected
+    srl.purge()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+
+from srl import SRL, timeout
+from srl.errors import SRLException, PregBacktrackLimitError
+
+SLOW = 'capture (letter once or more) once or more, must end'
+
+def _double(match):
+    return match.group() * 2
+
+class _Unpicklable(Exception):
+
+    def __init__(self):
+        Exception.__init__(self, 'no pickle')
+        self.callback = lambda: None
+
+def _fail(match):
+    raise _Unpicklable()
+
+def test_timeout():
+    timeout.warm(2)
+    srl = SRL('capture (digit once or more) as "n"', timeout=5)
+    match = srl.search('ab12c', 1)
+    assert match.span() == (2, 4) and match.group('n') == '12' and match.pos == 1
+    assert srl.match('ab') is None
+    assert srl.findall('1 22') == ['1', '22']
+    assert [m.span() for m in srl.finditer('1 22')] == [(0, 1), (2, 4)]
+    assert srl.sub('#', 'a1b22') == 'a#b#'
+    assert srl.sub(_double, 'x1y2', count=1) == 'x11y2'
+    assert srl.split('a1b') == ['a', '1', 'b']
+    try:
+        srl.search(1)
+    except TypeError:
+        pass
+    else:
+        assert False
+    assert pickle.loads(pickle.dumps(srl)).search('3').group() == '3'
+
+def test_timeout_exceeded():
+    srl = SRL(SLOW, timeout=0.2)
+    try:
+        srl.match('a' * 40 + '!')
+    except PregBacktrackLimitError:
+        pass
+    else:
+        assert False
+    # A new worker took the place of the killed one.
+    assert srl.match('abc').group() == 'abc'
+    try:
+        srl.search('a' * 40 + '!', timeout=0.1)
+    except PregBacktrackLimitError:
+        pass
+    else:
+        assert False
+    timeout.shutdown()
+
+def test_call_with_timeout():
+    srl = SRL('digit')
+    assert srl.search == srl.compiled.search
+    assert srl.call_with_timeout('search', 5, 'a1').group() == '1'
+    assert srl.call_with_timeout('sub', None, '#', 'a1', count=1) == 'a#'
+    try:
+        SRL(SLOW).call_with_timeout('match', 0.1, 'a' * 40 + '!')
+    except PregBacktrackLimitError:
+        pass
+    else:
+        assert False
+    timeout.shutdown()
+
+def test_timeout_unpicklable():
+    srl = SRL('digit', timeout=5)
+    try:
+        srl.sub(_fail, 'a1')
+    except SRLException as error:
+        assert '_Unpicklable' in str(error)
+    else:
+        assert False
+    assert srl.sub('#', 'a1') == 'a#'
+    timeout.shutdown()